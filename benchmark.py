@@ -0,0 +1,115 @@
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Callable
+
+from bot.models.sqlite_backend import SQLiteBackend
+from bot.models.migration_runner import MigrationRunner
+from bot.models.active_claim import ActiveClaim
+from bot.models.checked_claim import CheckedClaim
+from bot.models.completed_claim import CompletedClaim
+from bot.models.claim_query import ClaimQuery
+from bot.models.team import Team
+from bot.models.user import User
+from bot.status import Status
+
+
+def measure(name: str, count: int, func: Callable[[], object], repeat: int = 5) -> None:
+    """Runs a function a few times and prints how many items per second its best run handled.
+
+    Args:
+        name (str): What's being measured
+        count (int): The amount of items that one run handles
+        func (Callable[[], object]): The function that's measured
+        repeat (int): The amount of runs
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    print(f"{name:<32} {best * 1000:8.1f} ms {count / best:12,.0f} rows/s")
+
+
+def fill(pool: SQLiteBackend, claims: int, techs: int = 50) -> None:
+    """Fills an empty database with a team, some users and checked claims.
+
+    Args:
+        pool (SQLiteBackend): The database
+        claims (int): The amount of CheckedClaims
+        techs (int): The amount of techs (each of them is also a lead)
+    """
+    Team(1, "#000000", "").add_to_database(pool)
+
+    users = [User(i, "Tech", str(i), 1) for i in range(1, techs + 1)]
+    for user in users:
+        user.add_to_database(pool)
+
+    statuses = list(Status)
+    start = datetime.now() - timedelta(days=60)
+    CheckedClaim.add_many(pool, (CheckedClaim(i, f"{i % 100000000:08d}", users[i % techs], users[(i * 7) % techs],
+                                              start + timedelta(minutes=i), start + timedelta(minutes=i + 5),
+                                              start + timedelta(minutes=i + 10), statuses[i % len(statuses)], None)
+                                 for i in range(1, claims + 1)))
+
+
+def executions(pool: SQLiteBackend) -> int:
+    """Returns how many statements have been executed on a database so far.
+
+    Args:
+        pool (SQLiteBackend): The database
+
+    Returns:
+        int - The amount of statements
+    """
+    return sum(statement[1] for statement in pool.stats.statements(limit=None))
+
+
+def main():
+    """Measures how fast CheckedClaims are read and decoded, on an embedded SQLite copy
+    of the schema so that no MySQL server is needed."""
+    parser = argparse.ArgumentParser(description="Benchmarks reading and decoding CheckedClaims.")
+    parser.add_argument("--claims", type=int, default=20000, help="The amount of claims in the database")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        pool = SQLiteBackend(os.path.join(directory, "benchmark.db"))
+        MigrationRunner(pool).apply()
+        fill(pool, args.claims)
+
+        def fetch() -> list[tuple]:
+            with pool.cursor() as cursor:
+                cursor.execute(CheckedClaim.SELECT)
+                return cursor.fetchall()
+
+        rows = fetch()
+        statuses = [row[5] for row in rows]
+        query = ClaimQuery(include_test_cases=True)
+
+        print(f"{len(rows)} claims")
+        measure("Status.from_str", len(statuses), lambda: [Status.from_str(status) for status in statuses])
+        measure("decode (CheckedClaim.decoder)", len(rows), lambda: list(map(CheckedClaim.decoder(), rows)))
+        measure("decode (CheckedClaim.from_row)", len(rows), lambda: [CheckedClaim.from_row(row) for row in rows])
+        measure("fetch (CheckedClaim.SELECT)", len(rows), fetch)
+        measure("fetch and decode (find)", len(rows), lambda: CheckedClaim.find(pool, query))
+
+        # Once the bot has started, /claim shouldn't query the database at all
+        ActiveClaim.registry.load(ActiveClaim.get_all(pool))
+        CompletedClaim.recent.load(CompletedClaim.get_claimed_since(pool, datetime.now() - CompletedClaim.recent.window))
+        User.from_id(pool, 1)
+
+        window = timedelta(minutes=15)
+        before = executions(pool)
+        measure("admission (memory)", 1000, lambda: [ActiveClaim.check_admission(pool, f"{i:08d}", 1, window)
+                                                     for i in range(1000)])
+        if executions(pool) != before:
+            raise SystemExit(f"ActiveClaim.check_admission ran {executions(pool) - before} statements with a loaded window")
+
+        pool.close()
+
+
+if __name__ == "__main__":
+    main()
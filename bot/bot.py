@@ -1,8 +1,7 @@
 from aiohttp import ClientSession
 import asyncio
 from discord.ext import commands, tasks
-from mysql.connector import MySQLConnection
-from typing import Any, OrderedDict
+from typing import Any, Optional, OrderedDict
 
 from bot.cogs.claim_command import ClaimCommand
 from bot.cogs.mycases_command import MyCasesCommand
@@ -19,6 +18,8 @@ from bot.cogs.award_command import AwardCommand
 from bot.cogs.evaldata_command import EvaldataCommand
 from bot.cogs.heatmap_command import HeatmapCommand
 from bot.cogs.geneval_command import GenEvalCommand
+from bot.cogs.rebuildstats_command import RebuildStatsCommand
+from bot.cogs.dbstats_command import DbStatsCommand
 
 from bot.views.affirm_view import AffirmView
 from bot.views.claim_view import ClaimView
@@ -32,10 +33,20 @@ from bot.views.kudos_view import KudosView
 from bot.views.force_complete_view import ForceCompleteView
 from bot.views.force_unclaim_view import ForceUnclaimView
 
+from bot.models.active_claim import ActiveClaim
+from bot.models.announcement import Announcement
+from bot.models.announcement_scheduler import AnnouncementScheduler
+from bot.models.async_database import AsyncDatabase
+from bot.models.checked_claim import CheckedClaim
+from bot.models.completed_claim import CompletedClaim
+from bot.models.storage_backend import StorageBackend
 from bot.models.outage import Outage
 from bot.models.team import Team
 
+from bot.request_labels import LabeledCommandTree
+
 from bot.helpers.other import *
+from bot.helpers.date_range import DateRange
 from bot.helpers.leaderboard_helpers import *
 
 
@@ -45,9 +56,9 @@ class Bot(commands.Bot):
     error_channel: int
     announcement_channel: int
     bot_channel: int
-    connection: MySQLConnection
+    db: AsyncDatabase
 
-    def __init__(self, config: dict[str, Any], connection: MySQLConnection):
+    def __init__(self, config: dict[str, Any], pool: StorageBackend, replica: Optional[StorageBackend] = None):
         """Initializes the bot (doesn't start it), and initializes some
         instance variables relating to file locations.
         """
@@ -58,16 +69,20 @@ class Bot(commands.Bot):
         self.log_channel = int(config["log_channel"])
         self.bot_channel = int(config["bot_channel"])
 
-        self.connection = connection
+        self.db = AsyncDatabase(pool, int(config.get("db_analytics_workers", 2)), replica)
+        User.cache.ttl = Team.cache.ttl = float(config.get("user_cache_ttl", 300))
+        StorageBackend.results.max_entries = int(config.get("query_cache_size", 256))
+        StorageBackend.stats.slow_threshold = float(config.get("slow_query_ms", 500)) / 1000
 
         self.embed_color = discord.Color.from_rgb(30, 31, 34)
 
         self.resend_outages = False
+        self.announcements = AnnouncementScheduler(self)
 
         # Initialize bot settings
         intents = discord.Intents.default()
         intents.message_content = True  
-        super().__init__(intents=intents, command_prefix='/')
+        super().__init__(intents=intents, command_prefix='/', tree_cls=LabeledCommandTree)
 
     @staticmethod
     def check_if_lead(user: discord.Member) -> bool:
@@ -113,7 +128,8 @@ class Bot(commands.Bot):
         """Checks every user and stores their role in the Users table.
         This happens once a day to ensure that the Users table is up-to-date.
         """
-        users = User.get_all(self.connection)
+        users = await self.db.run(User.get_all)
+        teams = await self.db.run(Team.get_all)
 
         cases_channel = await self.fetch_channel(self.cases_channel)
 
@@ -127,17 +143,18 @@ class Bot(commands.Bot):
                     role_ids.append(role.id)
 
                 # Go through each team and figure out what team the user is on
-                for team in Team.get_all(self.connection):
+                for team in teams:
                     if team.role_id == 0:
                         continue
                     if team.role_id in role_ids and team.role_id != user.team_id:
-                        user.add_team(self.connection, team)
+                        await self.db.run(user.add_team, team)
                         break
 
             except:
                 pass  # ignore exception, usually caused by a user leaving the server
 
-        result = LeaderboardResults(CheckedClaim.get_all_leaderboard(self.connection, datetime.datetime.now().year), TeamPoint.get_all(self.connection), datetime.datetime.now(), None)
+        now = datetime.datetime.now()
+        result = LeaderboardResults(await self.db.run_analytics(LeaderboardResults.count, now), await self.db.run(TeamPoint.get_all), now, None)
         await self.update_icon(result.ordered_team_month)
 
     async def update_icon(self, team_ranks: OrderedDict):
@@ -151,7 +168,7 @@ class Bot(commands.Bot):
             return
 
         first_place = list(team_ranks.keys())[0]
-        first_place_team = Team.from_role_id(self.connection, first_place)
+        first_place_team = await self.db.run(Team.from_role_id, first_place)
 
         new_icon = first_place_team.image_url
         ch = await self.fetch_channel(self.cases_channel)
@@ -166,6 +183,16 @@ class Bot(commands.Bot):
         # Update the guild icon with the data stored in img_data
         await ch.guild.edit(icon=img_data)
 
+    @tasks.loop(seconds=86400)  # repeat once a day
+    async def archive_claims_loop(self):
+        """Moves the checked claims from closed semesters to the archive so that
+        the interactive queries only search the current semester.
+        """
+        semester_start = DateRange.semester(datetime.datetime.now()).start
+        count = await self.db.run_maintenance(CheckedClaim.archive, semester_start)
+        if count != 0:
+            print(f"Archived {count} checked claims")
+
     @tasks.loop(seconds=5)  # repeat after every 5 seconds
     async def resend_outages_loop(self):
         """Resends all the outages to the #cases channel.
@@ -176,17 +203,9 @@ class Bot(commands.Bot):
             await Outage.resend(self)
             self.resend_outages = False
 
-    @tasks.loop(seconds=1800)  # repeat after every 30 minutes
-    async def reset_connection_loop(self):
-        """Resets the bots connection every 30 minutes.
-
-        Occasionally the bot will disconnect because of inactivity, pinging
-        the MySQL server will prevent this.
-        """
-        CheckedClaim.search(self.connection)
-
     async def setup_hook(self):
-        """Sets up the views so that they can be persistently loaded
+        """Sets up the views so that they can be persistently loaded, loads the active and recent claims
+        and schedules the active announcements
         """
         self.add_view(AffirmView(self))
         self.add_view(CheckView(self))
@@ -200,6 +219,38 @@ class Bot(commands.Bot):
         self.add_view(OutageView(self))
         self.add_view(ResolvePingView(self))
 
+        # Release the cases that were reserved by /claim but never got a claim message
+        try:
+            count = await self.db.run(ActiveClaim.remove_reservations)
+            if count != 0:
+                print(f"Removed {count} unfinished claim reservations")
+        except Exception as err:
+            print(f"Error: '{err}' while removing unfinished claim reservations")
+
+        # Keep the active claims in memory for /claim, the claim buttons and /mycases
+        try:
+            ActiveClaim.registry.load(await self.db.run(ActiveClaim.get_all))
+            print(f"Loaded {len(ActiveClaim.registry)} active claims")
+        except Exception as err:
+            # The lookups keep querying the database
+            print(f"Error: '{err}', active claims will be read from the database")
+
+        # Keep the claims of the last few minutes in memory for the re-claim warning of /claim
+        try:
+            since = datetime.datetime.now() - CompletedClaim.recent.window
+            CompletedClaim.recent.load(await self.db.run(CompletedClaim.get_claimed_since, since))
+            print(f"Loaded {len(CompletedClaim.recent)} recent claims")
+        except Exception as err:
+            # The warning keeps querying the database
+            print(f"Error: '{err}', recent claims will be read from the database")
+
+        # Expire the active announcements when their end time is reached
+        try:
+            self.announcements.load(await self.db.run(Announcement.get_all_active))
+            print(f"Scheduled {len(self.announcements)} announcements")
+        except Exception as err:
+            print(f"Error: '{err}', announcements won't expire until the bot is restarted")
+
     async def on_ready(self):
         """Loads all commands stored in the cogs folder and starts the bot.
         After this function is run, the bot is fully operational.
@@ -217,6 +268,8 @@ class Bot(commands.Bot):
         await self.add_cog(GenEvalCommand(self))
         await self.add_cog(EvaldataCommand(self))
         await self.add_cog(HeatmapCommand(self))
+        await self.add_cog(RebuildStatsCommand(self))
+        await self.add_cog(DbStatsCommand(self))
 
         await self.add_cog(LeaderboardCommand(self))
 
@@ -228,8 +281,9 @@ class Bot(commands.Bot):
         await self.add_cog(AnnouncementCommand(self))
 
         self.check_teams_loop.start()
+        self.archive_claims_loop.start()
         self.resend_outages_loop.start()
-        self.reset_connection_loop.start()
+        self.announcements.start()
     
         synced = await self.tree.sync()
         print("{} commands synced".format(len(synced)))
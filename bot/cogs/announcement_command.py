@@ -40,7 +40,7 @@ class AnnouncementCommand(commands.Cog):
             choices (Choice[str]): A list of choices for the type of announcement (Outage/Announcement).
         """
         # Check to see if user is in the list
-        u = User.from_id(self.bot.connection, interaction.user.id)
+        u = await self.bot.db.run(User.from_id, interaction.user.id)
         if u is None:
             msg = f"Please use the **/join** using this command."
             await interaction.response.send_message(content=msg, ephemeral=True, delete_after=300)
@@ -41,7 +41,7 @@ class AwardCommand(commands.Cog):
             await interaction.response.send_message(content=msg, ephemeral=True, delete_after=180)
             return
 
-        t = Team.from_role_id(self.bot.connection, team.id)
+        t = await self.bot.db.run(Team.from_role_id, team.id)
         if t is None:
             msg = f"<@{interaction.user.id}>, team not found!"
             await interaction.response.send_message(content=msg, ephemeral=True, delete_after=180)
@@ -53,7 +53,7 @@ class AwardCommand(commands.Cog):
             return
 
         tp = TeamPoint(t.role_id, points, description, interaction.created_at)
-        tp.add_to_database(self.bot.connection)
+        await self.bot.db.run(tp.add_to_database)
 
         ch = await interaction.guild.fetch_channel(self.bot.bot_channel)
         await ch.send(content=f"<@&{team.id}> has been awarded {points} point{'s' if points != 1 else ''} by <@!{interaction.user.id}>.\n> " + description, silent=True)
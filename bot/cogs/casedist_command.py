@@ -8,6 +8,7 @@ import matplotlib.pyplot as plt
 from matplotlib import ticker
 
 from bot.models.checked_claim import CheckedClaim
+from bot.models.claim_query import ClaimQuery
 
 # Use TYPE_CHECKING to avoid circular import from bot
 from typing import TYPE_CHECKING
@@ -45,15 +46,14 @@ class CaseDistCommand(commands.Cog):
             days.append(0)
 
         # Generate data
-        claims = CheckedClaim.search(self.bot.connection)
-        for claim in claims:
-            if claim.claim_time > start:
-                start_time = claim.claim_time.replace(hour=7, minute=0, second=0)
-                fixed_date = int(time.mktime(claim.claim_time.timetuple())) - int(time.mktime(start_time.timetuple()))
+        query = ClaimQuery().columns("claim_time").claimed_after(start)
+        for claim_time, in await self.bot.db.run_analytics(CheckedClaim.find_rows, query):
+            start_time = claim_time.replace(hour=7, minute=0, second=0)
+            fixed_date = int(time.mktime(claim_time.timetuple())) - int(time.mktime(start_time.timetuple()))
 
-                index = (fixed_date // 60) // 15
+            index = (fixed_date // 60) // 15
 
-                days[min(index, len(days) - 1)] += 1
+            days[min(index, len(days) - 1)] += 1
 
         # Create graph
         data_stream = io.BytesIO()
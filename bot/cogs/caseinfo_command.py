@@ -40,13 +40,13 @@ class CaseInfoCommand(commands.Cog):
 
         # Collect rows with this case
         rows: list[ActiveClaim | CompletedClaim | CheckedClaim] = []
-        for result in ActiveClaim.get_all_with_case_num(self.bot.connection, case_num):
+        for result in await self.bot.db.run(ActiveClaim.get_all_with_case_num, case_num):
             rows.append(result)
 
-        for result in CompletedClaim.get_all_with_case_num(self.bot.connection, case_num):
+        for result in await self.bot.db.run(CompletedClaim.get_all_with_case_num, case_num):
             rows.append(result)
 
-        for result in CheckedClaim.get_all_with_case_num(self.bot.connection, case_num):
+        for result in await self.bot.db.run(CheckedClaim.get_all_with_case_num, case_num, True):
             rows.append(result)
 
         # Sort data, create written descriptions
@@ -1,14 +1,10 @@
 from discord import app_commands
 from discord.ext import commands
 import discord
-from datetime import datetime
+from datetime import datetime, timedelta
 import traceback
 
-from bot.models.user import User
 from bot.models.active_claim import ActiveClaim
-from bot.models.announcement import Announcement
-from bot.models.completed_claim import CompletedClaim
-from bot.models.checked_claim import CheckedClaim
 
 from bot.views.claim_view import ClaimView
 
@@ -51,73 +47,67 @@ class ClaimCommand(commands.Cog):
             await interaction.response.send_message(content=msg, ephemeral=True, delete_after=10)
             return
 
-        # Check to see if the case claimed has already been claimed and is in progress.
-        case = ActiveClaim.from_case_num(self.bot.connection, case_num)
-        if case is not None:
+        # Check if the case is in progress, if the user has joined and if someone else claimed it
+        # in the last 15 minutes (from memory once the bot has started, otherwise in one query)
+        active, tech, recent_tech_id = await self.bot.db.run(ActiveClaim.check_admission, case_num, interaction.user.id,
+                                                             timedelta(minutes=15))
+        if active:
             msg = f"**{case_num}** has already been claimed!"
             await interaction.response.send_message(content=msg, ephemeral=True, delete_after=10)
             return
 
         # Check to see if user is in the list
-        u = User.from_id(self.bot.connection, interaction.user.id)
-        if u is None:
+        if tech is None:
             msg = f"Please use the **/join** command before claiming cases."
             await interaction.response.send_message(content=msg, ephemeral=True, delete_after=300)
             return
 
-        # Check if it's been claimed in the last 15 minutes
-        potential_cases: list[CompletedClaim, CheckedClaim] = CompletedClaim.get_all_with_case_num(self.bot.connection, case_num)
-        checked = CheckedClaim.get_all_with_case_num(self.bot.connection, case_num)
-        potential_cases.extend(checked)
-        recent = False
-        for case in potential_cases:
-            if case.tech.discord_id == interaction.user.id:
-                continue  # skip cases made by same user
-            delta = datetime.now() - case.claim_time
-            diff_mins = delta.total_seconds() / 60.0
-
-            if diff_mins <= 15:
-                # Send ephemeral
-                await interaction.response.send_message(content=f"<@!{interaction.user.id}> WARNING: **{case_num}** was claimed by <@!{case.tech.discord_id}> in the last 15 minutes.", ephemeral=True, delete_after=60)
-                recent = True
-                break
-
-        # User has claimed the case successfully, create the embed
-        message_embed = discord.Embed(
-            description=f"Is being worked on by <@{interaction.user.id}>",
-            colour=self.bot.embed_color,
-            timestamp=datetime.now()
-        )
-        message_embed.set_author(name=f"{case_num}", icon_url=f'{interaction.user.display_avatar}')
-        message_embed.set_footer(text="Claimed")
-
-        # Send message
-        if not recent:
-            # Respond to interaction
-            await interaction.response.send_message(embed=message_embed, view=ClaimView(self.bot))
-            response = await interaction.original_response()
-            message_id = response.id
-        else:
-            # Send new message
-            msg = await interaction.channel.send(embed=message_embed, view=ClaimView(self.bot))
-            message_id = msg.id
+        # Reserve the case before any message is sent, so that if someone else claims it at the
+        # same time the claim is rejected without a message having to be deleted again
+        case = ActiveClaim(interaction.id, case_num, tech, datetime.now())
+        if not await self.bot.db.run(case.reserve):
+            msg = f"**{case_num}** has already been claimed!"
+            await interaction.response.send_message(content=msg, ephemeral=True, delete_after=10)
+            return
 
+        # The reservation is released if anything fails before the claim message is attached to it
+        message = None
         try:
-            # Now that message has been sent, update the active cases
-            # with the new message id
-            tech = User.from_id(self.bot.connection, interaction.user.id)
-
-            case = ActiveClaim(message_id, case_num, tech, datetime.now())
-            case.add_to_database(self.bot.connection)
+            recent = recent_tech_id is not None
+            if recent:
+                # Send ephemeral
+                await interaction.response.send_message(content=f"<@!{interaction.user.id}> WARNING: **{case_num}** was claimed by <@!{recent_tech_id}> in the last 15 minutes.", ephemeral=True, delete_after=60)
+
+            # User has claimed the case successfully, create the embed
+            message_embed = discord.Embed(
+                description=f"Is being worked on by <@{interaction.user.id}>",
+                colour=self.bot.embed_color,
+                timestamp=datetime.now()
+            )
+            message_embed.set_author(name=f"{case_num}", icon_url=f'{interaction.user.display_avatar}')
+            message_embed.set_footer(text="Claimed")
+
+            # Send message
+            if not recent:
+                # Respond to interaction
+                await interaction.response.send_message(embed=message_embed, view=ClaimView(self.bot))
+                message = await interaction.original_response()
+            else:
+                # Send new message
+                message = await interaction.channel.send(embed=message_embed, view=ClaimView(self.bot))
+
+            # Now that message has been sent, update the active case with the new message id
+            await self.bot.db.run(case.attach_message, message.id)
         except:
-            # If there's an error in saving it to DB (another user claims case)
-            # delete message
-            ch = await self.bot.fetch_channel(self.bot.cases_channel)
-            message = await ch.fetch_message(message_id)
-            await message.delete()
+            await self.bot.db.run(case.remove_from_database)
+            if message is not None:
+                try:
+                    await message.delete()
+                except:
+                    pass  # message has already been deleted
+            raise
 
         self.bot.resend_outages = True
-        await Announcement.resend(self.bot)
 
     @claim.error
     async def claim_error(self, ctx: discord.Interaction, error):
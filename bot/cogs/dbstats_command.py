@@ -0,0 +1,77 @@
+from discord import app_commands
+from discord.ext import commands
+import discord
+import traceback
+from typing import Optional
+
+from bot.models.storage_backend import StorageBackend
+
+# Use TYPE_CHECKING to avoid circular import from bot
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..bot import Bot
+
+
+class DbStatsCommand(commands.Cog):
+    def __init__(self, bot: "Bot") -> None:
+        """Creates the /dbstats command using a cog.
+
+        Args:
+            bot (Bot): A reference to the original Bot instantiation.
+        """
+        self.bot = bot
+
+    @app_commands.command(description="Shows which database queries and interactions take the most time.")
+    @app_commands.describe(reset="(Optional) Whether or not the statistics are cleared afterward.")
+    @app_commands.default_permissions(mute_members=True)
+    async def dbstats(self, interaction: discord.Interaction, reset: Optional[bool]):
+        """Shows the slowest statements and the interactions that issue the most statements
+        since the bot started (or since the statistics were last reset).
+
+        Args:
+            interaction (discord.Interaction): Interaction that the slash command originated from.
+            reset (Optional[bool]): Whether or not the statistics are cleared afterward
+        """
+        # Check if user is a lead
+        if not self.bot.check_if_lead(interaction.user):
+            # Return error message if user is not Lead
+            msg = f"<@{interaction.user.id}>, you do not have permission!"
+            await interaction.response.send_message(content=msg, ephemeral=True, delete_after=180)
+            return
+
+        stats = StorageBackend.stats
+
+        statements = ""
+        for sql, count, total, p95, longest, rows in stats.statements(8):
+            if len(sql) > 80:
+                sql = sql[:77] + "..."
+            statements += (f"`{sql}`\n{count}x, {total * 1000 / count:.1f} ms avg, p95 <= {p95 * 1000:.0f} ms, "
+                           f"max {longest * 1000:.0f} ms, {rows / count:.1f} rows\n")
+
+        requests = ""
+        for label, count, average, most in stats.requests(10):
+            requests += f"**{label}**: {count}x, {average:.1f} queries avg, {most} max\n"
+
+        embed = discord.Embed(title="Database Statistics")
+        embed.colour = self.bot.embed_color
+        embed.description = f"Slow query threshold: {stats.slow_threshold * 1000:.0f} ms"
+        embed.add_field(name="Slowest Queries (total time)", value=statements[:1024] or "None", inline=False)
+        embed.add_field(name="Queries per Interaction", value=requests[:1024] or "None", inline=False)
+        embed.add_field(name="Query Cache", value=str(StorageBackend.results.stats()), inline=False)
+
+        if reset:
+            stats.reset()
+
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @dbstats.error
+    async def dbstats_error(self, ctx: discord.Interaction, error):
+        full_error = traceback.format_exc()
+
+        ch = await self.bot.fetch_channel(self.bot.error_channel)
+
+        msg = f"Error with **/dbstats** ran by <@!{ctx.user.id}>.\n```{full_error}```"
+        if len(msg) > 1993:
+            msg = msg[:1993] + "...```"
+        await ch.send(msg)
@@ -5,7 +5,10 @@ import csv
 import traceback
 from typing import Any, Optional
 
-from bot.models.checked_claim import CheckedClaim
+from bot.models.storage_backend import StorageBackend
+from bot.models.daily_claim_stats import DailyClaimStats
+from bot.models.user import User
+from bot.helpers.date_range import DateRange
 from bot.status import Status
 
 # Use TYPE_CHECKING to avoid circular import from bot
@@ -51,7 +54,7 @@ class EvaldataCommand(commands.Cog):
 
         await interaction.response.defer(ephemeral=True)  # Wait in case process takes a long time
 
-        data = self.get_data(month, year)
+        data = await self.bot.db.run_analytics(EvaldataCommand.get_data, month, year)
 
         if month is not None:
             tech_filename = f"techs{month}-{year}.csv"
@@ -77,12 +80,15 @@ class EvaldataCommand(commands.Cog):
 
         await interaction.followup.send(content=f"", files=[tech_data, lead_data])
 
-    def get_data(self, month: Optional[int], year: int) -> tuple[list[Any], list[Any]]:
+    @staticmethod
+    def get_data(pool: StorageBackend, month: Optional[int], year: int) -> tuple[list[Any], list[Any]]:
         """Collects all the data from every tech and every lead
         and compiles it into data that can easily be written to a
-        spreadsheet.
+        spreadsheet. The cases are counted using DailyClaimStats.
 
         Args:
+            pool (StorageBackend): The pool of connections to the database
+            month (Optional[int]): The month for which the data will be collected from (the whole year if None)
             year (int): The year for which the data will be collected from
 
         Returns:
@@ -90,9 +96,12 @@ class EvaldataCommand(commands.Cog):
             to be converted to a spreadsheet using writerow
         """
         if month is None:
-            all_cases = CheckedClaim.get_all_from_year(self.bot.connection, year)
+            date_range = DateRange.year(year)
         else:
-            all_cases = CheckedClaim.get_all_from_month(self.bot.connection, month, year)
+            date_range = DateRange.month(month, year)
+
+        counts = DailyClaimStats.count_by_pair(pool, date_range)
+        users = User.from_ids(pool, [row[0] for row in counts] + [row[1] for row in counts])
 
         # Tech data
         total_checked_cases = {}
@@ -117,43 +126,41 @@ class EvaldataCommand(commands.Cog):
 
         techs = {}
         leads = {}
-        for case in all_cases:
-            total_hd_cases += 1
-            techs[case.tech.full_name] = case.tech.discord_id
-            leads[case.lead.full_name] = case.lead.discord_id
+        for tech_id, lead_id, status, claims, completion_seconds, check_seconds in counts:
+            # Skip users that are no longer in the Users table
+            if tech_id not in users or lead_id not in users:
+                continue
+
+            total_hd_cases += claims
+            techs[users[tech_id].full_name] = tech_id
+            leads[users[lead_id].full_name] = lead_id
             # Initialize tech data
             for category in [total_checked_cases, total_done_cases, total_pinged_cases, total_resolved_cases, total_kudos_cases, hd_case_percent, average_completion_time]:
-                category.setdefault(case.tech.discord_id, 0)
+                category.setdefault(tech_id, 0)
             # Initialize lead data
             for category in [total_checked_claims, total_done_claims, total_pinged_claims, total_resolved_claims, total_kudos_claims, hd_claim_percent, average_check_time]:
-                category.setdefault(case.lead.discord_id, 0)
+                category.setdefault(lead_id, 0)
 
             # Update tech data
-            if case.status == str(Status.CHECKED):
-                total_checked_cases[case.tech.discord_id] += 1
-                total_checked_claims[case.lead.discord_id] += 1
-            elif case.status == str(Status.DONE):
-                total_done_cases[case.tech.discord_id] += 1
-                total_done_claims[case.lead.discord_id] += 1
-            elif case.status == str(Status.PINGED):
-                total_pinged_cases[case.tech.discord_id] += 1
-                total_pinged_claims[case.lead.discord_id] += 1
-            elif case.status == str(Status.RESOLVED):
-                total_resolved_cases[case.tech.discord_id] += 1
-                total_resolved_claims[case.lead.discord_id] += 1
-            elif case.status == str(Status.KUDOS):
-                total_kudos_cases[case.tech.discord_id] += 1
-                total_kudos_claims[case.lead.discord_id] += 1
+            if status == str(Status.CHECKED):
+                total_checked_cases[tech_id] += claims
+                total_checked_claims[lead_id] += claims
+            elif status == str(Status.DONE):
+                total_done_cases[tech_id] += claims
+                total_done_claims[lead_id] += claims
+            elif status == str(Status.PINGED):
+                total_pinged_cases[tech_id] += claims
+                total_pinged_claims[lead_id] += claims
+            elif status == str(Status.RESOLVED):
+                total_resolved_cases[tech_id] += claims
+                total_resolved_claims[lead_id] += claims
+            elif status == str(Status.KUDOS):
+                total_kudos_cases[tech_id] += claims
+                total_kudos_claims[lead_id] += claims
 
             # Add complete/check time differences
-            complete_diff = case.complete_time - case.claim_time
-            complete_diff_seconds = complete_diff.seconds + (complete_diff.days * 86400)
-
-            check_diff = case.check_time - case.complete_time
-            check_diff_seconds = check_diff.seconds + (check_diff.days * 86400)
-
-            average_completion_time[case.tech.discord_id] += complete_diff_seconds
-            average_check_time[case.lead.discord_id] += check_diff_seconds
+            average_completion_time[tech_id] += completion_seconds
+            average_check_time[lead_id] += check_seconds
 
         # Calculate averages
         for key in list(average_completion_time.keys()):
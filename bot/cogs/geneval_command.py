@@ -53,8 +53,10 @@ class GenEvalCommand(commands.Cog):
         now = datetime.datetime.now()
         filenames = []
 
+        users = await self.bot.db.run(User.from_ids, list(data.keys()))
+
         for user_id in list(data.keys()):
-            user = User.from_id(self.bot.connection, user_id)
+            user = users[user_id]
 
             fields, template_name = self.create_word_fields(
                 user.full_name, 
@@ -210,7 +212,7 @@ class GenEvalCommand(commands.Cog):
         return total_case_count, median_claim, median_ping, top_claim / total_case_count, organized_data
 
     async def get_data(self, guild, month: int, year: int) -> tuple[int, dict[int, int], dict[int, list[str]], dict[int, list[str]]]:
-        all_cases = CheckedClaim.get_all_from_month(self.bot.connection, month, year)
+        all_cases = await self.bot.db.run_analytics(CheckedClaim.get_all_from_month, month, year)
 
         # Tech data
         total_hd_cases = 0
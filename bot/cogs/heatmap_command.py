@@ -8,7 +8,10 @@ from typing import Optional
 
 import traceback
 
-from bot.models.checked_claim import CheckedClaim
+from bot.models.storage_backend import StorageBackend
+from bot.models.daily_claim_stats import DailyClaimStats
+from bot.models.user import User
+from bot.helpers.date_range import DateRange
 # Use TYPE_CHECKING to avoid circular import from bot
 from typing import TYPE_CHECKING
 
@@ -39,53 +42,74 @@ class HeatmapCommand(commands.Cog):
 
         await interaction.response.defer(ephemeral=True)  # Wait in case process takes a long time
         if month is None:
-            cases = CheckedClaim.get_all_from_year(self.bot.connection, year)
+            date_range = DateRange.year(year)
             title = f"HD Heatmap ({year})"
         else:
-            cases = CheckedClaim.get_all_from_month(self.bot.connection, month, year)
+            date_range = DateRange.month(month, year)
             title = f"HD Heatmap ({month}/{year})"
 
-        data = self.generate(cases, title)
+        counts = await self.bot.db.run_analytics(HeatmapCommand.count_checks, date_range)
+        data = self.generate(counts, title)
 
         chart = discord.File(data, filename="chart.png")
 
         await interaction.followup.send(content="Heatmap created successfully", file=chart)
 
-    def generate(self, cases: list[CheckedClaim], title: str) -> io.BytesIO:
-        """Converts a list of cases into a heatmap to show which leads have
-        checked cases from which techs.
+    @staticmethod
+    def count_checks(pool: StorageBackend, date_range: DateRange) -> tuple[dict[int, dict[int, int]], dict[int, str], dict[int, str], dict[int, int]]:
+        """Counts which leads have checked cases from which techs using DailyClaimStats.
 
         Args:
-            cases (list[CheckedClaim]): The list of CheckedClaims that will be combed through
-            title (str): The title of the matplotlib graph
+            pool (StorageBackend): The pool of connections to the database
+            date_range (DateRange): The year or month of the checked cases
 
         Returns:
-            BytesIO - A byte stream that can be attached as a Discord file that will show the heatmap
+            tuple[dict[int, dict[int, int]], dict[int, str], dict[int, str], dict[int, int]] - The check counts
+            (parentkey = lead, childkey = tech), the names of the leads and techs and the total cases of every tech
         """
-        data_stream = io.BytesIO()
-
-        plt.rcParams.update({'font.size': 7})
-
         all_data: dict[int, dict[int, int]] = {}  # dict of dicts (parentkey = lead, childkey = tech)
         leads: dict[int, str] = {}
         techs: dict[int, str] = {}
 
         total_cases: dict[int, int] = {}
+        counts = DailyClaimStats.count_by_pair(pool, date_range)
+        users = User.from_ids(pool, [row[0] for row in counts] + [row[1] for row in counts])
+
         # Collect data
-        for case in cases:
-            lead = case.lead.discord_id
-            tech = case.tech.discord_id
+        for tech, lead, status, claims, completion_seconds, check_seconds in counts:
+            # Skip users that are no longer in the Users table
+            if tech not in users or lead not in users:
+                continue
 
             total_cases.setdefault(tech, 0)
-            total_cases[tech] += 1
+            total_cases[tech] += claims
 
-            leads[lead] = case.lead.abb_name
-            techs[tech] = case.tech.abb_name
+            leads[lead] = users[lead].abb_name
+            techs[tech] = users[tech].abb_name
 
             all_data.setdefault(lead, {})
             all_data[lead].setdefault(tech, 0)
 
-            all_data[lead][tech] += 1
+            all_data[lead][tech] += claims
+
+        return all_data, leads, techs, total_cases
+
+    def generate(self, counts: tuple[dict[int, dict[int, int]], dict[int, str], dict[int, str], dict[int, int]], title: str) -> io.BytesIO:
+        """Converts the check counts into a heatmap to show which leads have
+        checked cases from which techs.
+
+        Args:
+            counts (tuple[dict[int, dict[int, int]], dict[int, str], dict[int, str], dict[int, int]]): The counts returned by count_checks
+            title (str): The title of the matplotlib graph
+
+        Returns:
+            BytesIO - A byte stream that can be attached as a Discord file that will show the heatmap
+        """
+        data_stream = io.BytesIO()
+
+        plt.rcParams.update({'font.size': 7})
+
+        all_data, leads, techs, total_cases = counts
 
         # Initialize all data
         for key in list(all_data.keys()):
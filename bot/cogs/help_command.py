@@ -48,6 +48,8 @@ class HelpCommand(commands.Cog):
         embed.add_field(name='/ping', value='Manually ping a case after it\'s been checked.')
         embed.add_field(name='/heatmap', value='Show a heatmap of what leads are checking certain tech\'s claims.')
         embed.add_field(name='/evaldata', value='Shows statistics that can be used for monthly evals.')
+        embed.add_field(name='/rebuildstats', value='Recounts the statistics used by the leaderboards and reports.')
+        embed.add_field(name='/dbstats', value='Shows which database queries and interactions take the most time.')
         embed.add_field(name='/casedist', value='Shows the distribution of cases claimed throughout the day.')
         embed.add_field(name='/award', value='Award a team points as a prize.')
 
@@ -44,8 +44,8 @@ class LeaderboardCommand(commands.Cog):
         # Show current leaderboard
         await interaction.response.defer()  # Wait in case process takes a long time
         result = LeaderboardResults(
-            CheckedClaim.get_all_leaderboard(self.bot.connection, interaction.created_at.year),
-            TeamPoint.get_all(self.bot.connection), interaction.created_at, None)
+            await self.bot.db.run_analytics(LeaderboardResults.count, interaction.created_at),
+            await self.bot.db.run(TeamPoint.get_all), interaction.created_at, None)
 
         embed = result.create_embed(self.bot, interaction)
         await interaction.followup.send(embed=embed, view=LeaderboardView(self.bot))
@@ -9,8 +9,6 @@ from bot.helpers.leaderboard_helpers import LeadstatsResults
 # Use TYPE_CHECKING to avoid circular import from bot
 from typing import TYPE_CHECKING
 
-from ..models.checked_claim import CheckedClaim
-
 if TYPE_CHECKING:
     from ..bot import Bot
 
@@ -45,8 +43,8 @@ class LeadStatsCommand(commands.Cog):
 
         # Generate and send leadstats
         await interaction.response.defer()  # Wait in case process takes a long time
-        result = LeadstatsResults(CheckedClaim.search(self.bot.connection), interaction.created_at)
-        embed, file = result.create_embed(self.bot, interaction)
+        result = await self.bot.db.run_analytics(LeadstatsResults.load, interaction.created_at)
+        embed, file = await result.create_embed(self.bot, interaction)
         await interaction.followup.send(embed=embed, view=LeadStatsView(self.bot), file=file)
 
     @leadstats.error
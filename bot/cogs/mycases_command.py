@@ -36,7 +36,7 @@ class MyCasesCommand(commands.Cog):
             interaction (discord.Interaction): Interaction that the slash command originated from
         """
         # Check to see if user is in the list
-        u = User.from_id(self.bot.connection, interaction.user.id)
+        u = await self.bot.db.run(User.from_id, interaction.user.id)
         if u is None:
             msg = f"Please use the **/join** command using this command."
             await interaction.response.send_message(content=msg, ephemeral=True, delete_after=300)
@@ -46,13 +46,13 @@ class MyCasesCommand(commands.Cog):
 
         # Collect rows with this case
         rows: list[ActiveClaim | CompletedClaim | CheckedClaim] = []
-        for result in ActiveClaim.get_all_with_tech_id(self.bot.connection, interaction.user.id):
+        for result in await self.bot.db.run(ActiveClaim.get_all_with_tech_id, interaction.user.id):
             rows.append(result)
 
-        for result in CompletedClaim.get_all_with_tech_id(self.bot.connection, interaction.user.id):
+        for result in await self.bot.db.run(CompletedClaim.get_all_with_tech_id, interaction.user.id):
             rows.append(result)
 
-        for result in CheckedClaim.get_all_with_tech_id(self.bot.connection, interaction.user.id):
+        for result in await self.bot.db.run(CheckedClaim.get_all_with_tech_id, interaction.user.id):
             rows.append(result)
 
         # Sort data
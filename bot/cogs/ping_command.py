@@ -36,7 +36,8 @@ class PingCommand(commands.Cog):
             user (discord.Member): The user that was responsible for the case
             case_num (str): The case number in Salesforce (e.g. "00960979")
         """
-        case = CheckedClaim.find_latest_case(self.bot.connection, User.from_id(self.bot.connection, user.id), case_num)
+        tech = await self.bot.db.run(User.from_id, user.id)
+        case = await self.bot.db.run(CheckedClaim.find_latest_case, tech, case_num)
 
         if case is not None:
             await interaction.response.send_modal(PingForm(self.bot, case))
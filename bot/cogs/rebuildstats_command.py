@@ -0,0 +1,59 @@
+from discord import app_commands
+from discord.ext import commands
+import discord
+import traceback
+from typing import Optional
+
+from bot.models.daily_claim_stats import DailyClaimStats
+from bot.helpers.date_range import DateRange
+
+# Use TYPE_CHECKING to avoid circular import from bot
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..bot import Bot
+
+
+class RebuildStatsCommand(commands.Cog):
+    def __init__(self, bot: "Bot") -> None:
+        """Creates the /rebuildstats command using a cog.
+
+        Args:
+            bot (Bot): A reference to the original Bot instantiation.
+        """
+        self.bot = bot
+
+    @app_commands.command(description="Recount the case statistics used by the leaderboards and reports.")
+    @app_commands.describe(year="(Optional) The year that will be recounted (every year by default).")
+    @app_commands.default_permissions(mute_members=True)
+    async def rebuildstats(self, interaction: discord.Interaction, year: Optional[int]):
+        """Recounts the DailyClaimStats table from the CheckedClaims table.
+
+        Args:
+            interaction (discord.Interaction): Interaction that the slash command originated from.
+            year (Optional[int]): The year that will be recounted
+        """
+        # Check if user is a lead
+        if not self.bot.check_if_lead(interaction.user):
+            # Return error message if user is not Lead
+            msg = f"<@{interaction.user.id}>, you do not have permission!"
+            await interaction.response.send_message(content=msg, ephemeral=True, delete_after=180)
+            return
+
+        await interaction.response.defer(ephemeral=True)  # Wait in case process takes a long time
+
+        date_range = DateRange.year(year) if year is not None else None
+        rows = await self.bot.db.run_maintenance(DailyClaimStats.rebuild, date_range)
+
+        await interaction.followup.send(content=f"Rebuilt the case statistics ({rows} rows).")
+
+    @rebuildstats.error
+    async def rebuildstats_error(self, ctx: discord.Interaction, error):
+        full_error = traceback.format_exc()
+
+        ch = await self.bot.fetch_channel(self.bot.error_channel)
+
+        msg = f"Error with **/rebuildstats** ran by <@!{ctx.user.id}>.\n```{full_error}```"
+        if len(msg) > 1993:
+            msg = msg[:1993] + "...```"
+        await ch.send(msg)
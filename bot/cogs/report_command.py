@@ -85,15 +85,15 @@ class ReportCommand(commands.Cog):
                 description += f"/{year}"
             description += "**"
         if user is not None:
-            user = User.from_id(self.bot.connection, user.id)
+            user = await self.bot.db.run(User.from_id, user.id)
             description += f" from user **{user.full_name}**"
 
         if status is not None:
             status = Status.from_str(status.value)
             description += f" with status **{status}**"
 
-        results = CheckedClaim.search(self.bot.connection, user, year, month, status)
-        row_str = self.data_to_rowstr(results)
+        results = await self.bot.db.run_analytics(CheckedClaim.search, user, year, month, status)
+        row_str = await self.data_to_rowstr(results)
 
         with open('temp.csv', 'w', newline='', encoding='utf-8') as csvfile:
             writer = csv.writer(csvfile)
@@ -105,7 +105,7 @@ class ReportCommand(commands.Cog):
         await interaction.followup.send(content=f"{description}.", file=report)
 
 
-    def data_to_rowstr(self, data: list[CheckedClaim]) -> list[list[str]]:
+    async def data_to_rowstr(self, data: list[CheckedClaim]) -> list[list[str]]:
         """Converts the raw data into a list of strings
         that can be used in the embed description.
 
@@ -122,7 +122,7 @@ class ReportCommand(commands.Cog):
 
             # Add ping data
             if claim.ping_thread_id is not None:
-                p = Feedback.from_thread_id(self.bot.connection, claim.ping_thread_id)
+                p = await self.bot.db.run(Feedback.from_thread_id, claim.ping_thread_id)
                 row.append(p.severity)
                 row.append(p.description)
 
@@ -8,6 +8,7 @@ from bot.models.feedback import Feedback
 
 # from bot.views.resolve_ping_await_lead_view import ResolvePingAwaitLeadView
 from bot.views.resolve_ping_view import ResolvePingView
+from bot.request_labels import LabeledModal
 
 # Use TYPE_CHECKING to avoid circular import from bot
 from typing import TYPE_CHECKING
@@ -16,7 +17,7 @@ if TYPE_CHECKING:
     from bot.bot import Bot
 
 
-class AffirmForm(ui.Modal, title='Tech Assessment'):
+class AffirmForm(LabeledModal, title='Tech Assessment'):
     def __init__(self, bot: "Bot", case: CheckedClaim):
         """Creates an assessment form for a tech to provide
         how they resolved a ping, and allows a lead to review
@@ -44,7 +45,7 @@ class AffirmForm(ui.Modal, title='Tech Assessment'):
         
         # Try to remove the Affirm button and update it to be the lead resolve view
         try:
-            ping = Feedback.from_thread_id(self.bot.connection, interaction.channel_id)
+            ping = await self.bot.db.run(Feedback.from_thread_id, interaction.channel_id)
             ch = await self.bot.fetch_channel(interaction.channel_id)
             msg = await ch.fetch_message(ping.message_id)
             original_embed = msg.embeds[0]
@@ -4,6 +4,7 @@ import datetime
 
 from bot.models.user import User
 from bot.models.announcement import Announcement
+from bot.request_labels import LabeledModal
 
 # Use TYPE_CHECKING to avoid circular import from bot
 from typing import TYPE_CHECKING
@@ -12,7 +13,7 @@ if TYPE_CHECKING:
     from bot.bot import Bot
 
 
-class AnnouncementForm(ui.Modal, title='Announcement Form'):
+class AnnouncementForm(LabeledModal, title='Announcement Form'):
     def __init__(self, bot: "Bot", informational: bool):
         """Creates a form that can be used to create
         announcements and informational announcements
@@ -35,7 +36,7 @@ class AnnouncementForm(ui.Modal, title='Announcement Form'):
         Args:
             interaction (discord.Interaction): The submit modal interaction
         """
-        user = User.from_id(self.bot.connection, interaction.user.id)
+        user = await self.bot.db.run(User.from_id, interaction.user.id)
         a_title = str(self.a_title)
         description = str(self.description)
 
@@ -71,9 +72,10 @@ class AnnouncementForm(ui.Modal, title='Announcement Form'):
             case_message = await case_channel.send(embed=announcement_embed, silent=True)
 
             announcement = Announcement(announcement_message.id, case_message.id, a_title, description,
-                                        User.from_id(self.bot.connection, interaction.user.id), end_date, True)
+                                        await self.bot.db.run(User.from_id, interaction.user.id), end_date, True)
 
-            announcement.add_to_database(self.bot.connection)
+            await self.bot.db.run(announcement.add_to_database)
+            self.bot.announcements.add(announcement)
 
             # Send confirmation message
             await interaction.response.send_message(content="👍", ephemeral=True, delete_after=0)
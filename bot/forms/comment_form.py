@@ -1,15 +1,13 @@
 import discord
 import discord.ui as ui
-from datetime import datetime
 
 from bot.models.completed_claim import CompletedClaim
-from bot.models.checked_claim import CheckedClaim
 from bot.models.user import User
 from bot.models.feedback import Feedback
 
 from bot.status import Status
 from bot.views.kudos_view import KudosView
-
+from bot.request_labels import LabeledModal
 
 # Use TYPE_CHECKING to avoid circular import from bot
 from typing import TYPE_CHECKING
@@ -18,7 +16,7 @@ if TYPE_CHECKING:
     from bot.bot import Bot
 
 
-class CommentForm(ui.Modal, title='Comment Form'):
+class CommentForm(LabeledModal, title='Comment Form'):
     def __init__(self, bot: "Bot", case: CompletedClaim):
         """Creates a feedback form for internal feedback on a tech's handling of a case.
 
@@ -39,27 +37,24 @@ class CommentForm(ui.Modal, title='Comment Form'):
         Args:
             interaction (discord.Interaction): Interaction that the slash command originated from.
         """
+        # The comment is stored under the ID of the checker message
+        comment_thread = None if len(str(self.description)) == 0 else interaction.message.id
+
+        # Move case from the completed log to the checked log (another lead might have checked it first)
+        lead = await self.bot.db.run(User.from_id, interaction.user.id)
+        if await self.bot.db.run(self.case.promote, lead, Status.CHECKED, comment_thread) is None:
+            msg = f"This case has already been checked."
+            await interaction.response.send_message(content=msg, ephemeral=True, delete_after=300)
+            return
+
         # Send message
         await interaction.response.send_message(content=":thumbsup:", ephemeral=True, delete_after=0)  # Acknowledge interaction, immediately delete message
 
         # Delete checker message
         await interaction.message.delete()
 
-        if len(str(self.description)) == 0:
-            comment_thread = None
-        else:
+        if comment_thread is not None:
             # Add a Feedback class to store the comment data
-            comment = Feedback(interaction.message.id, interaction.message.id, "Comment", str(self.description))
-            comment.add_to_database(self.bot.connection)
-
-            comment_thread = comment.thread_id
-
-        # Remove unpinged case from log
-        self.case.remove_from_database(self.bot.connection)
-
-        checked_case = CheckedClaim(self.case.checker_message_id, self.case.case_num, self.case.tech,
-                                    User.from_id(self.bot.connection, interaction.user.id), self.case.claim_time,
-                                    self.case.complete_time, datetime.now(), Status.CHECKED, comment_thread)
-        
-        checked_case.add_to_database(self.bot.connection)
+            comment = Feedback(comment_thread, interaction.message.id, "Comment", str(self.description))
+            await self.bot.db.run(comment.add_to_database)
 
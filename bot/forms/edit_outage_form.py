@@ -5,6 +5,7 @@ import discord.ui as ui
 
 from bot.models.outage import Outage
 from bot.models.user import User
+from bot.request_labels import LabeledModal
 
 # Use TYPE_CHECKING to avoid circular import from bot
 from typing import TYPE_CHECKING
@@ -13,7 +14,7 @@ if TYPE_CHECKING:
     from bot.bot import Bot
 
 
-class EditOutageForm(ui.Modal, title='Outage Update Form'):
+class EditOutageForm(LabeledModal, title='Outage Update Form'):
     def __init__(self, bot: "Bot", outage: Outage):
         """Creates a form for editing the fields of an outage.
 
@@ -47,7 +48,7 @@ class EditOutageForm(ui.Modal, title='Outage Update Form'):
         Args:
             interaction (discord.Interaction): The submit modal interaction
         """
-        user = User.from_id(self.bot.connection, interaction.user.id)
+        user = await self.bot.db.run(User.from_id, interaction.user.id)
 
         # Collect form information
         self.new_service = str(self.service)
@@ -60,11 +61,11 @@ class EditOutageForm(ui.Modal, title='Outage Update Form'):
             await interaction.response.send_message(content="Error! Please verify inputs aren't too large", ephemeral=True, delete_after=60)
             return
 
-        self.outage.remove_from_database(self.bot.connection)
+        await self.bot.db.run(self.outage.remove_from_database)
 
         new_outage = Outage(self.outage.message_id, self.outage.case_message_id, self.new_service, self.new_parent_case, self.new_description, self.new_troubleshoot_steps, self.new_resolution_time, self.outage.user, True)
 
-        new_outage.add_to_database(self.bot.connection)
+        await self.bot.db.run(new_outage.add_to_database)
 
         # Create announcement embed
         announcement_embed = discord.Embed(colour=discord.Color.red())
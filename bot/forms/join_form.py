@@ -2,6 +2,7 @@ import discord
 import discord.ui as ui
 
 from bot.models.user import User
+from bot.request_labels import LabeledModal
 
 # Use TYPE_CHECKING to avoid circular import from bot
 from typing import TYPE_CHECKING
@@ -10,7 +11,7 @@ if TYPE_CHECKING:
     from bot.bot import Bot
 
 
-class JoinForm(ui.Modal, title='Join Form'):
+class JoinForm(LabeledModal, title='Join Form'):
     def __init__(self, bot: "Bot"):
         """Creates a feedback form for the adding a user to the Users table.
 
@@ -30,14 +31,14 @@ class JoinForm(ui.Modal, title='Join Form'):
             interaction (discord.Interaction): The submit modal interaction
         """
 
-        u = User.from_id(self.bot.connection, interaction.user.id)
+        u = await self.bot.db.run(User.from_id, interaction.user.id)
         # Test if user is already in the database
         if u is not None:
-            u.edit_name(self.bot.connection, str(self.first_name), str(self.last_name))
+            await self.bot.db.run(u.edit_name, str(self.first_name), str(self.last_name))
         else:
             # Create new user
             user = User(interaction.user.id, str(self.first_name), str(self.last_name), 0)
-            user.add_to_database(self.bot.connection)
+            await self.bot.db.run(user.add_to_database)
 
         await interaction.response.send_message(content="👍", ephemeral=True, delete_after=0)  # Acknowledge interaction, immediately delete message
         await self.bot.resend_outages_loop()
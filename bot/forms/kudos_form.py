@@ -3,13 +3,12 @@ import discord.ui as ui
 from datetime import datetime
 
 from bot.models.completed_claim import CompletedClaim
-from bot.models.checked_claim import CheckedClaim
 from bot.models.user import User
 from bot.models.feedback import Feedback
 
 from bot.status import Status
 from bot.views.kudos_view import KudosView
-
+from bot.request_labels import LabeledModal
 
 # Use TYPE_CHECKING to avoid circular import from bot
 from typing import TYPE_CHECKING
@@ -18,7 +17,7 @@ if TYPE_CHECKING:
     from bot.bot import Bot
 
 
-class KudosForm(ui.Modal, title='Kudos Form'):
+class KudosForm(LabeledModal, title='Kudos Form'):
     def __init__(self, bot: "Bot", case: CompletedClaim):
         """Creates a feedback form for complementing a tech's handling of a case.
 
@@ -39,6 +38,13 @@ class KudosForm(ui.Modal, title='Kudos Form'):
         Args:
             interaction (discord.Interaction): Interaction that the slash command originated from.
         """
+        # Move case from the completed log to the checked log (another lead might have checked it first)
+        lead = await self.bot.db.run(User.from_id, interaction.user.id)
+        checked = await self.bot.db.run(self.case.promote, lead, Status.KUDOS)
+        if checked is None:
+            msg = f"This case has already been checked."
+            await interaction.response.send_message(content=msg, ephemeral=True, delete_after=300)
+            return
 
         # Send message
         await interaction.response.send_message(content="Complimented!", ephemeral=True, delete_after=0)  # Acknowledge interaction, immediately delete message
@@ -74,12 +80,5 @@ class KudosForm(ui.Modal, title='Kudos Form'):
 
         # Add a Ping class to store the kudos comment data
         kudo = Feedback(thread.id, message.id, "Kudos", str(self.description))
-        kudo.add_to_database(self.bot.connection)
-
-        # Remove unpinged case from log
-        self.case.remove_from_database(self.bot.connection)
-
-        checked_case = CheckedClaim(self.case.checker_message_id, self.case.case_num, self.case.tech,
-                                    User.from_id(self.bot.connection, interaction.user.id), self.case.claim_time,
-                                    self.case.complete_time, datetime.now(), Status.KUDOS, kudo.thread_id)
-        checked_case.add_to_database(self.bot.connection)
+        await self.bot.db.run(kudo.add_to_database)
+        await self.bot.db.run(checked.add_ping_thread, kudo.thread_id)
@@ -6,7 +6,7 @@ import discord.ui as ui
 
 from bot.helpers.leaderboard_helpers import LeaderboardResults
 from bot.helpers.other import month_number_to_name
-from bot.models.checked_claim import CheckedClaim
+from bot.request_labels import LabeledModal
 
 # Use TYPE_CHECKING to avoid circular import from bot
 from typing import TYPE_CHECKING, Optional
@@ -18,7 +18,7 @@ if TYPE_CHECKING:
     from bot.bot import Bot
 
 
-class LeaderboardForm(ui.Modal, title='Past Leaderboard Form'):
+class LeaderboardForm(LabeledModal, title='Past Leaderboard Form'):
     def __init__(self, bot: "Bot"):
         """Creates a feedback form for showing previous leaderboard leaderboards.
 
@@ -44,8 +44,8 @@ class LeaderboardForm(ui.Modal, title='Past Leaderboard Form'):
             return
 
         result = LeaderboardResults(
-            CheckedClaim.get_all_leaderboard(self.bot.connection, d.year),
-            TeamPoint.get_all(self.bot.connection), d, None, True)
+            await self.bot.db.run_analytics(LeaderboardResults.count, d, True),
+            await self.bot.db.run(TeamPoint.get_all), d, None)
 
         embed = result.create_embed(self.bot, interaction)
 
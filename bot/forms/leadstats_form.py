@@ -6,7 +6,7 @@ import discord.ui as ui
 
 from bot.helpers.leaderboard_helpers import LeadstatsResults
 from bot.helpers.other import month_number_to_name
-from bot.models.checked_claim import CheckedClaim
+from bot.request_labels import LabeledModal
 
 # Use TYPE_CHECKING to avoid circular import from bot
 from typing import TYPE_CHECKING, Optional
@@ -15,7 +15,7 @@ if TYPE_CHECKING:
     from bot.bot import Bot
 
 
-class LeadstatsForm(ui.Modal, title='Past Leadstats Form'):
+class LeadstatsForm(LabeledModal, title='Past Leadstats Form'):
     def __init__(self, bot: "Bot"):
         """Creates a feedback form for showing previous leadstats leaderboards.
 
@@ -50,10 +50,10 @@ class LeadstatsForm(ui.Modal, title='Past Leadstats Form'):
                                                     ephemeral=True, delete_after=30)
             return
 
-        results = LeadstatsResults(CheckedClaim.search(self.bot.connection), d)
+        results = await self.bot.db.run_analytics(LeadstatsResults.load, d)
 
         title = f"ITS Historic {'Month' if m_or_s else 'Semester'} Lead CC Statistics ({month_number_to_name(d.month)} {d.year})"
-        chart = discord.File(results.convert_to_plot(self.bot, m_or_s, title), filename="chart.png")
+        chart = discord.File(await results.convert_to_plot(self.bot, m_or_s, title), filename="chart.png")
 
         await interaction.response.send_message(content="👍", ephemeral=True, file=chart, delete_after=90)
 
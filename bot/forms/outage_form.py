@@ -5,7 +5,7 @@ import datetime
 from bot.views.outage_view import OutageView
 from bot.models.outage import Outage
 from bot.models.user import User
-
+from bot.request_labels import LabeledModal
 
 # Use TYPE_CHECKING to avoid circular import from bot
 from typing import TYPE_CHECKING
@@ -14,7 +14,7 @@ if TYPE_CHECKING:
     from bot.bot import Bot
 
 
-class OutageForm(ui.Modal, title='Outage Form'):
+class OutageForm(LabeledModal, title='Outage Form'):
     def __init__(self, bot: "Bot"):
         """Creates a form for creating an outage.
         Records the service name, parent case, description,
@@ -39,7 +39,7 @@ class OutageForm(ui.Modal, title='Outage Form'):
         Args:
             interaction (discord.Interaction): Interaction that the slash command originated from.
         """
-        user = User.from_id(self.bot.connection, interaction.user.id)
+        user = await self.bot.db.run(User.from_id, interaction.user.id)
 
         # Collect information from form
         service = str(self.service)
@@ -92,8 +92,8 @@ class OutageForm(ui.Modal, title='Outage Form'):
         case_channel = await self.bot.fetch_channel(self.bot.cases_channel)
         case_message = await case_channel.send(embed=case_embed, silent=True)
 
-        out = Outage(announcement_message.id, case_message.id, service, parent_case, description, troubleshooting_steps, resolution_time, User.from_id(self.bot.connection, interaction.user.id), True)
-        out.add_to_database(self.bot.connection)
+        out = Outage(announcement_message.id, case_message.id, service, parent_case, description, troubleshooting_steps, resolution_time, await self.bot.db.run(User.from_id, interaction.user.id), True)
+        await self.bot.db.run(out.add_to_database)
         # Send confirmation message
         await interaction.response.send_message(content="👍", ephemeral=True, delete_after=0)
 
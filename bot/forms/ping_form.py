@@ -11,6 +11,7 @@ from bot.models.user import User
 from bot.status import Status
 
 from bot.views.affirm_view import AffirmView
+from bot.request_labels import LabeledModal
 
 # Use TYPE_CHECKING to avoid circular import from bot
 from typing import TYPE_CHECKING
@@ -19,7 +20,7 @@ if TYPE_CHECKING:
     from bot.bot import Bot
 
 
-class PingForm(ui.Modal, title='Feedback Form'):
+class PingForm(LabeledModal, title='Feedback Form'):
     def __init__(self, bot: "Bot", case: Union[CompletedClaim, CheckedClaim]):
         """Creates a feedback form for the LeadView whenever a lead would
         like to ping a case and provide feedback.
@@ -43,6 +44,15 @@ class PingForm(ui.Modal, title='Feedback Form'):
         Args:
             interaction (discord.Interaction): Interaction that the slash command originated from.
         """
+        if type(self.case) == CompletedClaim:
+            # Move case from the completed log to the checked log (another lead might have checked it first)
+            lead = await self.bot.db.run(User.from_id, interaction.user.id)
+            checked = await self.bot.db.run(self.case.promote, lead, Status.PINGED)
+            if checked is None:
+                msg = f"This case has already been checked."
+                await interaction.response.send_message(content=msg, ephemeral=True, delete_after=300)
+                return
+
         original_user = await self.bot.fetch_user(self.case.tech.discord_id)
 
         # Send message
@@ -56,7 +66,7 @@ class PingForm(ui.Modal, title='Feedback Form'):
 
         # Update the lead if /ping is used (and a different lead is using it)
         if type(self.case) == CheckedClaim and self.case.lead.discord_id != interaction.user.id:
-            self.case.update_lead(self.bot.connection, interaction.user.id)
+            await self.bot.db.run(self.case.update_lead, interaction.user.id)
 
         fb_embed = discord.Embed(colour=discord.Color.red(), timestamp=datetime.now())
 
@@ -94,17 +104,10 @@ class PingForm(ui.Modal, title='Feedback Form'):
         message = await thread.send(embed=fb_embed, view=AffirmView(self.bot))
 
         ping = Feedback(thread.id, message.id, str(self.severity), str(self.description) + "\n" + str(self.to_do))
-        ping.add_to_database(self.bot.connection)
+        await self.bot.db.run(ping.add_to_database)
 
         if type(self.case) == CheckedClaim:
-            self.case.add_ping_thread(self.bot.connection, ping.thread_id)
-            self.case.change_status(self.bot.connection, Status.PINGED)
+            await self.bot.db.run(self.case.add_ping_thread, ping.thread_id)
+            await self.bot.db.run(self.case.change_status, Status.PINGED)
         elif type(self.case) == CompletedClaim:
-            # Remove unpinged case from log
-            self.case.remove_from_database(self.bot.connection)
-
-            checked_case = CheckedClaim(self.case.checker_message_id, self.case.case_num, self.case.tech,
-                                        User.from_id(self.bot.connection, interaction.user.id),
-                                        self.case.claim_time,
-                                        self.case.complete_time, datetime.now(), Status.PINGED, ping.thread_id)
-            checked_case.add_to_database(self.bot.connection)
+            await self.bot.db.run(checked.add_ping_thread, ping.thread_id)
@@ -0,0 +1,113 @@
+import datetime
+from typing import Optional
+
+
+class DateRange:
+    def __init__(self, start: datetime.datetime, end: datetime.datetime):
+        """A half-open range of time [start, end). Queries compare the column itself against
+        the bounds (instead of wrapping it in YEAR() or MONTH()) so that MySQL can use an index on it.
+
+        Args:
+            start (datetime.datetime): The first moment inside the range
+            end (datetime.datetime): The first moment after the range
+        """
+        self.start = start
+        self.end = end
+
+    @staticmethod
+    def year(year: int) -> 'DateRange':
+        """Returns the range covering a calendar year.
+
+        Args:
+            year (int): The year (e.g. 2024)
+
+        Returns:
+            DateRange - Jan 1 of the year up to Jan 1 of the next year
+        """
+        return DateRange(datetime.datetime(year, 1, 1), datetime.datetime(year + 1, 1, 1))
+
+    @staticmethod
+    def month(month: int, year: int) -> 'DateRange':
+        """Returns the range covering a month (leap years included).
+
+        Args:
+            month (int): The number of the month (from 1 to 12)
+            year (int): The year
+
+        Returns:
+            DateRange - The first of the month up to the first of the next month
+        """
+        start = datetime.datetime(year, month, 1)
+        if month == 12:
+            return DateRange(start, datetime.datetime(year + 1, 1, 1))
+
+        return DateRange(start, datetime.datetime(year, month + 1, 1))
+
+    @staticmethod
+    def semester(t: datetime.datetime) -> 'DateRange':
+        """Returns the range of the semester that a datetime is located in
+        (using the same boundaries as get_semester).
+
+        Winter: Jan 1 - Jan 28
+        Spring: Jan 29 - May
+        Summer: Jun - Aug 25 3:00 PM
+        Fall: Aug 25 3:00 PM - Dec
+
+        Args:
+            t (datetime.datetime): The datetime object
+
+        Returns:
+            DateRange - The range of the semester
+        """
+        year = t.year
+        winter = datetime.datetime(year, 1, 29)
+        summer = datetime.datetime(year, 6, 1)
+        fall = datetime.datetime(year, 8, 25, 15)
+
+        t = t.replace(tzinfo=None)
+        if t < winter:
+            return DateRange(datetime.datetime(year, 1, 1), winter)
+        if t < summer:
+            return DateRange(winter, summer)
+        if t < fall:
+            return DateRange(summer, fall)
+
+        return DateRange(fall, datetime.datetime(year + 1, 1, 1))
+
+    @staticmethod
+    def last(duration: datetime.timedelta, now: Optional[datetime.datetime] = None) -> 'DateRange':
+        """Returns a rolling window that ends now.
+
+        Args:
+            duration (datetime.timedelta): The length of the window (e.g. the last 30 days)
+            now (Optional[datetime.datetime]): The end of the window (the current time by default)
+
+        Returns:
+            DateRange - The range from now - duration up to now
+        """
+        if now is None:
+            now = datetime.datetime.now()
+
+        return DateRange(now - duration, now)
+
+    def contains(self, t: datetime.datetime) -> bool:
+        """Returns whether or not a datetime is located in the range.
+
+        Args:
+            t (datetime.datetime): The datetime object
+
+        Returns:
+            bool - Whether or not start <= t < end
+        """
+        return self.start <= t < self.end
+
+    def sql(self, column: str) -> tuple[str, tuple[datetime.datetime, datetime.datetime]]:
+        """Returns an index friendly condition that limits a column to the range.
+
+        Args:
+            column (str): The column being filtered (e.g. "c.claim_time")
+
+        Returns:
+            tuple[str, tuple[datetime.datetime, datetime.datetime]] - The condition and its parameters
+        """
+        return f"{column} >= %s AND {column} < %s", (self.start, self.end)
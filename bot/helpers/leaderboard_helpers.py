@@ -1,30 +1,31 @@
 import io
 import datetime
 from collections import OrderedDict
-from typing import Optional
+from typing import Iterable, Optional
 
 import pandas
 from matplotlib import pyplot as plt
 
-from bot.models.checked_claim import CheckedClaim
+from bot.models.storage_backend import StorageBackend
+from bot.models.daily_claim_stats import DailyClaimStats
 from bot.models.team_point import TeamPoint
 from bot.models.user import User
 
 from bot.helpers.other import *
+from bot.helpers.date_range import DateRange
 from bot.status import Status
 
 
 class LeaderboardResults:
-    def __init__(self, claims: list[CheckedClaim], team_points: list[TeamPoint], date: datetime.datetime, user: Optional[User], historic=False):
+    def __init__(self, counts: list[tuple[int, Optional[int], int, int, int, int]], team_points: list[TeamPoint], date: datetime.datetime, user: Optional[User]):
         """Creates a data structure for storing leaderboard data:
         counts (dict[int,int]) --> Used for storing how many cases each tech has
         ping_counts (int) --> The amount of pings a user has
         sorted_keys (list[int]) --> The keys of the counts dict in order from most to least claims
         ordered (OrderedDict) --> The ordered dictionary for the counts dict
-        historic (bool) --> Determines whether or not to count the entire semester (default: false)
 
         Args:
-            claims (list[CheckedClaim]): The list of claims to be sifted through
+            counts (list[tuple[int, Optional[int], int, int, int, int]]): The claim counts of every tech (see LeaderboardResults.count)
             team_points (list[TeamPoint]): The list of all TeamPoints
             date (datetime.datetime): The date (used for monthly cases)
             user (Optional[User]): The user (used for pinged counts)
@@ -41,44 +42,33 @@ class LeaderboardResults:
         self.semester_ping_count = 0  # Ping count for the user for the semester
 
         current_sem = get_semester(date)
-        for claim in claims:
-            # Filter out claims from different semesters (and resolve any issues with August)
-            if get_semester(claim.claim_time) != current_sem:
-                continue
-
-            if historic and (date.month < claim.claim_time.month or date.year != claim.claim_time.year):
-                continue
+        for tech_id, team_id, month_count, semester_count, month_pings, semester_pings in counts:
             # Add semester claims
-            self.semester_counts.setdefault(claim.tech.discord_id, 0)
-            self.semester_counts[claim.tech.discord_id] += 1
+            self.semester_counts[tech_id] = semester_count
 
-            # Add to ping count (if the case was pinged)
-            if user is not None and user.discord_id == claim.tech.discord_id and (claim.status == Status.PINGED or claim.status == Status.RESOLVED):
-                self.semester_ping_count += 1
+            # Add to ping count
+            if user is not None and user.discord_id == tech_id:
+                self.semester_ping_count = semester_pings
+                self.month_ping_count = month_pings
 
             # User doesn't have a team
-            if claim.tech.team_id is not None and claim.tech.team_id != 0:
+            if team_id is not None and team_id != 0:
                 # Add team claims
-                self.semester_team_counts.setdefault(claim.tech.team_id, 0)
-                self.semester_team_counts[claim.tech.team_id] += 1
+                self.semester_team_counts.setdefault(team_id, 0)
+                self.semester_team_counts[team_id] += semester_count
 
-            # Filter out cases from different months
-            if claim.claim_time.month != date.month:
+            # Filter out techs without cases this month
+            if month_count == 0:
                 continue
 
             # Add month claims
-            self.month_counts.setdefault(claim.tech.discord_id, 0)
-            self.month_counts[claim.tech.discord_id] += 1
+            self.month_counts[tech_id] = month_count
 
             # User doesn't have a team
-            if claim.tech.team_id is not None and claim.tech.team_id != 0:
+            if team_id is not None and team_id != 0:
                 # Add team claims
-                self.month_team_counts.setdefault(claim.tech.team_id, 0)
-                self.month_team_counts[claim.tech.team_id] += 1
-
-            # Add to ping count (if the case was pinged)
-            if user is not None and user.discord_id == claim.tech.discord_id and (claim.status == Status.PINGED or claim.status == Status.RESOLVED):
-                self.month_ping_count += 1
+                self.month_team_counts.setdefault(team_id, 0)
+                self.month_team_counts[team_id] += month_count
 
         # Sort the data
         self.month_sorted_keys: list[int] = sorted(self.month_counts, key=self.month_counts.get, reverse=True)
@@ -121,6 +111,26 @@ class LeaderboardResults:
         for key in self.semester_team_sorted_keys:
             self.ordered_team_semester[key] = self.semester_team_counts[key]
 
+    @staticmethod
+    def count(pool: StorageBackend, date: datetime.datetime, historic: bool = False) -> list[tuple[int, Optional[int], int, int, int, int]]:
+        """Counts the claims of every tech for the leaderboard of a date.
+
+        Args:
+            pool (StorageBackend): The pool of connections to the database
+            date (datetime.datetime): The date of the leaderboard
+            historic (bool): Whether or not the semester only counts up to the end of the date's month (default: false)
+
+        Returns:
+            list[tuple[int, Optional[int], int, int, int, int]] - The counts that should be passed to LeaderboardResults
+        """
+        semester = DateRange.semester(date)
+        month = DateRange.month(date.month, date.year)
+
+        if historic and month.end < semester.end:
+            semester = DateRange(semester.start, month.end)
+
+        return DailyClaimStats.count_by_tech(pool, semester, month)
+
     def create_embed(self, bot: 'Bot', interaction: discord.Interaction) -> discord.Embed:
         """Creates the leaderboard embed for the /leaderboard command and for the
         Refresh button.
@@ -178,7 +188,15 @@ class LeaderboardResults:
 
 
 class LeadstatsResults:
-    def __init__(self, claims: list[CheckedClaim], date: datetime.datetime):
+    def __init__(self, counts: Iterable[tuple[int, str, int, int]], date: datetime.datetime):
+        """Counts how many claims every lead checked, pinged, gave kudos to or marked as done
+        in the month and semester of a date.
+
+        Args:
+            counts (Iterable[tuple[int, str, int, int]]): The lead_id, status, month claims and semester claims
+                of every lead and status (see DailyClaimStats.count_by_lead)
+            date (datetime.datetime): The date (used for monthly cases)
+        """
         self.month_counts = {}
         self.semester_counts = {}
 
@@ -194,71 +212,63 @@ class LeadstatsResults:
         self.total_month = {}
         self.total_semester = {}
 
-        interaction_semester = get_semester(date)
-
-        for claim in claims:
-            # Ignore cases claimed after the provided date
-            if get_semester(claim.claim_time) != interaction_semester:
-                continue
-
+        for lead_id, status, month_claims, semester_claims in counts:
             # Initialize information as zero
-            self.month_counts.setdefault(claim.lead.discord_id, 0)
-            self.semester_counts.setdefault(claim.lead.discord_id, 0)
-
-            self.month_ping_counts.setdefault(claim.lead.discord_id, 0)
-            self.semester_ping_counts.setdefault(claim.lead.discord_id, 0)
+            self.month_counts.setdefault(lead_id, 0)
+            self.semester_counts.setdefault(lead_id, 0)
 
-            self.month_kudos_counts.setdefault(claim.lead.discord_id, 0)
-            self.semester_kudos_counts.setdefault(claim.lead.discord_id, 0)
+            self.month_ping_counts.setdefault(lead_id, 0)
+            self.semester_ping_counts.setdefault(lead_id, 0)
 
-            self.month_done_counts.setdefault(claim.lead.discord_id, 0)
-            self.semester_done_counts.setdefault(claim.lead.discord_id, 0)
+            self.month_kudos_counts.setdefault(lead_id, 0)
+            self.semester_kudos_counts.setdefault(lead_id, 0)
 
-            self.total_month.setdefault(claim.lead.discord_id, 0)
-            self.total_semester.setdefault(claim.lead.discord_id, 0)
+            self.month_done_counts.setdefault(lead_id, 0)
+            self.semester_done_counts.setdefault(lead_id, 0)
 
-            # Organize data for month
-            if claim.claim_time.year == date.year and claim.claim_time.month == date.month:
-                self.total_month[claim.lead.discord_id] += 1
-                if claim.status == Status.CHECKED:
-                    # Add checked/done
-                    self.month_counts[claim.lead.discord_id] += 1
+            self.total_month.setdefault(lead_id, 0)
+            self.total_semester.setdefault(lead_id, 0)
 
-                elif claim.status == Status.DONE:
-                    # Add done
-                    self.month_done_counts[claim.lead.discord_id] += 1
+            # Organize data for month and semester
+            self.total_month[lead_id] += month_claims
+            self.total_semester[lead_id] += semester_claims
+            if status == Status.CHECKED:
+                # Add checked
+                self.month_counts[lead_id] += month_claims
+                self.semester_counts[lead_id] += semester_claims
 
-                elif claim.status == Status.PINGED or claim.status == Status.RESOLVED:
-                    # Add pinged/resolved
-                    self.month_ping_counts[claim.lead.discord_id] += 1
+            elif status == Status.DONE:
+                # Add done
+                self.month_done_counts[lead_id] += month_claims
+                self.semester_done_counts[lead_id] += semester_claims
 
-                elif claim.status == Status.KUDOS:
-                    # Add kudos
-                    self.month_kudos_counts[claim.lead.discord_id] += 1
+            elif status == Status.PINGED or status == Status.RESOLVED:
+                # Add pinged/resolved
+                self.month_ping_counts[lead_id] += month_claims
+                self.semester_ping_counts[lead_id] += semester_claims
 
-            # Organize data for semester
-            if get_semester(claim.claim_time) == interaction_semester and claim.claim_time.year == date.year:
-                self.total_semester[claim.lead.discord_id] += 1
-                if claim.status == Status.CHECKED:
-                    # Add checked
-                    self.semester_counts[claim.lead.discord_id] += 1
+            elif status == Status.KUDOS:
+                # Add kudos
+                self.month_kudos_counts[lead_id] += month_claims
+                self.semester_kudos_counts[lead_id] += semester_claims
 
-                elif claim.status == Status.DONE:
-                    # Add done
-                    self.semester_done_counts[claim.lead.discord_id] += 1
+        self.semester_counts_sorted_keys = sorted(self.total_semester, key=self.total_semester.get, reverse=True)
+        self.month_counts_sorted_keys = sorted(self.total_month, key=self.total_month.get, reverse=True)
 
-                elif claim.status == Status.PINGED or claim.status == Status.RESOLVED:
-                    # Add pinged/resolved
-                    self.semester_ping_counts[claim.lead.discord_id] += 1
+    @staticmethod
+    def load(pool: StorageBackend, date: datetime.datetime) -> 'LeadstatsResults':
+        """Counts the lead stats of a date from DailyClaimStats.
 
-                elif claim.status == Status.KUDOS:
-                    # Add kudos
-                    self.semester_kudos_counts[claim.lead.discord_id] += 1
+        Args:
+            pool (StorageBackend): The pool of connections to the database
+            date (datetime.datetime): The date of the lead stats
 
-        self.semester_counts_sorted_keys = sorted(self.total_semester, key=self.total_semester.get, reverse=True)
-        self.month_counts_sorted_keys = sorted(self.total_month, key=self.total_month.get, reverse=True)
+        Returns:
+            LeadstatsResults - The lead stats of the month and semester of the date
+        """
+        return LeadstatsResults(DailyClaimStats.count_by_lead(pool, DateRange.semester(date), DateRange.month(date.month, date.year)), date)
 
-    def convert_to_plot(self, bot: 'Bot', month: bool, title: str) -> io.BytesIO:
+    async def convert_to_plot(self, bot: 'Bot', month: bool, title: str) -> io.BytesIO:
         """Converts data into a plot that can be sent in a Discord message. It uses three
         parallel lists in order to generate the plot using matplotlib
 
@@ -290,6 +300,9 @@ class LeadstatsResults:
         y2 = []
         y3 = []
 
+        # Load every lead that will be labeled at once
+        users = await bot.db.run(User.from_ids, keys)
+
         # Create labels and datapoints from the raw data
         for key in keys:
             total = counts[key] + done[key] + pings[key] + kudos[key]
@@ -301,7 +314,7 @@ class LeadstatsResults:
             y2.append(pings[key])
             y3.append(kudos[key])
 
-            user = User.from_id(bot.connection, key)
+            user = users[key]
             labels.append(f"{user.abb_name}\nP-{int((pings[key] / total) * 100)}%-K-{int((kudos[key] / total) * 100)}%")
 
         # If there's no data, create fake data to display the "No data" message
@@ -373,7 +386,7 @@ class LeadstatsResults:
 
         return data_stream
 
-    def create_embed(self, bot: 'Bot', interaction: discord.Interaction, month=True) -> tuple[discord.Embed, discord.File]:
+    async def create_embed(self, bot: 'Bot', interaction: discord.Interaction, month=True) -> tuple[discord.Embed, discord.File]:
         """Creates the leaderboard embed for the /leaderboard command and for the
         Refresh button.
 
@@ -384,7 +397,7 @@ class LeadstatsResults:
         Returns:
             discord.Embed: The embed object with everything already completed for month and semester rankings.
         """
-        data_stream = self.convert_to_plot(bot, month, f"ITS Lead CC Statistics ({f'{month_number_to_name(interaction.created_at.month)}' if month else 'Semester'})")
+        data_stream = await self.convert_to_plot(bot, month, f"ITS Lead CC Statistics ({f'{month_number_to_name(interaction.created_at.month)}' if month else 'Semester'})")
         chart = discord.File(data_stream, filename="chart.png")
 
         embed = discord.Embed(title="ITS Case Check Leaderboard")
@@ -1,12 +1,23 @@
-from datetime import datetime
-from mysql.connector import MySQLConnection
-from typing import Optional, Any
+from datetime import datetime, timedelta
+from bot.models.storage_backend import StorageBackend
+from typing import Callable, Iterable, Optional, Any
 
-from bot.models.database_item import DatabaseItem
+from bot.models.database_item import BulkWritable
+from bot.models.active_claim_registry import ActiveClaimRegistry
+from bot.models.completed_claim import CompletedClaim
 from bot.models.user import User
 
 
-class ActiveClaim(DatabaseItem):
+class ActiveClaim(BulkWritable):
+    __slots__ = ("claim_message_id", "case_num", "tech", "claim_time")
+
+    # Every active claim, once it's loaded when the bot starts (see ActiveClaimRegistry)
+    registry: ActiveClaimRegistry = ActiveClaimRegistry()
+
+    # Selects every column of ActiveClaims with the tech joined in from Users (see from_row)
+    SELECT = ("SELECT a.claim_message_id, a.case_num, a.claim_time, " + User.columns("t") +
+              " FROM ActiveClaims a LEFT JOIN Users t ON t.discord_id = a.tech_id")
+
     def __init__(self, claim_message_id: int, case_num: str, tech: User, claim_time: datetime):
         """Creates a representation of a case that's actively being worked on.
 
@@ -22,108 +33,273 @@ class ActiveClaim(DatabaseItem):
         self.claim_time = claim_time
 
     @staticmethod
-    def from_id(connection: MySQLConnection, claim_message_id: int) -> Optional['ActiveClaim']:
+    def from_row(row: tuple, users: Optional[dict[int, User]] = None) -> 'ActiveClaim':
+        """Creates an ActiveClaim from a row selected with ActiveClaim.SELECT.
+
+        Args:
+            row (tuple): The row returned by the database
+            users (Optional[dict[int, User]]): Users that were already created for previous rows
+
+        Returns:
+            ActiveClaim - A representation of the actively claimed case
+        """
+        return ActiveClaim.decoder(users)(row)
+
+    @staticmethod
+    def decoder(users: Optional[dict[int, User]] = None) -> Callable[[tuple], 'ActiveClaim']:
+        """Returns a function that creates ActiveClaims from rows selected with ActiveClaim.SELECT.
+        Build it once per query: the columns are unpacked by name in SELECT order.
+
+        Args:
+            users (Optional[dict[int, User]]): Users that were already created for previous rows
+
+        Returns:
+            Callable[[tuple], ActiveClaim] - Creates an ActiveClaim from a row
+        """
+        user = User.decoder(users)
+
+        def decode(row: tuple) -> ActiveClaim:
+            (claim_message_id, case_num, claim_time,
+             tech_id, tech_first_name, tech_last_name, tech_team) = row
+
+            return ActiveClaim(claim_message_id, case_num, user(tech_id, tech_first_name, tech_last_name, tech_team), claim_time)
+
+        return decode
+
+    @staticmethod
+    def from_id(pool: StorageBackend, claim_message_id: int) -> Optional['ActiveClaim']:
         """Returns an ActiveClaim (if found) based on a provided claim message id.
 
         Args:
-            connection (MySQLConnection): The connection to the MySQL database
+            pool (StorageBackend): The pool of connections to the database
             claim_message_id (claim_message_id): The id of the message when the case was claimed
 
         Returns:
             ActiveClaim - A representation of the actively claimed case
         """
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT * FROM ActiveClaims WHERE claim_message_id = %s", (claim_message_id,))
+        if ActiveClaim.registry.loaded:
+            return ActiveClaim.registry.by_message_id(claim_message_id)
+
+        with pool.cursor() as cursor:
+            cursor.execute(ActiveClaim.SELECT + " WHERE a.claim_message_id = %s", (claim_message_id,))
             result = cursor.fetchone()
 
-            if result is None:
-                return None
+        if result is None:
+            return None
 
-            return ActiveClaim(result[0], result[1], User.from_id(connection, result[2]), result[3])
+        return ActiveClaim.from_row(result)
 
     @staticmethod
-    def from_case_num(connection: MySQLConnection, case_num: str) -> Optional['ActiveClaim']:
+    def from_case_num(pool: StorageBackend, case_num: str) -> Optional['ActiveClaim']:
         """Returns an ActiveClaim (if found) based on a provided case number
 
         Args:
-            connection (MySQLConnection): The connection to the MySQL database
+            pool (StorageBackend): The pool of connections to the database
             case_num (str): The case number in Salesforce (e.g. "00960979")
 
         Returns:
             ActiveClaim - A representation of the actively claimed case
         """
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT * FROM ActiveClaims WHERE case_num = %s", (case_num,))
+        if ActiveClaim.registry.loaded:
+            return ActiveClaim.registry.by_case_num(case_num)
+
+        with pool.cursor() as cursor:
+            cursor.execute(ActiveClaim.SELECT + " WHERE a.case_num = %s", (case_num,))
             result = cursor.fetchone()
 
-            if result is None:
-                return None
+        if result is None:
+            return None
 
-            return ActiveClaim(result[0], result[1], User.from_id(connection, result[2]), result[3])
+        return ActiveClaim.from_row(result)
 
     @staticmethod
-    def get_all_with_tech_id(connection: MySQLConnection, tech_id: int) -> list['ActiveClaim']:
+    def check_admission(pool: StorageBackend, case_num: str, tech_id: int, window: timedelta) -> tuple[bool, Optional[User], Optional[int]]:
+        """Gathers everything /claim needs to know before a case can be claimed in (at most) a single query:
+        whether the case is already being worked on, whether the tech has joined and who else
+        claimed the case most recently within a window of time.
+
+        Args:
+            pool (StorageBackend): The pool of connections to the database
+            case_num (str): The case number in Salesforce (e.g. "00960979")
+            tech_id (int): The discord ID of the tech that's claiming the case
+            window (timedelta): How far back other claims are looked for (e.g. the last 15 minutes)
+
+        Returns:
+            tuple[bool, Optional[User], Optional[int]] - Whether the case is actively claimed, the tech
+            (None if they haven't joined) and the discord ID of the other tech that claimed it most recently (if any),
+            when the case is actively claimed according to ActiveClaim.registry the database isn't queried
+            and only the first value is set
+        """
+        if ActiveClaim.registry.by_case_num(case_num) is not None:
+            return True, None, None
+
+        since = datetime.now() - window
+
+        # Everything is in memory once the bot has started (the tech is usually in User.cache)
+        if ActiveClaim.registry.loaded and CompletedClaim.recent.covers(window):
+            return False, User.from_id(pool, tech_id), CompletedClaim.recent.latest_other(case_num, tech_id, since)
+
+        recent = ("SELECT r.tech_id FROM ("
+                  "SELECT tech_id, claim_time FROM CompletedClaims WHERE case_num = %s AND tech_id != %s AND claim_time >= %s "
+                  "UNION ALL "
+                  "SELECT tech_id, claim_time FROM CheckedClaims WHERE case_num = %s AND tech_id != %s AND claim_time >= %s"
+                  ") r ORDER BY r.claim_time DESC LIMIT 1")
+
+        sql = (f"SELECT EXISTS(SELECT 1 FROM ActiveClaims WHERE case_num = %s), {User.columns('t')}, ({recent}) "
+               "FROM (SELECT 1) x LEFT JOIN Users t ON t.discord_id = %s")
+        params = (case_num, case_num, tech_id, since, case_num, tech_id, since, tech_id)
+
+        with pool.cursor() as cursor:
+            cursor.execute(sql, params)
+            result = cursor.fetchone()
+
+        tech = User.from_row(result, 1)
+        if tech is not None:
+            User.cache.put(tech.discord_id, tech)
+
+        return bool(result[0]), tech, result[5]
+
+    @staticmethod
+    def get_all_with_tech_id(pool: StorageBackend, tech_id: int) -> list['ActiveClaim']:
         """Returns a list of ActiveClaim that a tech is working on.
 
         Args:
-            connection (MySQLConnection): The connection to the MySQL database
+            pool (StorageBackend): The pool of connections to the database
             tech_id (int): The tech's discord ID number
 
         Returns:
             list[ActiveClaim] - A list of all claims that a tech is working on.
         """
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT * FROM ActiveClaims WHERE tech_id = %s", (tech_id,))
-            results = cursor.fetchall()
+        if ActiveClaim.registry.loaded:
+            return ActiveClaim.registry.by_tech(tech_id)
 
-            data = []
-            for result in results:
-                data.append(ActiveClaim(result[0], result[1], User.from_id(connection, result[2]), result[3]))
+        with pool.cursor() as cursor:
+            cursor.execute(ActiveClaim.SELECT + " WHERE a.tech_id = %s", (tech_id,))
+            results = cursor.fetchall()
 
-            return data
+        return list(map(ActiveClaim.decoder(), results))
 
     @staticmethod
-    def get_all_with_case_num(connection: MySQLConnection, case_num: str) -> list['ActiveClaim']:
+    def get_all_with_case_num(pool: StorageBackend, case_num: str) -> list['ActiveClaim']:
         """Finds all cases with the provided case number and returns the list of them.
 
         Args:
-            connection (MySQLConnection): The connection to the MySQL database
+            pool (StorageBackend): The pool of connections to the database
             case_num (str): The case number in Salesforce (e.g. "00960979")
 
         Returns:
             list[ActiveClaim] - A list of all claims with the same case number
         """
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT * FROM ActiveClaims WHERE case_num = %s", (case_num,))
+        if ActiveClaim.registry.loaded:
+            claim = ActiveClaim.registry.by_case_num(case_num)
+            return [claim] if claim is not None else []
+
+        with pool.cursor() as cursor:
+            cursor.execute(ActiveClaim.SELECT + " WHERE a.case_num = %s", (case_num,))
             results = cursor.fetchall()
 
-            data = []
-            for result in results:
-                data.append(ActiveClaim(result[0], result[1], User.from_id(connection, result[2]), result[3]))
+        return list(map(ActiveClaim.decoder(), results))
+
+    TABLE = "ActiveClaims"
+    INSERT = "INSERT INTO ActiveClaims (claim_message_id, case_num, tech_id, claim_time) VALUES (%s, %s, %s, %s)"
+    DELETE = "DELETE FROM ActiveClaims WHERE claim_message_id = %s"
+
+    def to_row(self) -> tuple:
+        formatted_date = self.claim_time.strftime('%Y-%m-%d %H:%M:%S')
+        return (self.claim_message_id, self.case_num, self.tech.discord_id, formatted_date,)
+
+    def key(self) -> tuple:
+        return (self.claim_message_id,)
+
+    def add_to_database(self, pool: StorageBackend) -> None:
+        with pool.cursor(writes=("ActiveClaims",)) as cursor:
+            cursor.execute(ActiveClaim.INSERT, self.to_row())
+
+        ActiveClaim.registry.add(self)
+
+    def reserve(self, pool: StorageBackend) -> bool:
+        """Inserts the claim before its message has been sent, marked as reserved and with a placeholder
+        claim_message_id (e.g. the ID of the /claim interaction). If someone else claimed the case first,
+        the UNIQUE key on case_num rejects it, so no message has to be sent and deleted again.
+        The real ID is set with attach_message once the message has been sent, reservations that
+        never get one are removed with remove_reservations.
+
+        Args:
+            pool (StorageBackend): The pool of connections to the database
+
+        Returns:
+            bool - Whether or not the case was reserved (False if it's already claimed)
+        """
+        try:
+            with pool.cursor(writes=("ActiveClaims",)) as cursor:
+                sql = "INSERT INTO ActiveClaims (claim_message_id, case_num, tech_id, claim_time, reserved) VALUES (%s, %s, %s, %s, 1)"
+                cursor.execute(sql, self.to_row())
+        except pool.ERRORS as err:
+            if pool.is_duplicate_key(err):
+                return False
+            raise
+
+        ActiveClaim.registry.add(self)
+        return True
+
+    def attach_message(self, pool: StorageBackend, claim_message_id: int) -> None:
+        """Replaces the placeholder claim_message_id of a reserved claim with the ID of its message.
 
-            return data
+        Args:
+            pool (StorageBackend): The pool of connections to the database
+            claim_message_id (int): The id of the message when the case was claimed
+        """
+        with pool.cursor(writes=("ActiveClaims",)) as cursor:
+            cursor.execute("UPDATE ActiveClaims SET claim_message_id = %s, reserved = 0 WHERE claim_message_id = %s",
+                           (claim_message_id, self.claim_message_id,))
+
+        ActiveClaim.registry.move(self, claim_message_id)
+
+    @staticmethod
+    def remove_reservations(pool: StorageBackend) -> int:
+        """Removes the reserved claims whose message was never attached (e.g. because the bot
+        stopped while it was being sent). Only call it before any case can be claimed.
+
+        Args:
+            pool (StorageBackend): The pool of connections to the database
+
+        Returns:
+            int - The amount of reservations that were removed
+        """
+        with pool.cursor(writes=("ActiveClaims",)) as cursor:
+            cursor.execute("DELETE FROM ActiveClaims WHERE reserved = 1")
+            return cursor.rowcount
+
+    def remove_from_database(self, pool: StorageBackend) -> None:
+        with pool.cursor(writes=("ActiveClaims",)) as cursor:
+            cursor.execute(ActiveClaim.DELETE, self.key())
+
+        ActiveClaim.registry.remove(self.claim_message_id)
+
+    @classmethod
+    def add_many(cls, pool: StorageBackend, items: Iterable['ActiveClaim'], batch_size: int = 500) -> int:
+        items = list(items)
+        count = super().add_many(pool, items, batch_size)
 
-    def add_to_database(self, connection: MySQLConnection) -> None:
-        with connection.cursor() as cursor:
-            sql = "INSERT INTO ActiveClaims (claim_message_id, case_num, tech_id, claim_time) VALUES (%s, %s, %s, %s)"
-            formatted_date = self.claim_time.strftime('%Y-%m-%d %H:%M:%S')
-            cursor.execute(sql, (self.claim_message_id, self.case_num, self.tech.discord_id, formatted_date,))
-            connection.commit()
+        for item in items:
+            ActiveClaim.registry.add(item)
 
-    def remove_from_database(self, connection: MySQLConnection) -> None:
-        with connection.cursor() as cursor:
-            sql = "DELETE FROM ActiveClaims WHERE claim_message_id = %s"
-            cursor.execute(sql, (self.claim_message_id,))
-            connection.commit()
+        return count
+
+    @classmethod
+    def remove_many(cls, pool: StorageBackend, items: Iterable['ActiveClaim'], batch_size: int = 500) -> int:
+        items = list(items)
+        count = super().remove_many(pool, items, batch_size)
+
+        for item in items:
+            ActiveClaim.registry.remove(item.claim_message_id)
+
+        return count
 
     @staticmethod
-    def get_all(connection: MySQLConnection) -> list['ActiveClaim']:
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT * FROM ActiveClaims")
+    def get_all(pool: StorageBackend) -> list['ActiveClaim']:
+        with pool.cursor() as cursor:
+            cursor.execute(ActiveClaim.SELECT)
             results = cursor.fetchall()
 
-            data = []
-            for result in results:
-                data.append(ActiveClaim(result[0], result[1], User.from_id(connection, result[2]), result[3]))
-
-            return data
+        return list(map(ActiveClaim.decoder(), results))
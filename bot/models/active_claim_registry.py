@@ -0,0 +1,134 @@
+from threading import Lock
+from typing import Iterable, Optional
+
+# Use TYPE_CHECKING to avoid circular import from active_claim
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from bot.models.active_claim import ActiveClaim
+
+
+class ActiveClaimRegistry:
+    def __init__(self):
+        """Keeps every ActiveClaim in memory, indexed by case number, claim message ID and tech,
+        so that the duplicate checks of /claim, the Complete and Unclaim buttons and /mycases
+        don't have to query the database. It's filled with load() when the bot starts and kept
+        up to date by ActiveClaim.add_to_database and remove_from_database, which only update it
+        after their change was committed. The bot is the only writer of ActiveClaims, and the
+        UNIQUE key on case_num still decides between two claims of the same case.
+
+        Until load() is called nothing is known, so the lookups fall back to the database
+        (see ActiveClaim). The registry is shared by every worker thread, so all access is locked.
+        """
+        self.loaded = False
+
+        self._by_message_id: dict[int, 'ActiveClaim'] = {}
+        self._by_case_num: dict[str, 'ActiveClaim'] = {}
+        self._by_tech: dict[int, dict[int, 'ActiveClaim']] = {}
+        self._lock = Lock()
+
+    def load(self, claims: Iterable['ActiveClaim']) -> None:
+        """Replaces everything in the registry with the claims in the database.
+
+        Args:
+            claims (Iterable[ActiveClaim]): Every row of ActiveClaims
+        """
+        with self._lock:
+            self._by_message_id.clear()
+            self._by_case_num.clear()
+            self._by_tech.clear()
+
+            for claim in claims:
+                self._add(claim)
+
+            self.loaded = True
+
+    def add(self, claim: 'ActiveClaim') -> None:
+        """Adds a claim that was inserted into ActiveClaims.
+
+        Args:
+            claim (ActiveClaim): The claim
+        """
+        with self._lock:
+            self._add(claim)
+
+    def remove(self, claim_message_id: int) -> None:
+        """Removes a claim that was deleted from ActiveClaims.
+
+        Args:
+            claim_message_id (int): The id of the message when the case was claimed
+        """
+        with self._lock:
+            claim = self._by_message_id.pop(claim_message_id, None)
+            if claim is None:
+                return
+
+            if self._by_case_num.get(claim.case_num) is claim:
+                del self._by_case_num[claim.case_num]
+
+            claims = self._by_tech.get(claim.tech.discord_id)
+            if claims is not None:
+                claims.pop(claim_message_id, None)
+                if len(claims) == 0:
+                    del self._by_tech[claim.tech.discord_id]
+
+    def move(self, claim: 'ActiveClaim', claim_message_id: int) -> None:
+        """Changes the claim message ID of a claim in the registry (see ActiveClaim.attach_message).
+
+        Args:
+            claim (ActiveClaim): The claim
+            claim_message_id (int): The new id of the message when the case was claimed
+        """
+        with self._lock:
+            self._by_message_id.pop(claim.claim_message_id, None)
+            claims = self._by_tech.get(claim.tech.discord_id)
+            if claims is not None:
+                claims.pop(claim.claim_message_id, None)
+
+            claim.claim_message_id = claim_message_id
+            self._add(claim)
+
+    def by_message_id(self, claim_message_id: int) -> Optional['ActiveClaim']:
+        """Returns the claim (if any) of a claim message.
+
+        Args:
+            claim_message_id (int): The id of the message when the case was claimed
+
+        Returns:
+            Optional[ActiveClaim] - The claim
+        """
+        with self._lock:
+            return self._by_message_id.get(claim_message_id)
+
+    def by_case_num(self, case_num: str) -> Optional['ActiveClaim']:
+        """Returns the claim (if any) of a case.
+
+        Args:
+            case_num (str): The case number in Salesforce (e.g. "00960979")
+
+        Returns:
+            Optional[ActiveClaim] - The claim
+        """
+        with self._lock:
+            return self._by_case_num.get(case_num)
+
+    def by_tech(self, tech_id: int) -> list['ActiveClaim']:
+        """Returns the claims that a tech is working on.
+
+        Args:
+            tech_id (int): The tech's discord ID number
+
+        Returns:
+            list[ActiveClaim] - The claims
+        """
+        with self._lock:
+            return list(self._by_tech.get(tech_id, {}).values())
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._by_message_id)
+
+    def _add(self, claim: 'ActiveClaim') -> None:
+        self._by_message_id[claim.claim_message_id] = claim
+        self._by_case_num[claim.case_num] = claim
+        self._by_tech.setdefault(claim.tech.discord_id, {})[claim.claim_message_id] = claim
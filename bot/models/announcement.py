@@ -1,5 +1,5 @@
-from mysql.connector import MySQLConnection
-from typing import Optional, Any
+from bot.models.storage_backend import StorageBackend
+from typing import Callable, Optional, Any
 from datetime import datetime
 
 from bot.models.database_item import DatabaseItem
@@ -7,6 +7,10 @@ from bot.models.user import User
 
 
 class Announcement(DatabaseItem):
+    # Selects every column of Announcements with the user joined in from Users (see from_row)
+    SELECT = ("SELECT a.message_id, a.case_message_id, a.title, a.description, a.end_time, a.active, " + User.columns("u") +
+              " FROM Announcements a LEFT JOIN Users u ON u.discord_id = a.user")
+
     def __init__(self, message_id: int, case_message_id: int, title: str, description: str, user: User, end_time: datetime, active: bool):
         """Creates an object representation of a server announcement.
 
@@ -28,102 +32,120 @@ class Announcement(DatabaseItem):
         self.active = active
 
     @staticmethod
-    def from_message_id(connection: MySQLConnection, message_id: int) -> Optional['Announcement']:
+    def from_row(row: tuple, users: Optional[dict[int, User]] = None) -> 'Announcement':
+        """Creates an Announcement from a row selected with Announcement.SELECT.
+
+        Args:
+            row (tuple): The row returned by the database
+            users (Optional[dict[int, User]]): Users that were already created for previous rows
+
+        Returns:
+            Announcement - The announcement stored in the row
+        """
+        return Announcement.decoder(users)(row)
+
+    @staticmethod
+    def decoder(users: Optional[dict[int, User]] = None) -> Callable[[tuple], 'Announcement']:
+        """Returns a function that creates Announcements from rows selected with Announcement.SELECT.
+        Build it once per query: the columns are unpacked by name in SELECT order.
+
+        Args:
+            users (Optional[dict[int, User]]): Users that were already created for previous rows
+
+        Returns:
+            Callable[[tuple], Announcement] - Creates an Announcement from a row
+        """
+        user = User.decoder(users)
+
+        def decode(row: tuple) -> Announcement:
+            (message_id, case_message_id, title, description, end_time, active,
+             user_id, user_first_name, user_last_name, user_team) = row
+
+            return Announcement(message_id, case_message_id, title, description,
+                                user(user_id, user_first_name, user_last_name, user_team), end_time, bool(active))
+
+        return decode
+
+    @staticmethod
+    def from_message_id(pool: StorageBackend, message_id: int) -> Optional['Announcement']:
         """Returns an announcement (if found) with the matching message ID
 
         Args:
-            connection (MySQLConnection): The connection to the MySQL database
+            pool (StorageBackend): The pool of connections to the database
             message_id (int): The announcement message ID
 
         Returns:
             Optional[Announcement] - The announcement that matches with the provided message ID
         """
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT * FROM Announcements WHERE message_id = %s", (message_id,))
+        with pool.cursor() as cursor:
+            cursor.execute(Announcement.SELECT + " WHERE a.message_id = %s", (message_id,))
             result = cursor.fetchone()
 
-            if result is None:
-                return None
+        if result is None:
+            return None
 
-            return Announcement(result[0], result[1], result[2], result[3], User.from_id(connection, result[4]), result[5], bool(result[6]))
+        return Announcement.from_row(result)
 
     @staticmethod
-    def from_case_message_id(connection: MySQLConnection, message_id: int) -> Optional['Announcement']:
+    def from_case_message_id(pool: StorageBackend, message_id: int) -> Optional['Announcement']:
         """Returns an announcement (if found) with the matching case message ID
 
         Args:
-            connection (MySQLConnection): The connection to the MySQL database
+            pool (StorageBackend): The pool of connections to the database
             message_id (int): The case channel message ID
 
         Returns:
             Optional[Announcement] - The announcement that matches with the provided case message ID
         """
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT * FROM Announcements WHERE case_message_id = %s", (message_id,))
+        with pool.cursor() as cursor:
+            cursor.execute(Announcement.SELECT + " WHERE a.case_message_id = %s", (message_id,))
             result = cursor.fetchone()
 
-            if result is None:
-                return None
+        if result is None:
+            return None
 
-            return Announcement(result[0], result[1], result[2], result[3], User.from_id(connection, result[4]), result[5], bool(result[6]))
+        return Announcement.from_row(result)
 
     @staticmethod
-    async def resend(bot):
-        """Deletes any announcements that have expired and edits the announcement message to show that
-        the announcement is no longer active.
+    def get_all_active(pool: StorageBackend) -> list['Announcement']:
+        """Returns every announcement that hasn't been deactivated yet.
 
         Args:
-            bot (Bot): A reference to the original Bot instantiation.
+            pool (StorageBackend): The pool of connections to the database
+
+        Returns:
+            list[Announcement] - The active announcements
         """
-        with bot.connection.cursor() as cursor:
-            cursor.execute("SELECT * FROM Announcements WHERE active = 1")
+        with pool.cursor() as cursor:
+            cursor.execute(Announcement.SELECT + " WHERE a.active = 1")
             results = cursor.fetchall()
 
-            for result in results:
-                ann = Announcement(result[0], result[1], result[2], result[3], User.from_id(bot.connection, result[4]), result[5], result[6])
-
-                if ann.end_time < datetime.now():
-                    # Delete case message
-                    try:
-                        case_channel = await bot.fetch_channel(bot.cases_channel)
-                        case_message = await case_channel.fetch_message(ann.case_message_id)
-                        await case_message.delete()
-                    except:
-                        pass  # message has already been deleted
+        return list(map(Announcement.decoder(), results))
 
-                    ann.deactivate(bot.connection)
-
-    def deactivate(self, connection: MySQLConnection) -> None:
+    def deactivate(self, pool: StorageBackend) -> None:
         """Deactivates the announcement so that it no longer appears in MySQL queries.
 
         Args:
-            connection (MySQLConnection): The connection to the MySQL database
+            pool (StorageBackend): The pool of connections to the database
         """
-        with connection.cursor() as cursor:
-            sql = f"UPDATE Announcements SET active=0 WHERE message_id={self.message_id}"
-            cursor.execute(sql)
-            connection.commit()
+        with pool.cursor(writes=("Announcements",)) as cursor:
+            sql = "UPDATE Announcements SET active=0 WHERE message_id = %s"
+            cursor.execute(sql, (self.message_id,))
 
-    def add_to_database(self, connection: MySQLConnection) -> None:
-        with connection.cursor() as cursor:
+    def add_to_database(self, pool: StorageBackend) -> None:
+        with pool.cursor(writes=("Announcements",)) as cursor:
             sql = "INSERT INTO Announcements (message_id, case_message_id, title, description, user, end_time, active) VALUES (%s, %s, %s, %s, %s, %s, %s)"
             cursor.execute(sql, (self.message_id, self.case_message_id, self.title, self.description, self.user.discord_id, self.end_time, self.active,))
-            connection.commit()
 
-    def remove_from_database(self, connection: MySQLConnection) -> None:
-        with connection.cursor() as cursor:
+    def remove_from_database(self, pool: StorageBackend) -> None:
+        with pool.cursor(writes=("Announcements",)) as cursor:
             sql = "DELETE FROM Announcements WHERE message_id = %s"
             cursor.execute(sql, (self.message_id,))
-            connection.commit()
 
     @staticmethod
-    def get_all(connection: MySQLConnection) -> list['Announcement']:
-        announcements = []
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT * FROM Announcements")
+    def get_all(pool: StorageBackend) -> list['Announcement']:
+        with pool.cursor() as cursor:
+            cursor.execute(Announcement.SELECT)
             results = cursor.fetchall()
 
-            for result in results:
-                announcements.append(Announcement(result[0], result[1], result[2], result[3], User.from_id(connection, result[4]), result[5], bool(result[6])))
-
-        return announcements
+        return list(map(Announcement.decoder(), results))
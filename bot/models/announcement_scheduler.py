@@ -0,0 +1,96 @@
+import asyncio
+import heapq
+from datetime import datetime
+from typing import Iterable, Optional
+
+from bot.models.announcement import Announcement
+
+# Use TYPE_CHECKING to avoid circular import from bot
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from bot.bot import Bot
+
+
+class AnnouncementScheduler:
+    def __init__(self, bot: "Bot"):
+        """Expires every active announcement when its end time is reached: its message in the cases
+        channel is deleted and it's deactivated. The announcements are kept in a min-heap of
+        their end times, so a single task sleeps until the next one expires. It's filled with
+        load() when the bot starts and AnnouncementForm adds every new announcement.
+
+        Args:
+            bot (Bot): A reference to the original Bot instantiation.
+        """
+        self.bot = bot
+
+        # (end time, message ID, announcement) of every active announcement, the next one to expire first
+        self._heap: list[tuple[datetime, int, Announcement]] = []
+        self._changed = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def load(self, announcements: Iterable[Announcement]) -> None:
+        """Replaces every scheduled announcement with the active announcements in the database.
+
+        Args:
+            announcements (Iterable[Announcement]): The active announcements
+        """
+        self._heap = [(ann.end_time, ann.message_id, ann) for ann in announcements]
+        heapq.heapify(self._heap)
+        self._changed.set()
+
+    def add(self, announcement: Announcement) -> None:
+        """Schedules a new announcement to expire at its end time.
+
+        Args:
+            announcement (Announcement): The announcement
+        """
+        heapq.heappush(self._heap, (announcement.end_time, announcement.message_id, announcement))
+        self._changed.set()
+
+    def start(self) -> None:
+        """Starts expiring the announcements (does nothing if it's already running)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="announcement_scheduler")
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    async def _run(self) -> None:
+        while True:
+            self._changed.clear()
+
+            if len(self._heap) == 0:
+                await self._changed.wait()
+                continue
+
+            delay = (self._heap[0][0] - datetime.now()).total_seconds()
+            if delay > 0:
+                # Wake up early if an announcement was added (it might expire sooner)
+                try:
+                    await asyncio.wait_for(self._changed.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            end_time, message_id, ann = heapq.heappop(self._heap)
+            try:
+                await self.expire(ann)
+            except Exception as err:
+                print(f"Error: '{err}' while expiring announcement {message_id}")
+
+    async def expire(self, ann: Announcement) -> None:
+        """Deletes the message of an announcement in the cases channel and deactivates it.
+
+        Args:
+            ann (Announcement): The announcement
+        """
+        # Delete case message
+        try:
+            case_channel = await self.bot.fetch_channel(self.bot.cases_channel)
+            case_message = await case_channel.fetch_message(ann.case_message_id)
+            await case_message.delete()
+        except:
+            pass  # message has already been deleted
+
+        await self.bot.db.run(ann.deactivate)
@@ -0,0 +1,108 @@
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+from weakref import WeakKeyDictionary
+
+from bot.models.storage_backend import StorageBackend
+from bot.models.query_stats import RequestStats, current_request, current_label
+
+T = TypeVar("T")
+
+
+class AsyncDatabase:
+    def __init__(self, pool: StorageBackend, analytics_workers: int = 2, replica: Optional[StorageBackend] = None):
+        """Lets the async parts of the bot (cogs, views, forms and loops) use the model layer
+        without blocking the Discord event loop. Model methods are run in worker threads that
+        each borrow their own connection from the pool.
+
+        Heavy analytics queries get their own, smaller set of workers so that a long report
+        can never take every connection away from /claim and the lead check buttons. When a
+        read replica is configured the analytics queries are sent to it instead of the primary.
+
+        The statements issued by every interaction (or loop) are counted in StorageBackend.stats,
+        labeled with what the interaction was (see bot/request_labels.py) or the name of the task.
+
+        Args:
+            pool (StorageBackend): The pool of connections to the primary database
+            analytics_workers (int): The amount of workers reserved for analytics queries
+            replica (Optional[StorageBackend]): The pool of connections to a read replica (analytics use the primary if None)
+        """
+        self.pool = pool
+        self.replica = replica if replica is not None else pool
+
+        if replica is None:
+            analytics_workers = max(1, min(analytics_workers, pool.size - 1))
+            self._executor = ThreadPoolExecutor(max_workers=max(1, pool.size - analytics_workers), thread_name_prefix="db")
+        else:
+            # The analytics don't use the primary's connections
+            analytics_workers = max(1, min(analytics_workers, replica.size))
+            self._executor = ThreadPoolExecutor(max_workers=pool.size, thread_name_prefix="db")
+
+        self._analytics_executor = ThreadPoolExecutor(max_workers=analytics_workers, thread_name_prefix="db-analytics")
+
+        # The query counter of every task that's using the database
+        self._requests: WeakKeyDictionary[asyncio.Task, RequestStats] = WeakKeyDictionary()
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Runs a model method in a worker thread and waits for the result.
+        The pool is passed in as the first argument (e.g. run(User.from_id, discord_id)
+        calls User.from_id(pool, discord_id) and run(claim.add_to_database) calls
+        claim.add_to_database(pool)).
+
+        Args:
+            func (Callable[..., T]): The model method that will be called
+
+        Returns:
+            T - Whatever the model method returns
+        """
+        return await self._submit(self._executor, self.pool, func, *args, **kwargs)
+
+    async def run_analytics(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Same as run(), but for long-running read-only queries such as the ones used by
+        /report, /evaldata, /heatmap and the leaderboards. The replica pool is passed in,
+        so the model method must not write anything.
+
+        Args:
+            func (Callable[..., T]): The model method that will be called
+
+        Returns:
+            T - Whatever the model method returns
+        """
+        return await self._submit(self._analytics_executor, self.replica, func, *args, **kwargs)
+
+    async def run_maintenance(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Same as run(), but for long-running writes such as rebuilding DailyClaimStats or archiving
+        claims. They use the analytics workers (so they don't hold up /claim) and the primary pool.
+
+        Args:
+            func (Callable[..., T]): The model method that will be called
+
+        Returns:
+            T - Whatever the model method returns
+        """
+        return await self._submit(self._analytics_executor, self.pool, func, *args, **kwargs)
+
+    async def _submit(self, executor: ThreadPoolExecutor, pool: StorageBackend, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        task = asyncio.current_task()
+        request = self._requests.get(task) if task is not None else None
+        if task is not None and request is None:
+            request = self._requests[task] = RequestStats(current_label.get() or task.get_name())
+            task.add_done_callback(lambda _: StorageBackend.stats.record_request(request))
+
+        # Worker threads don't inherit context variables, so the counter is passed along in a copy of the context
+        context = contextvars.copy_context()
+        context.run(current_request.set, request)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, functools.partial(context.run, func, pool, *args, **kwargs))
+
+    def close(self) -> None:
+        """Waits for the running queries to finish and closes the pools."""
+        self._executor.shutdown(wait=True)
+        self._analytics_executor.shutdown(wait=True)
+        self.pool.close()
+
+        if self.replica is not self.pool:
+            self.replica.close()
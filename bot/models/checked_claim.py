@@ -1,15 +1,28 @@
 from datetime import datetime
 
-from mysql.connector import MySQLConnection
-from typing import Optional, Any
+from bot.models.storage_backend import StorageBackend
+from typing import Callable, Iterable, Optional, Any
 
-from bot.models.database_item import DatabaseItem
+from bot.models.database_item import DatabaseItem, BulkWritable
+from bot.models.daily_claim_stats import DailyClaimStats
 from bot.models.user import User
 
 from bot.status import Status
+from bot.helpers.date_range import DateRange
+from bot.models.claim_query import ClaimQuery
 
 
-class CheckedClaim(DatabaseItem):
+class CheckedClaim(BulkWritable):
+    __slots__ = ("checker_message_id", "case_num", "tech", "lead", "claim_time", "complete_time", "check_time", "status", "ping_thread_id")
+
+    # Selects every column of a claims table with the tech and lead joined in from Users (see from_row)
+    SELECT_FROM = ("SELECT c.checker_message_id, c.case_num, c.claim_time, c.complete_time, c.check_time, c.status, c.ping_thread_id, " +
+                   User.columns("t") + ", " + User.columns("l") +
+                   " FROM {} c LEFT JOIN Users t ON t.discord_id = c.tech_id LEFT JOIN Users l ON l.discord_id = c.lead_id")
+    # Only the current semester (and older claims that haven't been archived yet),
+    # use ClaimQuery(archived=True) to include the archived claims
+    SELECT = SELECT_FROM.format("CheckedClaims")
+
     def __init__(self, checker_message_id: int, case_num: str, tech: User, lead: User, claim_time: datetime,
                  complete_time: datetime, check_time: datetime, status: Status, ping_thread_id: Optional[int]):
         """Creates a representation of a case that's been checked by a lead.
@@ -39,382 +52,404 @@ class CheckedClaim(DatabaseItem):
         self.ping_thread_id = ping_thread_id
 
     @staticmethod
-    def from_ping_thread_id(connection: MySQLConnection, ping_thread_id: int) -> Optional['CheckedClaim']:
+    def from_row(row: tuple, users: Optional[dict[int, User]] = None) -> 'CheckedClaim':
+        """Creates a CheckedClaim from a row selected with CheckedClaim.SELECT.
+
+        Args:
+            row (tuple): The row returned by the database
+            users (Optional[dict[int, User]]): Users that were already created for previous rows
+
+        Returns:
+            CheckedClaim - A representation of a checked case
+        """
+        return CheckedClaim.decoder(users)(row)
+
+    @staticmethod
+    def decoder(users: Optional[dict[int, User]] = None) -> Callable[[tuple], 'CheckedClaim']:
+        """Returns a function that creates CheckedClaims from rows selected with CheckedClaim.SELECT.
+        Build it once per query: the columns are unpacked by name in SELECT order and everything the
+        rows need (the status lookup and the users that were already created) is bound to it.
+
+        Args:
+            users (Optional[dict[int, User]]): Users that were already created for previous rows
+
+        Returns:
+            Callable[[tuple], CheckedClaim] - Creates a CheckedClaim from a row
+        """
+        status_from_str = Status.from_str
+        user = User.decoder(users)
+
+        def decode(row: tuple) -> CheckedClaim:
+            (checker_message_id, case_num, claim_time, complete_time, check_time, status, ping_thread_id,
+             tech_id, tech_first_name, tech_last_name, tech_team,
+             lead_id, lead_first_name, lead_last_name, lead_team) = row
+
+            return CheckedClaim(checker_message_id, case_num,
+                                user(tech_id, tech_first_name, tech_last_name, tech_team),
+                                user(lead_id, lead_first_name, lead_last_name, lead_team),
+                                claim_time, complete_time, check_time, status_from_str(status), ping_thread_id)
+
+        return decode
+
+    @staticmethod
+    def from_ping_thread_id(pool: StorageBackend, ping_thread_id: int) -> Optional['CheckedClaim']:
         """Returns a CheckedClaim (if found) based on a ping thread id.
 
         Args:
-            connection (MySQLConnection): The connection to the MySQL database
+            pool (StorageBackend): The pool of connections to the database
             ping_thread_id (int): The ID of the ping thread
 
         Returns:
             Optional[CheckedClaim] - A representation of a checked case
         """
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT * FROM CheckedClaims WHERE ping_thread_id = %s", (ping_thread_id,))
+        with pool.cursor() as cursor:
+            cursor.execute(CheckedClaim.SELECT + " WHERE c.ping_thread_id = %s", (ping_thread_id,))
             result = cursor.fetchone()
 
-            if result is None:
-                return None
+        if result is None:
+            return None
 
-            return CheckedClaim(result[0], result[1], User.from_id(connection, result[2]),
-                                User.from_id(connection, result[3]),
-                                result[4], result[5], result[6], Status.from_str(result[7]), result[8])
+        return CheckedClaim.from_row(result)
 
     @staticmethod
-    def from_checker_message_id(connection: MySQLConnection, checker_message_id: int) -> Optional['CheckedClaim']:
+    def from_checker_message_id(pool: StorageBackend, checker_message_id: int) -> Optional['CheckedClaim']:
         """Returns a CheckedClaim (if found) based on a checker message id.
 
         Args:
-            connection (MySQLConnection): The connection to the MySQL database
+            pool (StorageBackend): The pool of connections to the database
             checker_message_id (int): The ID of the ping thread
 
         Returns:
             Optional[CheckedClaim] - A representation of a checked case
         """
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT * FROM CheckedClaims WHERE checker_message_id = %s", (checker_message_id,))
+        with pool.cursor() as cursor:
+            cursor.execute(CheckedClaim.SELECT + " WHERE c.checker_message_id = %s", (checker_message_id,))
             result = cursor.fetchone()
 
-            if result is None:
-                return None
+        if result is None:
+            return None
 
-            return CheckedClaim(result[0], result[1], User.from_id(connection, result[2]),
-                                User.from_id(connection, result[3]),
-                                result[4], result[5], result[6], Status.from_str(result[7]), result[8])
+        return CheckedClaim.from_row(result)
 
     @staticmethod
-    def get_all_with_tech_id(connection: MySQLConnection, tech_id: int) -> list['CheckedClaim']:
-        """Returns a list of CheckedClaim based on a tech id.
+    def get_all_with_tech_id(pool: StorageBackend, tech_id: int) -> list['CheckedClaim']:
+        """Returns a list of CheckedClaim (archived claims included) based on a tech id.
 
         Args:
-            connection (MySQLConnection): The connection to the MySQL database
+            pool (StorageBackend): The pool of connections to the database
             tech_id (int): The discord ID of the tech
 
         Returns:
             list[CheckedClaim] - A list of checked cases
         """
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT * FROM CheckedClaims WHERE tech_id = %s", (tech_id,))
-            results = cursor.fetchall()
-
-            tech = User.from_id(connection, tech_id)
+        return CheckedClaim.find(pool, ClaimQuery(include_test_cases=True, archived=True).where("c.tech_id = %s", tech_id))
 
-            data = []
-            users = {}
-            for result in results:
-                # Find tech
-                if result[3] in users:
-                    lead = users[result[3]]
-                else:
-                    lead = User.from_id(connection, result[3])
-                    users[result[3]] = lead
+    @staticmethod
+    def get_all_in_range(pool: StorageBackend, date_range: DateRange) -> list['CheckedClaim']:
+        """Returns a list of CheckedClaim that were claimed within a range of time.
 
-                data.append(CheckedClaim(result[0], result[1], tech, lead, result[4], result[5], result[6], Status.from_str(result[7]), result[8]))
+        Args:
+            pool (StorageBackend): The pool of connections to the database
+            date_range (DateRange): The range of time (e.g. a month, a semester or the last 30 days)
 
-            return data
+        Returns:
+            list[CheckedClaim] - A list of checked cases
+        """
+        return CheckedClaim.find(pool, ClaimQuery().claimed_in(date_range))
 
     @staticmethod
-    def get_all_from_year(connection: MySQLConnection, year: int) -> list['CheckedClaim']:
+    def get_all_from_year(pool: StorageBackend, year: int) -> list['CheckedClaim']:
         """Returns a list of CheckedClaim in a year.
 
         Args:
-            connection (MySQLConnection): The connection to the MySQL database
+            pool (StorageBackend): The pool of connections to the database
             year (int): The year (e.g. 2023)
 
         Returns:
             list[CheckedClaim] - A list of checked cases
         """
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT * FROM CheckedClaims WHERE YEAR(claim_time) = %s", (year,))
-            results = cursor.fetchall()
-
-            data = []
-            users = {}
-            for result in results:
-                if result[1] == '12341234':
-                    continue
-
-                # Find tech
-                if result[2] in users:
-                    tech = users[result[2]]
-                else:
-                    tech = User.from_id(connection, result[2])
-                    users[result[2]] = tech
-
-                # Find lead
-                if result[3] in users:
-                    lead = users[result[3]]
-                else:
-                    lead = User.from_id(connection, result[3])
-                    users[result[3]] = lead
-
-                data.append(CheckedClaim(result[0], result[1], tech, lead, result[4], result[5], result[6],
-                                         Status.from_str(result[7]), result[8]))
-
-            return data
+        return CheckedClaim.get_all_in_range(pool, DateRange.year(year))
 
     @staticmethod
-    def get_all_from_month(connection: MySQLConnection, month: int, year: int) -> list['CheckedClaim']:
+    def get_all_from_month(pool: StorageBackend, month: int, year: int) -> list['CheckedClaim']:
         """Returns a list of CheckedClaim in a month.
 
         Args:
-            connection (MySQLConnection): The connection to the MySQL database
+            pool (StorageBackend): The pool of connections to the database
             month (int): The month (e.g. 10 for October)
             year (int): The year (e.g. 2023)
         Returns:
             list[CheckedClaim] - A list of checked cases
         """
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT * FROM CheckedClaims WHERE YEAR(claim_time) = %s AND MONTH(claim_time) = %s", (year, month,))
-            results = cursor.fetchall()
-
-            data = []
-            users = {}
-            for result in results:
-                if result[1] == '12341234':
-                    continue
-
-                # Find tech
-                if result[2] in users:
-                    tech = users[result[2]]
-                else:
-                    tech = User.from_id(connection, result[2])
-                    users[result[2]] = tech
-
-                # Find lead
-                if result[3] in users:
-                    lead = users[result[3]]
-                else:
-                    lead = User.from_id(connection, result[3])
-                    users[result[3]] = lead
-
-                data.append(CheckedClaim(result[0], result[1], tech, lead, result[4], result[5], result[6],
-                                         Status.from_str(result[7]), result[8]))
-
-            return data
+        return CheckedClaim.get_all_in_range(pool, DateRange.month(month, year))
 
     @staticmethod
-    def get_all_with_case_num(connection: MySQLConnection, case_num: str) -> list['CheckedClaim']:
+    def get_all_with_case_num(pool: StorageBackend, case_num: str, archived: bool = False) -> list['CheckedClaim']:
         """Returns a list of CheckedClaim based on a case number.
         
         Args:
-            connection (MySQLConnection): The connection to the MySQL database
+            pool (StorageBackend): The pool of connections to the database
             case_num (str): The case number in Salesforce (e.g. "00960979")
+            archived (bool): Whether or not claims from closed semesters are included (default: false)
 
         Returns:
             list[CheckedClaim] - A list of checked cases
         """
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT * FROM CheckedClaims WHERE case_num = %s", (case_num,))
-            results = cursor.fetchall()
-
-            data = []
-            for result in results:
-                data.append(CheckedClaim(result[0], result[1], User.from_id(connection, result[2]),
-                                         User.from_id(connection, result[3]),
-                                         result[4], result[5], result[6], Status.from_str(result[7]), result[8]))
-
-            return data
+        return CheckedClaim.find(pool, ClaimQuery(include_test_cases=True, archived=archived).case_num(case_num))
 
-    def add_ping_thread(self, connection: MySQLConnection, ping_thread_id: int) -> None:
+    def add_ping_thread(self, pool: StorageBackend, ping_thread_id: int) -> None:
         """Updates the database to include a provided ping thread ID.
 
         Args:
-            connection (MySQLConnection): The connection to the MySQL database
+            pool (StorageBackend): The pool of connections to the database
             ping_thread_id (int): The ID of the ping thread created
         """
-        with connection.cursor() as cursor:
+        with pool.cursor(writes=("CheckedClaims",)) as cursor:
             sql = "UPDATE CheckedClaims SET ping_thread_id=%s WHERE checker_message_id=%s"
             cursor.execute(sql, (ping_thread_id, self.checker_message_id,))
-            connection.commit()
 
-    def update_lead(self, connection: MySQLConnection, lead_id: int) -> None:
+    def update_lead(self, pool: StorageBackend, lead_id: int) -> None:
         """Updates the database to include a provided lead user ID.
 
         Args:
-            connection (MySQLConnection): The connection to the MySQL database
+            pool (StorageBackend): The pool of connections to the database
             lead_is (int): The ID of the lead
         """
-        with connection.cursor() as cursor:
+        with pool.cursor(writes=("CheckedClaims", "DailyClaimStats")) as cursor:
+            DailyClaimStats.track(cursor, [self.checker_message_id], -1)
+
             sql = "UPDATE CheckedClaims SET `lead_id`=%s WHERE checker_message_id=%s"
             cursor.execute(sql, (lead_id, self.checker_message_id,))
-            connection.commit()
 
-    def change_status(self, connection: MySQLConnection, new_status: Status):
+            DailyClaimStats.track(cursor, [self.checker_message_id], 1)
+
+    def change_status(self, pool: StorageBackend, new_status: Status):
         """Changes the status of a CheckedClaim in the database
         
         Args:
-            connection (MySQLConnection): The connection to the MySQL database 
+            pool (StorageBackend): The pool of connections to the database
             new_status (Status): The new status that the CheckedClaim will have
         """
-        with connection.cursor() as cursor:
+        with pool.cursor(writes=("CheckedClaims", "DailyClaimStats")) as cursor:
+            DailyClaimStats.track(cursor, [self.checker_message_id], -1)
+
             if new_status == Status.CHECKED:
                 sql = "UPDATE CheckedClaims SET ping_thread_id = %s WHERE checker_message_id=%s"
                 cursor.execute(sql, (None, self.checker_message_id,))
 
             sql = "UPDATE CheckedClaims SET status = %s WHERE checker_message_id=%s"
             cursor.execute(sql, (new_status, self.checker_message_id,))
-            connection.commit()
+
+            DailyClaimStats.track(cursor, [self.checker_message_id], 1)
 
     @staticmethod
-    def search(connection: MySQLConnection, user: Optional[User] = None, year: Optional[int] = None, month: Optional[int] = None, status: Status = None) -> list['CheckedClaim']:
+    def search(pool: StorageBackend, user: Optional[User] = None, year: Optional[int] = None, month: Optional[int] = None, status: Status = None,
+               date_range: Optional[DateRange] = None) -> list['CheckedClaim']:
         """Searches the list of CheckedClaims based on the specified parameters.
         
         Args:
-            connection (MySQLConnection): The connection to the MySQL database 
+            pool (StorageBackend): The pool of connections to the database
             user (Optional[User]): The user that worked on the CheckedClaim
+            year (Optional[int]): The year of the month (the current year by default)
             month (Optional[int]): The month that the CheckedClaim was claimed in
             status (Status): The status of the case
+            date_range (Optional[DateRange]): Any other range of time that the CheckedClaim was claimed in
 
         Returns:
             list[CheckedClaim] - A list of CheckedClaims matching the parameters
         """
-        sql = "SELECT * FROM CheckedClaims WHERE 1=1"
+        # Without a range of time every claim is searched
+        query = ClaimQuery(archived=month is None and date_range is None)
 
         if user is not None:
-            sql += f" AND tech_id = {user.discord_id}"
+            query.tech(user)
 
         if month is not None:
             if year is None:
                 year = datetime.now().year
 
-            beginning = f"'{year}-{month}-1 00:00:00'"
+            query.claimed_in(DateRange.month(month, year))
 
-            match month:
-                case 1 | 3 | 5 | 7 | 8 | 10 | 12:
-                    end = 31
-                case 4 | 6 | 9 | 11:
-                    end = 30
-                case 2:
-                    end = 28
-            ending = f"'{year}-{month}-{end} 23:59:59'"
-            sql += f" AND claim_time BETWEEN {beginning} AND {ending}"
+        if date_range is not None:
+            query.claimed_in(date_range)
 
         if status is not None:
             if status == Status.PINGED or status == Status.RESOLVED:
-                sql += f" AND (`status` = '{status}' OR `status` = '{Status.RESOLVED}')"
+                query.status(status, Status.RESOLVED)
             else:
-                sql += f" AND `status` = '{status}'"
+                query.status(status)
+
+        return CheckedClaim.find(pool, query)
 
-        with connection.cursor(buffered=True) as cursor:
-            cursor.execute(sql)
+    @staticmethod
+    def find(pool: StorageBackend, query: ClaimQuery) -> list['CheckedClaim']:
+        """Returns the CheckedClaims matching a query.
+
+        Args:
+            pool (StorageBackend): The pool of connections to the database
+            query (ClaimQuery): The filters, order and limit of the query
+
+        Returns:
+            list[CheckedClaim] - A list of CheckedClaims matching the query
+        """
+        if query.projected:
+            raise ValueError("Use CheckedClaim.find_rows for queries that only select some columns")
+
+        sql, params = query.build(CheckedClaim.SELECT_FROM)
+
+        with pool.cursor() as cursor:
+            cursor.execute(sql, params)
             results = cursor.fetchall()
 
-            data = []
-            users = {}
-            for result in results:
-                if result[1] == '12341234':
-                    continue
-
-                # Find tech
-                if result[2] in users:
-                    tech = users[result[2]]
-                else:
-                    tech = User.from_id(connection, result[2])
-                    users[result[2]] = tech
-
-                # Find lead
-                if result[3] in users:
-                    lead = users[result[3]]
-                else:
-                    lead = User.from_id(connection, result[3])
-                    users[result[3]] = lead
-
-                data.append(CheckedClaim(result[0], result[1], tech, lead, result[4], result[5], result[6], Status.from_str(result[7]), result[8]))
-            return data
+        return list(map(CheckedClaim.decoder(), results))
 
     @staticmethod
-    def find_latest_case(connection: MySQLConnection, user: User, case_num: str) -> Optional['CheckedClaim']:
+    def find_rows(pool: StorageBackend, query: ClaimQuery) -> list[tuple]:
+        """Returns the raw rows matching a query, which is cheaper than building CheckedClaims
+        when only a few columns are needed (see ClaimQuery.columns).
+
+        Args:
+            pool (StorageBackend): The pool of connections to the database
+            query (ClaimQuery): The columns, filters, order and limit of the query
+
+        Returns:
+            list[tuple] - The selected columns of every matching row
+        """
+        sql, params = query.build()
+
+        with pool.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchall()
+
+    @staticmethod
+    def find_latest_case(pool: StorageBackend, user: User, case_num: str) -> Optional['CheckedClaim']:
         """Finds the latest non-pinged case from the user with the case_num provided.
 
         Args:
-            connection (MySQLConnection): The connection to the MySQL database
+            pool (StorageBackend): The pool of connections to the database
             user (User): The tech responsible for the case
             case_num (str): The case number in Salesforce
 
         Returns:
             Optional[CheckedClaim] - The CheckedClaim (if it can be found)
         """
-        with connection.cursor(buffered=True) as cursor:
-            sql = "SELECT * FROM CheckedClaims WHERE tech_id=%s AND case_num=%s AND status != %s"
+        with pool.cursor() as cursor:
+            sql = CheckedClaim.SELECT + " WHERE c.tech_id=%s AND c.case_num=%s AND c.status != %s"
             cursor.execute(sql, (user.discord_id, case_num, Status.PINGED,))
             result = cursor.fetchone()
 
-            if result is not None and len(result) != 0:
-                return CheckedClaim(result[0], result[1], User.from_id(connection, result[2]),
-                                    User.from_id(connection, result[3]),
-                                    result[4], result[5], result[6], Status.from_str(result[7]), result[8])
-            else:
-                return None
-
-    def add_to_database(self, connection: MySQLConnection) -> None:
-        with connection.cursor() as cursor:
-            sql = "INSERT INTO CheckedClaims (checker_message_id, case_num, tech_id, lead_id, claim_time, complete_time, check_time, status, ping_thread_id) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)"
-            formatted_claim_time = self.claim_time.strftime('%Y-%m-%d %H:%M:%S')
-            formatted_complete_time = self.complete_time.strftime('%Y-%m-%d %H:%M:%S')
-            formatted_check_time = self.check_time.strftime('%Y-%m-%d %H:%M:%S')
-
-            cursor.execute(sql, (
-            self.checker_message_id, self.case_num, self.tech.discord_id, self.lead.discord_id, formatted_claim_time,
-            formatted_complete_time, formatted_check_time, self.status, self.ping_thread_id))
-            connection.commit()
-
-    def remove_from_database(self, connection: MySQLConnection) -> None:
-        with connection.cursor() as cursor:
-            sql = "DELETE FROM CheckedClaims WHERE checker_message_id = %s"
-            cursor.execute(sql, (self.checker_message_id,))
-            connection.commit()
+        if result is not None and len(result) != 0:
+            return CheckedClaim.from_row(result)
+        else:
+            return None
+
+    TABLE = "CheckedClaims"
+    INSERT = "INSERT INTO CheckedClaims (checker_message_id, case_num, tech_id, lead_id, claim_time, complete_time, check_time, status, ping_thread_id) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)"
+    DELETE = "DELETE FROM CheckedClaims WHERE checker_message_id = %s"
+
+    def to_row(self) -> tuple:
+        formatted_claim_time = self.claim_time.strftime('%Y-%m-%d %H:%M:%S')
+        formatted_complete_time = self.complete_time.strftime('%Y-%m-%d %H:%M:%S')
+        formatted_check_time = self.check_time.strftime('%Y-%m-%d %H:%M:%S')
+
+        return (self.checker_message_id, self.case_num, self.tech.discord_id, self.lead.discord_id, formatted_claim_time,
+                formatted_complete_time, formatted_check_time, self.status, self.ping_thread_id)
+
+    def key(self) -> tuple:
+        return (self.checker_message_id,)
+
+    def add_to_database(self, pool: StorageBackend) -> None:
+        with pool.cursor(writes=("CheckedClaims", "DailyClaimStats")) as cursor:
+            cursor.execute(CheckedClaim.INSERT, self.to_row())
+            DailyClaimStats.track(cursor, [self.checker_message_id], 1)
+
+    def remove_from_database(self, pool: StorageBackend) -> None:
+        with pool.cursor(writes=("CheckedClaims", "DailyClaimStats")) as cursor:
+            DailyClaimStats.track(cursor, [self.checker_message_id], -1)
+            cursor.execute(CheckedClaim.DELETE, self.key())
+
+    @classmethod
+    def add_many(cls, pool: StorageBackend, items: Iterable['CheckedClaim'], batch_size: int = 500) -> int:
+        items = list(items)
+        with pool.cursor(writes=("CheckedClaims", "DailyClaimStats")) as cursor:
+            count = DatabaseItem.execute_batches(cursor, CheckedClaim.INSERT, (item.to_row() for item in items), batch_size)
+            DailyClaimStats.track(cursor, [item.checker_message_id for item in items], 1, batch_size)
+
+        return count
+
+    @classmethod
+    def remove_many(cls, pool: StorageBackend, items: Iterable['CheckedClaim'], batch_size: int = 500) -> int:
+        items = list(items)
+        with pool.cursor(writes=("CheckedClaims", "DailyClaimStats")) as cursor:
+            DailyClaimStats.track(cursor, [item.checker_message_id for item in items], -1, batch_size)
+            return DatabaseItem.execute_batches(cursor, CheckedClaim.DELETE, (item.key() for item in items), batch_size)
 
     @staticmethod
-    def get_all(connection: MySQLConnection) -> list['CheckedClaim']:
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT * FROM CheckedClaims")
-            results = cursor.fetchall()
+    def change_status_many(pool: StorageBackend, claims: list['CheckedClaim'], new_status: Status, batch_size: int = 500) -> int:
+        """Changes the status of many CheckedClaims at once (e.g. for bulk lead actions).
 
-            data = []
-            users = {}  # Memoization for next for loop
-            for result in results:
-                # Find tech
-                if result[2] in users:
-                    tech = users[result[2]]
-                else:
-                    tech = User.from_id(connection, result[2])
-                    users[result[2]] = tech
+        Args:
+            pool (StorageBackend): The pool of connections to the database
+            claims (list[CheckedClaim]): The claims that will be updated
+            new_status (Status): The new status of the claims
+            batch_size (int): The amount of rows sent to the server at once
 
-                # Find lead
-                if result[3] in users:
-                    lead = users[result[3]]
-                else:
-                    lead = User.from_id(connection, result[3])
-                    users[result[3]] = lead
+        Returns:
+            int - The amount of rows that were updated
+        """
+        checker_message_ids = [claim.checker_message_id for claim in claims]
+
+        with pool.cursor(writes=("CheckedClaims", "DailyClaimStats")) as cursor:
+            DailyClaimStats.track(cursor, checker_message_ids, -1, batch_size)
+
+            sql = "UPDATE CheckedClaims SET status = %s WHERE checker_message_id = %s"
+            count = DatabaseItem.execute_batches(cursor, sql, ((str(new_status), checker_message_id) for checker_message_id in checker_message_ids), batch_size)
 
-                data.append(CheckedClaim(result[0], result[1], tech, lead, result[4], result[5], result[6], Status.from_str(result[7]), result[8]))
+            DailyClaimStats.track(cursor, checker_message_ids, 1, batch_size)
 
-            return data
+        for claim in claims:
+            claim.status = new_status
+
+        return count
 
     @staticmethod
-    def get_all_leaderboard(connection: MySQLConnection, year: int) -> list['CheckedClaim']:
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT * FROM CheckedClaims WHERE status != %s AND YEAR(claim_time) = %s AND case_num != '12341234'", (str(Status.DONE), year,))
+    def get_all(pool: StorageBackend) -> list['CheckedClaim']:
+        with pool.cursor() as cursor:
+            cursor.execute(CheckedClaim.SELECT)
             results = cursor.fetchall()
 
-            data = []
-            users = {}  # Memoization for next for loop
-            for result in results:
-                # Find tech
-                if result[2] in users:
-                    tech = users[result[2]]
-                else:
-                    tech = User.from_id(connection, result[2])
-                    users[result[2]] = tech
-
-                # Find lead
-                if result[3] in users:
-                    lead = users[result[3]]
-                else:
-                    lead = User.from_id(connection, result[3])
-                    users[result[3]] = lead
-
-                data.append(CheckedClaim(result[0], result[1], tech, lead, result[4], result[5], result[6], Status.from_str(result[7]), result[8]))
-
-            return data
+        return list(map(CheckedClaim.decoder(), results))
+
+    @staticmethod
+    def archive(pool: StorageBackend, before: datetime, batch_size: int = 500) -> int:
+        """Moves the claims that were claimed before a time (usually the start of the current semester)
+        from CheckedClaims to CheckedClaimsArchive. Every batch is copied and deleted in its own
+        transaction. Pinged claims stay until they're resolved, since their ping threads still use them.
+
+        Args:
+            pool (StorageBackend): The pool of connections to the database
+            before (datetime): The claims claimed before this time are archived
+            batch_size (int): The amount of claims moved per transaction
+
+        Returns:
+            int - The amount of claims that were archived
+        """
+        count = 0
+        while True:
+            with pool.cursor(writes=("CheckedClaims", "CheckedClaimsArchive")) as cursor:
+                sql = "SELECT checker_message_id FROM CheckedClaims WHERE claim_time < %s AND status != %s ORDER BY claim_time LIMIT %s FOR UPDATE"
+                cursor.execute(sql, (before, str(Status.PINGED), batch_size,))
+                checker_message_ids = tuple(result[0] for result in cursor.fetchall())
+
+                if len(checker_message_ids) == 0:
+                    return count
+
+                placeholders = ", ".join(["%s"] * len(checker_message_ids))
+                cursor.execute(f"INSERT INTO CheckedClaimsArchive SELECT * FROM CheckedClaims WHERE checker_message_id IN ({placeholders})", checker_message_ids)
+                cursor.execute(f"DELETE FROM CheckedClaims WHERE checker_message_id IN ({placeholders})", checker_message_ids)
+
+                count += len(checker_message_ids)
+
+    @staticmethod
+    def get_all_leaderboard(pool: StorageBackend, year: int) -> list['CheckedClaim']:
+        return CheckedClaim.find(pool, ClaimQuery().claimed_in(DateRange.year(year)).exclude_status(Status.DONE))
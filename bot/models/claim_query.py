@@ -0,0 +1,209 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from bot.models.user import User
+from bot.helpers.date_range import DateRange
+from bot.status import Status
+
+
+class ClaimQuery:
+    # Columns of CheckedClaims that can be projected and ordered by
+    COLUMNS = ("checker_message_id", "case_num", "tech_id", "lead_id", "claim_time",
+               "complete_time", "check_time", "status", "ping_thread_id")
+
+    def __init__(self, include_test_cases: bool = False, archived: bool = False):
+        """Builds a parameterized query on the CheckedClaims table (aliased as c). Every filter is
+        sent as a bound parameter, so the SQL text only depends on which filters are used and
+        the server can reuse its plan. Filters can be chained:
+
+            ClaimQuery().tech(user).status(Status.PINGED).claimed_in(DateRange.month(2, 2024)).limit(50)
+
+        Claims from closed semesters are moved to CheckedClaimsArchive (see CheckedClaim.archive),
+        queries that reach back before the current semester read both tables. The filters are
+        applied to each table separately (instead of to the AllCheckedClaims view), so MySQL never
+        has to materialize both tables in full.
+
+        Args:
+            include_test_cases (bool): Whether or not the test case (12341234) is included in the results
+            archived (bool): Whether or not archived claims are included (time filters turn this on
+                when they start before the current semester)
+        """
+        self.archived = archived
+
+        self._columns: Optional[tuple[str, ...]] = None
+        self._conditions: list[str] = []
+        self._params: list[Any] = []
+        self._order: list[str] = []
+        self._limit: Optional[int] = None
+
+        if not include_test_cases:
+            self._conditions.append("c.case_num != '12341234'")
+
+    def columns(self, *columns: str) -> 'ClaimQuery':
+        """Only selects some columns (see CheckedClaim.find_rows).
+
+        Args:
+            columns (str): The names of the columns (e.g. "claim_time", "lead_id")
+        """
+        for column in columns:
+            ClaimQuery._check_column(column)
+
+        self._columns = columns
+        return self
+
+    def tech(self, user: User) -> 'ClaimQuery':
+        """Only includes claims worked on by a tech.
+
+        Args:
+            user (User): The tech
+        """
+        return self.where("c.tech_id = %s", user.discord_id)
+
+    def lead(self, user: User) -> 'ClaimQuery':
+        """Only includes claims checked by a lead.
+
+        Args:
+            user (User): The lead
+        """
+        return self.where("c.lead_id = %s", user.discord_id)
+
+    def case_num(self, case_num: str) -> 'ClaimQuery':
+        """Only includes claims of a case.
+
+        Args:
+            case_num (str): The case number
+        """
+        return self.where("c.case_num = %s", case_num)
+
+    def status(self, *statuses: Status) -> 'ClaimQuery':
+        """Only includes claims with one of the statuses.
+
+        Args:
+            statuses (Status): The statuses to include
+        """
+        placeholders = ", ".join(["%s"] * len(statuses))
+        return self.where(f"c.`status` IN ({placeholders})", *[str(status) for status in statuses])
+
+    def exclude_status(self, *statuses: Status) -> 'ClaimQuery':
+        """Leaves out claims with any of the statuses.
+
+        Args:
+            statuses (Status): The statuses to leave out
+        """
+        placeholders = ", ".join(["%s"] * len(statuses))
+        return self.where(f"c.`status` NOT IN ({placeholders})", *[str(status) for status in statuses])
+
+    def claimed_in(self, date_range: DateRange) -> 'ClaimQuery':
+        """Only includes claims that were claimed within a range of time.
+
+        Args:
+            date_range (DateRange): The range of time
+        """
+        self._include_archive_before(date_range.start)
+
+        condition, params = date_range.sql("c.claim_time")
+        return self.where(condition, *params)
+
+    def claimed_after(self, t: datetime) -> 'ClaimQuery':
+        """Only includes claims that were claimed after a certain time.
+
+        Args:
+            t (datetime): The time
+        """
+        self._include_archive_before(t)
+        return self.where("c.claim_time > %s", t)
+
+    def after(self, claim_time: datetime, checker_message_id: int) -> 'ClaimQuery':
+        """Keyset pagination: only includes claims that come after the last claim of the previous page
+        (ordered by claim time and then checker message ID). Combine with limit().
+
+        Args:
+            claim_time (datetime): The claim time of the last claim of the previous page
+            checker_message_id (int): The checker message ID of the last claim of the previous page
+        """
+        self._order = ["c.claim_time", "c.checker_message_id"]
+        return self.where("(c.claim_time > %s OR (c.claim_time = %s AND c.checker_message_id > %s))",
+                          claim_time, claim_time, checker_message_id)
+
+    def where(self, condition: str, *params: Any) -> 'ClaimQuery':
+        """Adds a custom condition (that only uses %s placeholders for its values).
+
+        Args:
+            condition (str): The condition (e.g. "c.lead_id != %s")
+            params (Any): The values of the placeholders
+        """
+        self._conditions.append(condition)
+        self._params.extend(params)
+        return self
+
+    def order_by(self, column: str, descending: bool = False) -> 'ClaimQuery':
+        """Orders the results by a column (can be called multiple times).
+
+        Args:
+            column (str): The name of the column
+            descending (bool): Whether or not the largest values come first
+        """
+        ClaimQuery._check_column(column)
+
+        self._order.append(f"c.{column}{' DESC' if descending else ''}")
+        return self
+
+    def limit(self, limit: int) -> 'ClaimQuery':
+        """Limits the amount of results.
+
+        Args:
+            limit (int): The maximum amount of claims
+        """
+        self._limit = int(limit)
+        return self
+
+    @property
+    def projected(self) -> bool:
+        """Whether or not only some columns are selected."""
+        return self._columns is not None
+
+    def build(self, select: Optional[str] = None) -> tuple[str, tuple]:
+        """Returns the SQL and its parameters.
+
+        Args:
+            select (Optional[str]): The SELECT ... FROM {} c part of the query, where {} is replaced
+                by the searched table (the projected columns are used when this isn't provided)
+
+        Returns:
+            tuple[str, tuple] - The SQL and the parameters that should be passed to cursor.execute
+        """
+        if select is None:
+            columns = self._columns if self._columns is not None else ClaimQuery.COLUMNS
+            select = "SELECT " + ", ".join(f"c.{column}" for column in columns) + " FROM {} c"
+
+        where = ""
+        if len(self._conditions) != 0:
+            where = " WHERE " + " AND ".join(self._conditions)
+
+        if self.archived:
+            # Both tables are filtered before they're combined
+            sql = select.format(f"(SELECT * FROM CheckedClaims c{where} UNION ALL SELECT * FROM CheckedClaimsArchive c{where})")
+            params = self._params * 2
+        else:
+            sql = select.format("CheckedClaims") + where
+            params = list(self._params)
+
+        if len(self._order) != 0:
+            sql += " ORDER BY " + ", ".join(self._order)
+
+        if self._limit is not None:
+            sql += " LIMIT %s"
+            params.append(self._limit)
+
+        return sql, tuple(params)
+
+    def _include_archive_before(self, t: datetime) -> None:
+        # Claims older than the current semester may have been archived
+        if t.replace(tzinfo=None) < DateRange.semester(datetime.now()).start:
+            self.archived = True
+
+    @staticmethod
+    def _check_column(column: str) -> None:
+        # Column names can't be bound as parameters, so only known columns are accepted
+        if column not in ClaimQuery.COLUMNS:
+            raise ValueError(f"Unknown CheckedClaims column: {column}")
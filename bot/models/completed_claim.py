@@ -1,12 +1,26 @@
 from datetime import datetime
-from mysql.connector import MySQLConnection
-from typing import Optional, Any
+from bot.models.storage_backend import StorageBackend
+from typing import Callable, Iterable, Optional, Any
 
-from bot.models.database_item import DatabaseItem
+from bot.models.database_item import BulkWritable
+from bot.models.checked_claim import CheckedClaim
+from bot.models.daily_claim_stats import DailyClaimStats
+from bot.models.recent_claims import RecentClaims
 from bot.models.user import User
 
+from bot.status import Status
+
+
+class CompletedClaim(BulkWritable):
+    __slots__ = ("checker_message_id", "case_num", "tech", "claim_time", "complete_time")
+
+    # The claims of the last 15 minutes for the re-claim warning of /claim, once they're loaded when the bot starts
+    recent: RecentClaims = RecentClaims()
+
+    # Selects every column of CompletedClaims with the tech joined in from Users (see from_row)
+    SELECT = ("SELECT c.checker_message_id, c.case_num, c.claim_time, c.complete_time, " + User.columns("t") +
+              " FROM CompletedClaims c LEFT JOIN Users t ON t.discord_id = c.tech_id")
 
-class CompletedClaim(DatabaseItem):
     def __init__(self, checker_message_id: int, case_num: str, tech: User, claim_time: datetime, complete_time: datetime):
         """Creates a representation of a case that's been completed.
 
@@ -24,92 +38,193 @@ class CompletedClaim(DatabaseItem):
         self.complete_time = complete_time
 
     @staticmethod
-    def from_id(connection: MySQLConnection, checker_message_id: int) -> Optional['CompletedClaim']:
+    def from_row(row: tuple, users: Optional[dict[int, User]] = None) -> 'CompletedClaim':
+        """Creates a CompletedClaim from a row selected with CompletedClaim.SELECT.
+
+        Args:
+            row (tuple): The row returned by the database
+            users (Optional[dict[int, User]]): Users that were already created for previous rows
+
+        Returns:
+            CompletedClaim - A representation of a completed case
+        """
+        return CompletedClaim.decoder(users)(row)
+
+    @staticmethod
+    def decoder(users: Optional[dict[int, User]] = None) -> Callable[[tuple], 'CompletedClaim']:
+        """Returns a function that creates CompletedClaims from rows selected with CompletedClaim.SELECT.
+        Build it once per query: the columns are unpacked by name in SELECT order.
+
+        Args:
+            users (Optional[dict[int, User]]): Users that were already created for previous rows
+
+        Returns:
+            Callable[[tuple], CompletedClaim] - Creates a CompletedClaim from a row
+        """
+        user = User.decoder(users)
+
+        def decode(row: tuple) -> CompletedClaim:
+            (checker_message_id, case_num, claim_time, complete_time,
+             tech_id, tech_first_name, tech_last_name, tech_team) = row
+
+            return CompletedClaim(checker_message_id, case_num, user(tech_id, tech_first_name, tech_last_name, tech_team),
+                                  claim_time, complete_time)
+
+        return decode
+
+    @staticmethod
+    def from_id(pool: StorageBackend, checker_message_id: int) -> Optional['CompletedClaim']:
         """Returns a CompletedClaim (if found) based on a provided checker message id.
 
         Args:
-            connection (MySQLConnection): The connection to the MySQL database
+            pool (StorageBackend): The pool of connections to the database
             checker_message_id (int): The id of the checker message when the case was claimed
 
         Returns:
             Optional[CompletedClaim] - A representation of a completed case
         """
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT * FROM CompletedClaims WHERE checker_message_id = %s", (checker_message_id,))
+        with pool.cursor() as cursor:
+            cursor.execute(CompletedClaim.SELECT + " WHERE c.checker_message_id = %s", (checker_message_id,))
             result = cursor.fetchone()
 
-            if result is None:
-                return None
+        if result is None:
+            return None
 
-            return CompletedClaim(result[0], result[1], User.from_id(connection, result[2]), result[3], result[4])
+        return CompletedClaim.from_row(result)
 
     @staticmethod
-    def get_all_with_tech_id(connection: MySQLConnection, tech_id: int) -> list['CompletedClaim']:
+    def get_all_with_tech_id(pool: StorageBackend, tech_id: int) -> list['CompletedClaim']:
         """Returns a CompletedClaim (if found) based on a provided user id.
 
         Args:
-            connection (MySQLConnection): The connection to the MySQL database
+            pool (StorageBackend): The pool of connections to the database
             tech_id (int): The discord ID of a user
 
         Returns:
             list[CompletedClaim] - A representation of a completed case
         """
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT * FROM CompletedClaims WHERE tech_id = %s", (tech_id,))
+        with pool.cursor() as cursor:
+            cursor.execute(CompletedClaim.SELECT + " WHERE c.tech_id = %s", (tech_id,))
             results = cursor.fetchall()
 
-            data = []
-            for result in results:
-                data.append(CompletedClaim(result[0], result[1], User.from_id(connection, result[2]), result[3], result[4]))
-
-            return data
+        return list(map(CompletedClaim.decoder(), results))
 
     @staticmethod
-    def get_all_with_case_num(connection: MySQLConnection, case_num: str) -> list['CompletedClaim']:
+    def get_all_with_case_num(pool: StorageBackend, case_num: str) -> list['CompletedClaim']:
         """Returns a list of CompletedClaims with a provided case number.
 
         Args:
-            connection (MySQLConnection): The connection to the MySQL database
+            pool (StorageBackend): The pool of connections to the database
             case_num (str): The case number in Salesforce (e.g. "00960979")
 
         Returns:
             list[CompletedClaim] - A representation of a completed case
         """
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT * FROM CompletedClaims WHERE case_num = %s", (case_num,))
+        with pool.cursor() as cursor:
+            cursor.execute(CompletedClaim.SELECT + " WHERE c.case_num = %s", (case_num,))
             results = cursor.fetchall()
 
-            data = []
-            for result in results:
-                data.append(
-                    CompletedClaim(result[0], result[1], User.from_id(connection, result[2]), result[3], result[4]))
+        return list(map(CompletedClaim.decoder(), results))
+
+    @staticmethod
+    def get_claimed_since(pool: StorageBackend, since: datetime) -> list[tuple[int, str, int, datetime]]:
+        """Returns every completed or checked claim that was claimed since a certain time
+        (used to fill CompletedClaim.recent).
+
+        Args:
+            pool (StorageBackend): The pool of connections to the database
+            since (datetime): The time
+
+        Returns:
+            list[tuple[int, str, int, datetime]] - The checker message ID, case number, tech ID and claim time of each claim
+        """
+        with pool.cursor() as cursor:
+            sql = ("SELECT checker_message_id, case_num, tech_id, claim_time FROM CompletedClaims WHERE claim_time >= %s "
+                   "UNION ALL "
+                   "SELECT checker_message_id, case_num, tech_id, claim_time FROM CheckedClaims WHERE claim_time >= %s")
+            cursor.execute(sql, (since, since,))
+            return cursor.fetchall()
+
+    def promote(self, pool: StorageBackend, lead: User, status: Status, ping_thread_id: Optional[int] = None) -> Optional[CheckedClaim]:
+        """Moves the case from CompletedClaims to CheckedClaims after a lead has checked it.
+        The row is copied with INSERT ... SELECT and then deleted in the same transaction
+        (which also adds it to DailyClaimStats), so the case is never lost or duplicated
+        if something fails in between.
+
+        Args:
+            pool (StorageBackend): The pool of connections to the database
+            lead (User): The lead that checked the case
+            status (Status): The status of the checked case
+            ping_thread_id (Optional[int]): The ID of the comment/kudos/ping thread (if there is one)
+
+        Returns:
+            Optional[CheckedClaim] - The checked case (None if the case was already moved by someone else)
+        """
+        check_time = datetime.now()
+
+        with pool.cursor(writes=("CompletedClaims", "CheckedClaims", "DailyClaimStats")) as cursor:
+            sql = ("INSERT INTO CheckedClaims (checker_message_id, case_num, tech_id, lead_id, claim_time, complete_time, check_time, status, ping_thread_id) "
+                   "SELECT checker_message_id, case_num, tech_id, %s, claim_time, complete_time, %s, %s, %s FROM CompletedClaims WHERE checker_message_id = %s")
+            cursor.execute(sql, (lead.discord_id, check_time.strftime('%Y-%m-%d %H:%M:%S'), str(status), ping_thread_id, self.checker_message_id,))
+
+            if cursor.rowcount == 0:
+                return None
+
+            DailyClaimStats.track(cursor, [self.checker_message_id], 1)
+            cursor.execute("DELETE FROM CompletedClaims WHERE checker_message_id = %s", (self.checker_message_id,))
 
-            return data
+        return CheckedClaim(self.checker_message_id, self.case_num, self.tech, lead, self.claim_time,
+                            self.complete_time, check_time, status, ping_thread_id)
 
-    def add_to_database(self, connection: MySQLConnection) -> None:
-        with connection.cursor() as cursor:
-            sql = "INSERT INTO CompletedClaims (checker_message_id, case_num, tech_id, claim_time, complete_time) VALUES (%s, %s, %s, %s, %s)"
-            formatted_claim_time = self.claim_time.strftime('%Y-%m-%d %H:%M:%S')
-            formatted_complete_time = self.complete_time.strftime('%Y-%m-%d %H:%M:%S')
-            
-            cursor.execute(sql, (self.checker_message_id, self.case_num, self.tech.discord_id, formatted_claim_time, formatted_complete_time,))
-            connection.commit()
+    TABLE = "CompletedClaims"
+    INSERT = "INSERT INTO CompletedClaims (checker_message_id, case_num, tech_id, claim_time, complete_time) VALUES (%s, %s, %s, %s, %s)"
+    DELETE = "DELETE FROM CompletedClaims WHERE checker_message_id = %s"
 
-    def remove_from_database(self, connection: MySQLConnection) -> None:
-        with connection.cursor() as cursor:
-            sql = "DELETE FROM CompletedClaims WHERE checker_message_id = %s"
-            cursor.execute(sql, (self.checker_message_id,))
-            connection.commit()
+    def to_row(self) -> tuple:
+        formatted_claim_time = self.claim_time.strftime('%Y-%m-%d %H:%M:%S')
+        formatted_complete_time = self.complete_time.strftime('%Y-%m-%d %H:%M:%S')
+
+        return (self.checker_message_id, self.case_num, self.tech.discord_id, formatted_claim_time, formatted_complete_time,)
+
+    def key(self) -> tuple:
+        return (self.checker_message_id,)
+
+    def add_to_database(self, pool: StorageBackend) -> None:
+        with pool.cursor(writes=("CompletedClaims",)) as cursor:
+            cursor.execute(CompletedClaim.INSERT, self.to_row())
+
+        CompletedClaim.recent.add(self.checker_message_id, self.case_num, self.tech.discord_id, self.claim_time)
+
+    def remove_from_database(self, pool: StorageBackend) -> None:
+        with pool.cursor(writes=("CompletedClaims",)) as cursor:
+            cursor.execute(CompletedClaim.DELETE, self.key())
+
+        CompletedClaim.recent.remove(self.checker_message_id, self.case_num)
+
+    @classmethod
+    def add_many(cls, pool: StorageBackend, items: Iterable['CompletedClaim'], batch_size: int = 500) -> int:
+        items = list(items)
+        count = super().add_many(pool, items, batch_size)
+
+        for item in items:
+            CompletedClaim.recent.add(item.checker_message_id, item.case_num, item.tech.discord_id, item.claim_time)
+
+        return count
+
+    @classmethod
+    def remove_many(cls, pool: StorageBackend, items: Iterable['CompletedClaim'], batch_size: int = 500) -> int:
+        items = list(items)
+        count = super().remove_many(pool, items, batch_size)
+
+        for item in items:
+            CompletedClaim.recent.remove(item.checker_message_id, item.case_num)
+
+        return count
 
     @staticmethod
-    def get_all(connection: MySQLConnection) -> list['CompletedClaim']:
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT * FROM CompletedClaims")
+    def get_all(pool: StorageBackend) -> list['CompletedClaim']:
+        with pool.cursor() as cursor:
+            cursor.execute(CompletedClaim.SELECT)
             results = cursor.fetchall()
 
-            data = []
-            for result in results:
-                data.append(
-                    CompletedClaim(result[0], result[1], User.from_id(connection, result[2]), result[3], result[4]))
-
-            return data
+        return list(map(CompletedClaim.decoder(), results))
@@ -0,0 +1,46 @@
+from typing import Any, Sequence
+
+import mysql.connector
+from mysql.connector import MySQLConnection, Error, IntegrityError, errorcode
+from mysql.connector.cursor import MySQLCursor
+
+from bot.models.storage_backend import StorageBackend
+
+
+class ConnectionPool(StorageBackend):
+    ERRORS = (Error,)
+
+    def __init__(self, db_config: dict[str, Any], size: int = 5, timeout: float = 10.0, pre_ping: bool = True,
+                 fill_cache: bool = True):
+        """Creates a pool of connections to the MySQL database. Connections are only opened
+        when they're needed (up to size of them) and are pinged whenever they are checked out,
+        so a connection that was dropped by the server is reopened instead of failing the query.
+
+        Args:
+            db_config (dict[str, Any]): The arguments passed to mysql.connector.connect
+            size (int): The maximum amount of connections that can be open at once
+            timeout (float): The amount of seconds to wait for a free connection before giving up
+            pre_ping (bool): Whether or not connections are pinged before they're handed out
+            fill_cache (bool): Whether or not read results are stored in the shared query cache (False for a read replica)
+        """
+        super().__init__(size, timeout, fill_cache)
+        self.db_config = db_config
+        self.pre_ping = pre_ping
+
+    def _connect(self) -> MySQLConnection:
+        return mysql.connector.connect(**self.db_config)
+
+    def _open_cursor(self, connection: MySQLConnection, buffered: bool, writes: Sequence[str], **kwargs) -> MySQLCursor:
+        # mysql.connector starts a transaction with the first statement
+        return connection.cursor(buffered=buffered, **kwargs)
+
+    def _revive(self, connection: MySQLConnection) -> None:
+        if self.pre_ping:
+            connection.ping(reconnect=True, attempts=3, delay=1)
+
+    def is_duplicate_key(self, err: Exception) -> bool:
+        return isinstance(err, IntegrityError) and err.errno == errorcode.ER_DUP_ENTRY
+
+    def is_already_applied(self, err: Exception) -> bool:
+        return isinstance(err, Error) and err.errno in (errorcode.ER_TABLE_EXISTS_ERROR, errorcode.ER_DUP_FIELDNAME,
+                                                        errorcode.ER_DUP_KEYNAME, errorcode.ER_CANT_DROP_FIELD_OR_KEY)
@@ -0,0 +1,256 @@
+from datetime import datetime, timedelta
+from typing import Iterable, Optional, Sequence
+
+from mysql.connector.cursor import MySQLCursor
+
+from bot.models.storage_backend import StorageBackend
+from bot.models.database_item import DatabaseItem
+
+from bot.status import Status
+from bot.helpers.date_range import DateRange
+
+
+class DailyClaimStats:
+    """The DailyClaimStats table is a rollup of CheckedClaims: one row per day, tech, lead and status
+    with the amount of claims and their summed completion and check times. The analytics read it in
+    O(days x people) instead of scanning every claim. Every method that changes CheckedClaims calls
+    track() (or apply()) with its own cursor, so the rollup is changed in the same transaction.
+    """
+
+    # The columns of CheckedClaims that a claim's share of the rollup is computed from (see contribution)
+    COLUMNS = "c.case_num, c.tech_id, c.lead_id, c.status, c.claim_time, c.complete_time, c.check_time"
+
+    # Uses a row alias instead of VALUES(), which MySQL 8.0.20+ warns about (and warnings raise, see main.py)
+    UPSERT = ("INSERT INTO DailyClaimStats (day, tech_id, lead_id, status, claims, completion_seconds, check_seconds) "
+              "VALUES (%s, %s, %s, %s, %s, %s, %s) AS new "
+              "ON DUPLICATE KEY UPDATE claims = claims + new.claims, "
+              "completion_seconds = completion_seconds + new.completion_seconds, "
+              "check_seconds = check_seconds + new.check_seconds")
+
+    @staticmethod
+    def bucket(claim_time: datetime) -> datetime:
+        """Returns the start of the bucket that a claim is counted in. Buckets are days, except on the
+        day that a semester starts in the middle of (see DateRange.semester), which is split in two so
+        that a month or semester always covers whole buckets.
+
+        Args:
+            claim_time (datetime): The time that the case was claimed
+
+        Returns:
+            datetime - The start of the bucket
+        """
+        day = datetime(claim_time.year, claim_time.month, claim_time.day)
+
+        semester_start = DateRange.semester(claim_time).start
+        if semester_start > day:
+            return semester_start
+
+        return day
+
+    @staticmethod
+    def contribution(row: Sequence) -> Optional[tuple[datetime, int, int, str, int, int]]:
+        """Returns what a claim adds to the rollup.
+
+        Args:
+            row (Sequence): The DailyClaimStats.COLUMNS of the claim
+
+        Returns:
+            Optional[tuple[datetime, int, int, str, int, int]] - The bucket, tech ID, lead ID, status,
+            completion seconds and check seconds (None for the test case and unknown statuses, which aren't counted)
+        """
+        case_num, tech_id, lead_id, status, claim_time, complete_time, check_time = row
+        if case_num == "12341234":
+            return None
+
+        status = Status.from_str(status)
+        if status is None:
+            return None
+
+        complete_diff = complete_time - claim_time
+        check_diff = check_time - complete_time
+
+        return (DailyClaimStats.bucket(claim_time), tech_id, lead_id, str(status),
+                complete_diff.seconds + (complete_diff.days * 86400), check_diff.seconds + (check_diff.days * 86400))
+
+    @staticmethod
+    def apply(cursor: MySQLCursor, rows: Iterable[Sequence], sign: int) -> None:
+        """Adds claims to (sign = 1) or removes claims from (sign = -1) the rollup.
+
+        Args:
+            cursor (MySQLCursor): The cursor of the transaction that changes the claims
+            rows (Iterable[Sequence]): The DailyClaimStats.COLUMNS of every claim
+            sign (int): 1 when the claims were added, -1 when they were removed
+        """
+        totals: dict[tuple, list[int]] = {}
+        for row in rows:
+            contribution = DailyClaimStats.contribution(row)
+            if contribution is None:
+                continue
+
+            total = totals.setdefault(contribution[:4], [0, 0, 0])
+            total[0] += sign
+            total[1] += sign * contribution[4]
+            total[2] += sign * contribution[5]
+
+        if len(totals) == 0:
+            return
+
+        DatabaseItem.execute_batches(cursor, DailyClaimStats.UPSERT, (key + tuple(total) for key, total in totals.items()))
+
+        if sign < 0:
+            # Don't leave empty rows behind
+            sql = "DELETE FROM DailyClaimStats WHERE day = %s AND tech_id = %s AND lead_id = %s AND status = %s AND claims = 0"
+            DatabaseItem.execute_batches(cursor, sql, totals.keys())
+
+    @staticmethod
+    def track(cursor: MySQLCursor, checker_message_ids: Sequence[int], sign: int, chunk_size: int = 500) -> None:
+        """Adds the current state of some CheckedClaims to (sign = 1) or removes it from (sign = -1) the rollup.
+        Call it with -1 before changing the claims and with 1 afterward. The rows are locked
+        until the transaction ends so that the claims can't change in between.
+
+        Args:
+            cursor (MySQLCursor): The cursor of the transaction that changes the claims
+            checker_message_ids (Sequence[int]): The checker message IDs of the claims
+            sign (int): 1 to add the claims, -1 to remove them
+            chunk_size (int): The maximum amount of IDs sent in a single query
+        """
+        rows = []
+        for i in range(0, len(checker_message_ids), chunk_size):
+            chunk = tuple(checker_message_ids[i:i + chunk_size])
+            placeholders = ", ".join(["%s"] * len(chunk))
+            cursor.execute(f"SELECT {DailyClaimStats.COLUMNS} FROM CheckedClaims c WHERE c.checker_message_id IN ({placeholders}) FOR UPDATE", chunk)
+            rows.extend(cursor.fetchall())
+
+        DailyClaimStats.apply(cursor, rows, sign)
+
+    @staticmethod
+    def rebuild(pool: StorageBackend, date_range: Optional[DateRange] = None, batch_size: int = 500) -> int:
+        """Recounts the rollup from the current and archived claims (e.g. to backfill it after the table is created).
+        The claims are grouped by hour in MySQL, which keeps every bucket boundary intact, and
+        the claims in the range are locked until the new counts are written.
+
+        Args:
+            pool (StorageBackend): The pool of connections to the database
+            date_range (Optional[DateRange]): The range that will be recounted, made of whole buckets
+                like a year, month or semester (everything by default)
+            batch_size (int): The amount of rows sent to the server at once
+
+        Returns:
+            int - The amount of rows written to DailyClaimStats
+        """
+        sql = ("SELECT DATE(c.claim_time), HOUR(c.claim_time), c.tech_id, c.lead_id, c.status, COUNT(*), "
+               "SUM(TIMESTAMPDIFF(SECOND, c.claim_time, c.complete_time)), SUM(TIMESTAMPDIFF(SECOND, c.complete_time, c.check_time)) "
+               "FROM {} c WHERE c.case_num != '12341234'")
+        params = ()
+        if date_range is not None:
+            condition, params = date_range.sql("c.claim_time")
+            sql += " AND " + condition
+
+        sql += " GROUP BY DATE(c.claim_time), HOUR(c.claim_time), c.tech_id, c.lead_id, c.status FOR UPDATE"
+
+        with pool.cursor(writes=("DailyClaimStats",)) as cursor:
+            totals: dict[tuple, list[int]] = {}
+
+            # Locking reads can't go through the AllCheckedClaims view, so both tables are read separately
+            for table in ("CheckedClaims", "CheckedClaimsArchive"):
+                cursor.execute(sql.format(table), params)
+
+                for day, hour, tech_id, lead_id, status, claims, completion_seconds, check_seconds in cursor.fetchall():
+                    status = Status.from_str(status)
+                    if status is None:
+                        continue  # Unknown statuses aren't counted (see contribution)
+
+                    hour_start = datetime(day.year, day.month, day.day) + timedelta(hours=hour)
+                    key = (DailyClaimStats.bucket(hour_start), tech_id, lead_id, str(status))
+
+                    total = totals.setdefault(key, [0, 0, 0])
+                    total[0] += int(claims)
+                    total[1] += int(completion_seconds)
+                    total[2] += int(check_seconds)
+
+            if date_range is None:
+                cursor.execute("DELETE FROM DailyClaimStats")
+            else:
+                condition, params = date_range.sql("day")
+                cursor.execute("DELETE FROM DailyClaimStats WHERE " + condition, params)
+
+            return DatabaseItem.execute_batches(cursor, DailyClaimStats.UPSERT,
+                                                (key + tuple(total) for key, total in totals.items()), batch_size)
+
+    @staticmethod
+    def count_by_tech(pool: StorageBackend, semester: DateRange, month: DateRange) -> list[tuple[int, Optional[int], int, int, int, int]]:
+        """Counts the (non-done) claims of every tech in a semester and in a month of that semester.
+
+        Args:
+            pool (StorageBackend): The pool of connections to the database
+            semester (DateRange): The range of the semester
+            month (DateRange): The range of the month
+
+        Returns:
+            list[tuple[int, Optional[int], int, int, int, int]] - The tech ID, team ID, month claims, semester claims,
+            month pings and semester pings of every tech
+        """
+        semester_condition, semester_params = semester.sql("s.day")
+        month_condition, month_params = month.sql("s.day")
+        pinged = (str(Status.PINGED), str(Status.RESOLVED))
+
+        sql = ("SELECT s.tech_id, t.team, "
+               f"SUM(IF({month_condition}, s.claims, 0)), SUM(s.claims), "
+               f"SUM(IF({month_condition} AND s.status IN (%s, %s), s.claims, 0)), SUM(IF(s.status IN (%s, %s), s.claims, 0)) "
+               "FROM DailyClaimStats s LEFT JOIN Users t ON t.discord_id = s.tech_id "
+               f"WHERE {semester_condition} AND s.status != %s "
+               "GROUP BY s.tech_id, t.team")
+        params = month_params + month_params + pinged + pinged + semester_params + (str(Status.DONE),)
+
+        data = []
+        for result in pool.fetchall_cached(sql, params, ("DailyClaimStats", "Users")):
+            data.append((result[0], result[1], int(result[2]), int(result[3]), int(result[4]), int(result[5])))
+
+        return data
+
+    @staticmethod
+    def count_by_lead(pool: StorageBackend, semester: DateRange, month: DateRange) -> list[tuple[int, str, int, int]]:
+        """Counts the claims that every lead checked with each status in a semester and in a month of that semester.
+
+        Args:
+            pool (StorageBackend): The pool of connections to the database
+            semester (DateRange): The range of the semester
+            month (DateRange): The range of the month
+
+        Returns:
+            list[tuple[int, str, int, int]] - The lead ID, status, month claims and semester claims
+        """
+        semester_condition, semester_params = semester.sql("s.day")
+        month_condition, month_params = month.sql("s.day")
+
+        sql = (f"SELECT s.lead_id, s.status, SUM(IF({month_condition}, s.claims, 0)), SUM(s.claims) "
+               f"FROM DailyClaimStats s WHERE {semester_condition} GROUP BY s.lead_id, s.status")
+
+        data = []
+        for result in pool.fetchall_cached(sql, month_params + semester_params, ("DailyClaimStats",)):
+            data.append((result[0], result[1], int(result[2]), int(result[3])))
+
+        return data
+
+    @staticmethod
+    def count_by_pair(pool: StorageBackend, date_range: DateRange) -> list[tuple[int, int, str, int, int, int]]:
+        """Counts the claims of every tech and lead pair with each status in a range of time.
+
+        Args:
+            pool (StorageBackend): The pool of connections to the database
+            date_range (DateRange): The range of time (made of whole buckets, e.g. a year or a month)
+
+        Returns:
+            list[tuple[int, int, str, int, int, int]] - The tech ID, lead ID, status, claims,
+            summed completion seconds and summed check seconds
+        """
+        condition, params = date_range.sql("s.day")
+
+        sql = ("SELECT s.tech_id, s.lead_id, s.status, SUM(s.claims), SUM(s.completion_seconds), SUM(s.check_seconds) "
+               f"FROM DailyClaimStats s WHERE {condition} GROUP BY s.tech_id, s.lead_id, s.status")
+
+        data = []
+        for result in pool.fetchall_cached(sql, params, ("DailyClaimStats",)):
+            data.append((result[0], result[1], result[2], int(result[3]), int(result[4]), int(result[5])))
+
+        return data
@@ -1,18 +1,131 @@
 from abc import ABC, abstractmethod
-from mysql.connector import MySQLConnection
+from typing import Iterable, Sequence
+
+from mysql.connector.cursor import MySQLCursor
+
+from bot.models.storage_backend import StorageBackend
 
 
 # The abstract class to represent all items in the database
 class DatabaseItem(ABC):
+    # Empty so that subclasses with __slots__ don't get a __dict__
+    __slots__ = ()
+
+    @abstractmethod
+    def add_to_database(self, pool: StorageBackend) -> None:
+        pass
+
     @abstractmethod
-    def add_to_database(self, connection: MySQLConnection) -> None:
+    def remove_from_database(self, pool: StorageBackend) -> None:
         pass
 
+    @staticmethod
     @abstractmethod
-    def remove_from_database(self, connection: MySQLConnection) -> None:
+    def get_all(pool: StorageBackend) -> list['DatabaseItem']:
         pass
 
     @staticmethod
+    def execute_many(pool: StorageBackend, sql: str, params: Iterable[Sequence], batch_size: int = 500, writes: Sequence[str] = ()) -> int:
+        """Runs a statement with many sets of parameters using executemany (which turns an
+        INSERT ... VALUES into a single multi-row INSERT per batch). Everything is committed
+        together at the end, or rolled back if any batch fails.
+
+        Args:
+            pool (StorageBackend): The pool of connections to the database
+            sql (str): The INSERT, UPDATE or DELETE statement
+            params (Iterable[Sequence]): The parameters of every row
+            batch_size (int): The amount of rows sent to the server at once
+            writes (Sequence[str]): The tables that the statement changes (see StorageBackend.cursor)
+
+        Returns:
+            int - The amount of rows that were affected
+        """
+        if not sql:
+            raise ValueError("The statement is empty")
+
+        with pool.cursor(writes=writes) as cursor:
+            return DatabaseItem.execute_batches(cursor, sql, params, batch_size)
+
+    @staticmethod
+    def execute_batches(cursor: MySQLCursor, sql: str, params: Iterable[Sequence], batch_size: int = 500) -> int:
+        """Same as execute_many, but uses a cursor that's already open so the statements
+        become part of the caller's transaction.
+
+        Args:
+            cursor (MySQLCursor): The cursor of the transaction
+            sql (str): The INSERT, UPDATE or DELETE statement
+            params (Iterable[Sequence]): The parameters of every row
+            batch_size (int): The amount of rows sent to the server at once
+
+        Returns:
+            int - The amount of rows that were affected
+        """
+        count = 0
+        batch = []
+        for row in params:
+            batch.append(tuple(row))
+            if len(batch) == batch_size:
+                cursor.executemany(sql, batch)
+                count += cursor.rowcount
+                batch = []
+
+        if len(batch) != 0:
+            cursor.executemany(sql, batch)
+            count += cursor.rowcount
+
+        return count
+
+
+# The abstract class to represent items that can be inserted many at once
+class BulkAddable(DatabaseItem):
+    __slots__ = ()
+
+    # The INSERT statement used by add_many and the table it writes to
+    TABLE: str
+    INSERT: str
+
+    @abstractmethod
+    def to_row(self) -> tuple:
+        """Returns the parameters of the model's INSERT statement."""
+        pass
+
+    @classmethod
+    def add_many(cls, pool: StorageBackend, items: Iterable['BulkAddable'], batch_size: int = 500) -> int:
+        """Inserts many items at once (e.g. CheckedClaim.add_many(pool, claims)).
+
+        Args:
+            pool (StorageBackend): The pool of connections to the database
+            items (Iterable[BulkAddable]): The items that will be inserted
+            batch_size (int): The amount of rows sent to the server at once
+
+        Returns:
+            int - The amount of rows that were inserted
+        """
+        return DatabaseItem.execute_many(pool, cls.INSERT, (item.to_row() for item in items), batch_size, (cls.TABLE,))
+
+
+# The abstract class to represent items that can be inserted and deleted many at once
+class BulkWritable(BulkAddable):
+    __slots__ = ()
+
+    # The DELETE statement used by remove_many
+    DELETE: str
+
     @abstractmethod
-    def get_all(connection: MySQLConnection) -> list['DatabaseItem']:
+    def key(self) -> tuple:
+        """Returns the parameters of the model's DELETE statement (its primary key)."""
         pass
+
+    @classmethod
+    def remove_many(cls, pool: StorageBackend, items: Iterable['BulkWritable'], batch_size: int = 500) -> int:
+        """Deletes many items at once.
+
+        Args:
+            pool (StorageBackend): The pool of connections to the database
+            items (Iterable[BulkWritable]): The items that will be deleted
+            batch_size (int): The amount of rows sent to the server at once
+
+        Returns:
+            int - The amount of rows that were deleted
+        """
+        return DatabaseItem.execute_many(pool, cls.DELETE, (item.key() for item in items), batch_size, (cls.TABLE,))
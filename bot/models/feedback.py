@@ -1,10 +1,12 @@
-from mysql.connector import MySQLConnection
+from bot.models.storage_backend import StorageBackend
 from typing import Optional
 
-from bot.models.database_item import DatabaseItem
+from bot.models.database_item import BulkWritable
 
 
-class Feedback(DatabaseItem):
+class Feedback(BulkWritable):
+    __slots__ = ("thread_id", "message_id", "severity", "description")
+
     def __init__(self, thread_id: int, message_id: int, severity: str, description: str):
         """Creates a Feedback object to store data such as severity and description.
 
@@ -20,65 +22,71 @@ class Feedback(DatabaseItem):
         self.description = description
 
     @staticmethod
-    def from_thread_id(connection: MySQLConnection, thread_id: int) -> Optional['Feedback']:
+    def from_thread_id(pool: StorageBackend, thread_id: int) -> Optional['Feedback']:
         """Returns a Ping/kudo (if found) based on a provided thread id.
 
         Args:
-            connection (MySQLConnection): The connection to the MySQL database
+            pool (StorageBackend): The pool of connections to the database
             thread_id (int): The id of the thread
 
         Returns:
             Optional[Feedback] - A representation of a ping/kudo
         """
-        with connection.cursor() as cursor:
+        with pool.cursor() as cursor:
             cursor.execute("SELECT * FROM Feedback WHERE thread_id = %s", (thread_id,))
             result = cursor.fetchone()
 
-            if result is None:
-                return None
+        if result is None:
+            return None
 
-            return Feedback(result[0], result[1], result[2], result[3])
+        return Feedback(result[0], result[1], result[2], result[3])
 
     @staticmethod
-    def from_message_id(connection: MySQLConnection, message_id: int) -> Optional['Feedback']:
+    def from_message_id(pool: StorageBackend, message_id: int) -> Optional['Feedback']:
         """Returns a Ping (if found) based on a provided message id.
 
         Args:
-            connection (MySQLConnection): The connection to the MySQL database
+            pool (StorageBackend): The pool of connections to the database
             message_id (int): The id of the message containing the ping information
 
         Returns:
             Optional[Ping] - A representation of a ping
         """
-        with connection.cursor() as cursor:
+        with pool.cursor() as cursor:
             cursor.execute("SELECT * FROM Feedback WHERE message_id = %s", (message_id,))
             result = cursor.fetchone()
 
-            if result is None:
-                return None
+        if result is None:
+            return None
+
+        return Feedback(result[0], result[1], result[2], result[3])
+
+    TABLE = "Feedback"
+    INSERT = "INSERT INTO Feedback (thread_id, message_id, severity, description) VALUES (%s, %s, %s, %s)"
+    DELETE = "DELETE FROM Feedback WHERE thread_id = %s"
+
+    def to_row(self) -> tuple:
+        return (self.thread_id, self.message_id, self.severity, self.description,)
 
-            return Feedback(result[0], result[1], result[2], result[3])
+    def key(self) -> tuple:
+        return (self.thread_id,)
 
-    def add_to_database(self, connection: MySQLConnection) -> None:
-        with connection.cursor() as cursor:
-            sql = "INSERT INTO Feedback (thread_id, message_id, severity, description) VALUES (%s, %s, %s, %s)"
-            cursor.execute(sql, (self.thread_id, self.message_id, self.severity, self.description,))
-            connection.commit()
+    def add_to_database(self, pool: StorageBackend) -> None:
+        with pool.cursor(writes=("Feedback",)) as cursor:
+            cursor.execute(Feedback.INSERT, self.to_row())
 
-    def remove_from_database(self, connection: MySQLConnection) -> None:
-        with connection.cursor() as cursor:
-            sql = "DELETE FROM Feedback WHERE thread_id = %s"
-            cursor.execute(sql, (self.thread_id,))
-            connection.commit()
+    def remove_from_database(self, pool: StorageBackend) -> None:
+        with pool.cursor(writes=("Feedback",)) as cursor:
+            cursor.execute(Feedback.DELETE, self.key())
 
     @staticmethod
-    def get_all(connection: MySQLConnection) -> list['Feedback']:
-        with connection.cursor() as cursor:
+    def get_all(pool: StorageBackend) -> list['Feedback']:
+        with pool.cursor() as cursor:
             cursor.execute("SELECT * FROM Feedback")
             results = cursor.fetchall()
 
-            data = []
-            for result in results:
-                data.append(Feedback(result[0], result[1], result[2], result[3]))
+        data = []
+        for result in results:
+            data.append(Feedback(result[0], result[1], result[2], result[3]))
 
-            return data
+        return data
@@ -0,0 +1,89 @@
+import time
+from threading import Lock
+from typing import Generic, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class IdentityMap(Generic[T]):
+    def __init__(self, ttl: float = 300.0):
+        """Keeps one in-memory copy of each model object loaded from the database so that
+        looking up the same row again is a dict access instead of a query. Entries expire
+        after ttl seconds, and models drop them whenever they write to the row.
+
+        The map is shared by every worker thread of the AsyncDatabase, so all access is locked.
+
+        Args:
+            ttl (float): The amount of seconds an object is kept before it's loaded again
+        """
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+        self._items: dict[Hashable, tuple[float, T]] = {}
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Optional[T]:
+        """Returns the object stored under a key (if it's there and hasn't expired).
+
+        Args:
+            key (Hashable): The primary key of the object
+
+        Returns:
+            Optional[T] - The stored object
+        """
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self.hits += 1
+                return entry[1]
+
+            if entry is not None:
+                del self._items[key]
+
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, item: T) -> T:
+        """Stores an object under a key.
+
+        Args:
+            key (Hashable): The primary key of the object
+            item (T): The object that was loaded from the database
+
+        Returns:
+            T - The stored object
+        """
+        with self._lock:
+            self._items[key] = (time.monotonic() + self.ttl, item)
+        return item
+
+    def invalidate(self, key: Hashable) -> None:
+        """Removes an object from the map, so that the next lookup reads it from the database.
+
+        Args:
+            key (Hashable): The primary key of the object
+        """
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes every object from the map."""
+        with self._lock:
+            self._items.clear()
+
+    @property
+    def hit_ratio(self) -> float:
+        """The share of lookups that were answered from memory (0 if nothing was looked up yet)."""
+        total = self.hits + self.misses
+        return self.hits / total if total != 0 else 0.0
+
+    def stats(self) -> dict[str, float]:
+        """Returns the size of the map and how well it's working.
+
+        Returns:
+            dict[str, float] - The amount of stored objects, hits, misses and the hit ratio
+        """
+        with self._lock:
+            size = len(self._items)
+        return {"size": size, "hits": self.hits, "misses": self.misses, "hit_ratio": self.hit_ratio}
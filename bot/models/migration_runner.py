@@ -0,0 +1,115 @@
+import os
+import re
+
+from bot.models.storage_backend import StorageBackend
+
+
+class MigrationRunner:
+    # Migration files are named <version>_<description>.sql (e.g. 0001_claim_lookup_indexes.sql)
+    FILE_PATTERN = re.compile(r"^(\d+)_(\w+)\.sql$")
+
+    def __init__(self, pool: StorageBackend, directory: str = "sql/migrations"):
+        """Applies the versioned schema migrations in a directory to an existing database.
+        sql/createdb.sql is version 0, every migration file changes the schema in place
+        (without dropping data) and is recorded in the SchemaMigrations table once it's applied.
+
+        Args:
+            pool (StorageBackend): The pool of connections to the database
+            directory (str): The directory containing the migration files
+        """
+        self.pool = pool
+        self.directory = directory
+
+    def pending(self) -> list[tuple[int, str, str]]:
+        """Returns the migrations that haven't been applied yet.
+
+        Returns:
+            list[tuple[int, str, str]] - The version, name and path of every pending migration (oldest first)
+        """
+        applied = self.applied_versions()
+
+        migrations = []
+        for filename in os.listdir(self.directory):
+            match = MigrationRunner.FILE_PATTERN.match(filename)
+            if match is None:
+                continue
+
+            version = int(match.group(1))
+            if version not in applied:
+                migrations.append((version, match.group(2), os.path.join(self.directory, filename)))
+
+        migrations.sort()
+        return migrations
+
+    def applied_versions(self) -> set[int]:
+        """Returns the versions that have already been applied to the database
+        (and creates the SchemaMigrations table if it doesn't exist yet).
+
+        Returns:
+            set[int] - The applied versions
+        """
+        with self.pool.cursor() as cursor:
+            # Checked first because CREATE TABLE IF NOT EXISTS raises a warning when the table exists
+            cursor.execute("SHOW TABLES LIKE 'SchemaMigrations'")
+            if cursor.fetchone() is None:
+                cursor.execute("CREATE TABLE `SchemaMigrations`("
+                               "`version` INT UNSIGNED NOT NULL PRIMARY KEY, "
+                               "`name` VARCHAR(255) NOT NULL, "
+                               "`applied_time` TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP)")
+
+            cursor.execute("SELECT version FROM SchemaMigrations")
+
+            return {result[0] for result in cursor.fetchall()}
+
+    def apply(self) -> list[str]:
+        """Applies every pending migration in order. Each migration is recorded as soon as
+        it succeeds, so a failed migration stops the run and is retried on the next one.
+
+        Migrations aren't atomic on MySQL: every DDL statement is committed on its own, so a
+        migration that failed halfway leaves its earlier statements applied. Statements that
+        fail because their change was already made (see StorageBackend.is_already_applied)
+        are skipped, which lets the retry pick up where the failed run stopped.
+
+        Returns:
+            list[str] - The names of the migrations that were applied
+        """
+        applied = []
+        for version, name, path in self.pending():
+            with open(path, "r") as f:
+                statements = MigrationRunner.split_statements(f.read())
+
+            with self.pool.cursor() as cursor:
+                for statement in statements:
+                    try:
+                        cursor.execute(statement)
+                    except self.pool.ERRORS as err:
+                        if not self.pool.is_already_applied(err):
+                            raise
+
+                cursor.execute("INSERT INTO SchemaMigrations (version, name) VALUES (%s, %s)", (version, name,))
+
+            applied.append(f"{version:04d}_{name}")
+
+        return applied
+
+    @staticmethod
+    def split_statements(sql: str) -> list[str]:
+        """Splits the contents of a migration file into separate statements.
+
+        Args:
+            sql (str): The contents of the file
+
+        Returns:
+            list[str] - The statements, without comments
+        """
+        lines = []
+        for line in sql.splitlines():
+            if not line.strip().startswith("--"):
+                lines.append(line)
+
+        statements = []
+        for statement in "\n".join(lines).split(";"):
+            if statement.strip() != "":
+                statements.append(statement.strip())
+
+        return statements
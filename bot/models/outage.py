@@ -1,5 +1,5 @@
-from mysql.connector import MySQLConnection
-from typing import Optional, Any
+from bot.models.storage_backend import StorageBackend
+from typing import Callable, Optional, Any
 
 from bot.models.database_item import DatabaseItem
 from bot.models.user import User
@@ -12,6 +12,11 @@ if TYPE_CHECKING:
 
 
 class Outage(DatabaseItem):
+    # Selects every column of Outages with the user joined in from Users (see from_row)
+    SELECT = ("SELECT o.message_id, o.case_message_id, o.service, o.parent_case, o.description, o.troubleshooting_steps, "
+              "o.resolution_time, o.active, " + User.columns("u") +
+              " FROM Outages o LEFT JOIN Users u ON u.discord_id = o.user")
+
     def __init__(self, message_id: int, case_message_id: int, service: str, parent_case: Optional[str], description: str, troubleshooting_steps: Optional[str], resolution_time: Optional[str], user: User, active: bool):
         """Create an outage object that can store the following fields.
 
@@ -37,44 +42,79 @@ class Outage(DatabaseItem):
         self.active = active
 
     @staticmethod
-    def from_message_id(connection: MySQLConnection, message_id: int) -> Optional['Outage']:
+    def from_row(row: tuple, users: Optional[dict[int, User]] = None) -> 'Outage':
+        """Creates an Outage from a row selected with Outage.SELECT.
+
+        Args:
+            row (tuple): The row returned by the database
+            users (Optional[dict[int, User]]): Users that were already created for previous rows
+
+        Returns:
+            Outage - The outage stored in the row
+        """
+        return Outage.decoder(users)(row)
+
+    @staticmethod
+    def decoder(users: Optional[dict[int, User]] = None) -> Callable[[tuple], 'Outage']:
+        """Returns a function that creates Outages from rows selected with Outage.SELECT.
+        Build it once per query: the columns are unpacked by name in SELECT order.
+
+        Args:
+            users (Optional[dict[int, User]]): Users that were already created for previous rows
+
+        Returns:
+            Callable[[tuple], Outage] - Creates an Outage from a row
+        """
+        user = User.decoder(users)
+
+        def decode(row: tuple) -> Outage:
+            (message_id, case_message_id, service, parent_case, description, troubleshooting_steps, resolution_time, active,
+             user_id, user_first_name, user_last_name, user_team) = row
+
+            return Outage(message_id, case_message_id, service, parent_case, description, troubleshooting_steps, resolution_time,
+                          user(user_id, user_first_name, user_last_name, user_team), bool(active))
+
+        return decode
+
+    @staticmethod
+    def from_message_id(pool: StorageBackend, message_id: int) -> Optional['Outage']:
         """Returns an outage (if found) with the matching message ID
 
         Args:
-            connection (MySQLConnection): The connection to the MySQL database
+            pool (StorageBackend): The pool of connections to the database
             message_id (int): The announcement message ID
 
         Returns:
             Optional[Outage] - The outage that matches the message id
         """
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT * FROM Outages WHERE message_id = %s", (message_id,))
+        with pool.cursor() as cursor:
+            cursor.execute(Outage.SELECT + " WHERE o.message_id = %s", (message_id,))
             result = cursor.fetchone()
 
-            if result is None:
-                return None
+        if result is None:
+            return None
 
-            return Outage(result[0], result[1], result[2], result[3], result[4], result[5], result[6], User.from_id(connection, result[7]), bool(result[8]))
+        return Outage.from_row(result)
 
     @staticmethod
-    def from_case_message_id(connection: MySQLConnection, message_id: int) -> Optional['Outage']:
+    def from_case_message_id(pool: StorageBackend, message_id: int) -> Optional['Outage']:
         """Returns an outage (if found) with the matching case message ID
 
         Args:
-            connection (MySQLConnection): The connection to the MySQL database
+            pool (StorageBackend): The pool of connections to the database
             message_id (int): The case message ID
 
         Returns:
             Optional[Outage] - The outage that matches with the provided case message id
         """
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT * FROM Outages WHERE case_message_id = %s", (message_id,))
+        with pool.cursor() as cursor:
+            cursor.execute(Outage.SELECT + " WHERE o.case_message_id = %s", (message_id,))
             result = cursor.fetchone()
 
-            if result is None:
-                return None
+        if result is None:
+            return None
 
-            return Outage(result[0], result[1], result[2], result[3], result[4], result[5], result[6], User.from_id(connection, result[7]), bool(result[8]))
+        return Outage.from_row(result)
 
     @staticmethod
     async def resend(bot):
@@ -83,54 +123,68 @@ class Outage(DatabaseItem):
         Args:
             bot (Bot): A reference to the original Bot instantiation.
         """
-        with bot.connection.cursor() as cursor:
-            cursor.execute("SELECT * FROM Outages WHERE active = 1")
+        for outage in await bot.db.run(Outage.get_all_active):
+            case_channel = await bot.fetch_channel(bot.cases_channel)
+            case_message = await case_channel.fetch_message(outage.case_message_id)
+
+            new_message = await case_channel.send(embed=case_message.embeds[0],
+                                                  silent=True)
+            await bot.db.run(outage.update_case_message_id, new_message.id)
+            await case_message.delete()
+
+    @staticmethod
+    def get_all_active(pool: StorageBackend) -> list['Outage']:
+        """Returns every outage that hasn't been closed yet.
+
+        Args:
+            pool (StorageBackend): The pool of connections to the database
+
+        Returns:
+            list[Outage] - The active outages
+        """
+        with pool.cursor() as cursor:
+            cursor.execute(Outage.SELECT + " WHERE o.active = 1")
             results = cursor.fetchall()
 
-            for result in results:
-                outage = Outage(result[0], result[1], result[2], result[3], result[4], result[5], result[6],
-                                User.from_id(bot.connection, result[7]), bool(result[8]))
+        return list(map(Outage.decoder(), results))
 
-                case_channel = await bot.fetch_channel(bot.cases_channel)
-                case_message = await case_channel.fetch_message(outage.case_message_id)
+    def update_case_message_id(self, pool: StorageBackend, case_message_id: int) -> None:
+        """Updates the database to point to a new case message (after the outage was resent).
 
-                new_message = await case_channel.send(embed=case_message.embeds[0],
-                                                      silent=True)
-                cursor.execute(f"UPDATE Outages SET case_message_id={new_message.id} WHERE message_id={outage.message_id}")
-                bot.connection.commit()
-                await case_message.delete()
+        Args:
+            pool (StorageBackend): The pool of connections to the database
+            case_message_id (int): The ID of the new case message
+        """
+        with pool.cursor(writes=("Outages",)) as cursor:
+            sql = "UPDATE Outages SET case_message_id = %s WHERE message_id = %s"
+            cursor.execute(sql, (case_message_id, self.message_id,))
 
-    def deactivate(self, connection: MySQLConnection) -> None:
+        self.case_message_id = case_message_id
+
+    def deactivate(self, pool: StorageBackend) -> None:
         """Deactivates the outage so that it no longer appears in MySQL queries.
 
         Args:
-            connection (MySQLConnection): The connection to the MySQL database
+            pool (StorageBackend): The pool of connections to the database
         """
-        with connection.cursor() as cursor:
-            sql = f"UPDATE Outages SET active=0 WHERE message_id={self.message_id}"
-            cursor.execute(sql)
-            connection.commit()
+        with pool.cursor(writes=("Outages",)) as cursor:
+            sql = "UPDATE Outages SET active=0 WHERE message_id = %s"
+            cursor.execute(sql, (self.message_id,))
 
-    def add_to_database(self, connection: MySQLConnection) -> None:
-        with connection.cursor() as cursor:
+    def add_to_database(self, pool: StorageBackend) -> None:
+        with pool.cursor(writes=("Outages",)) as cursor:
             sql = "INSERT INTO Outages (message_id, case_message_id, service, parent_case, description, troubleshooting_steps, resolution_time, user, active) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)"
             cursor.execute(sql, (self.message_id, self.case_message_id, self.service, self.parent_case, self.description, self.troubleshooting_steps, self.resolution_time, self.user.discord_id, self.active,))
-            connection.commit()
 
-    def remove_from_database(self, connection: MySQLConnection) -> None:
-        with connection.cursor() as cursor:
+    def remove_from_database(self, pool: StorageBackend) -> None:
+        with pool.cursor(writes=("Outages",)) as cursor:
             sql = "DELETE FROM Outages WHERE message_id = %s"
             cursor.execute(sql, (self.message_id,))
-            connection.commit()
 
     @staticmethod
-    def get_all(connection: MySQLConnection) -> list['Outage']:
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT * FROM Outages")
+    def get_all(pool: StorageBackend) -> list['Outage']:
+        with pool.cursor() as cursor:
+            cursor.execute(Outage.SELECT)
             results = cursor.fetchall()
 
-            data = []
-            for result in results:
-                data.append(Outage(result[0], result[1], result[2], result[3], result[4], result[5], result[6],
-                            User.from_id(connection, result[7]), bool(result[8])))
-            return data
+        return list(map(Outage.decoder(), results))
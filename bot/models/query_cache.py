@@ -0,0 +1,113 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Hashable, Iterable, Optional
+
+
+class QueryCache:
+    def __init__(self, max_entries: int = 256):
+        """Keeps the results of read queries keyed by their SQL and parameters. Every entry is
+        tagged with the tables it read and the version those tables had before the query ran.
+        Writes bump the version of the tables they change (see StorageBackend.cursor), which
+        makes every entry that read them stale without having to guess a TTL.
+
+        The cache is shared by every worker thread of the AsyncDatabase, so all access is locked.
+        The least recently used entries are dropped once there are more than max_entries.
+
+        Args:
+            max_entries (int): The maximum amount of results that are kept
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self._versions: dict[str, int] = {}
+        self._items: OrderedDict[Hashable, tuple[tuple[str, ...], tuple[int, ...], list[tuple]]] = OrderedDict()
+        self._lock = Lock()
+
+    def versions(self, tables: Iterable[str]) -> tuple[int, ...]:
+        """Returns the current version of some tables. Take this before running the query,
+        so that a write that commits while the query runs makes the result stale.
+
+        Args:
+            tables (Iterable[str]): The names of the tables
+
+        Returns:
+            tuple[int, ...] - The version of every table (in the same order)
+        """
+        with self._lock:
+            return tuple(self._versions.get(table, 0) for table in tables)
+
+    def get(self, key: Hashable) -> Optional[list[tuple]]:
+        """Returns the rows stored under a key (if they're there and none of their tables changed).
+
+        Args:
+            key (Hashable): The SQL and parameters of the query
+
+        Returns:
+            Optional[list[tuple]] - The stored rows
+        """
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is not None:
+                tables, versions, rows = entry
+                if versions == tuple(self._versions.get(table, 0) for table in tables):
+                    self._items.move_to_end(key)
+                    self.hits += 1
+                    return rows
+
+                del self._items[key]
+
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, tables: tuple[str, ...], versions: tuple[int, ...], rows: list[tuple]) -> list[tuple]:
+        """Stores the rows of a query.
+
+        Args:
+            key (Hashable): The SQL and parameters of the query
+            tables (tuple[str, ...]): The tables that the query read
+            versions (tuple[int, ...]): The versions of the tables before the query ran
+            rows (list[tuple]): The rows returned by the query
+
+        Returns:
+            list[tuple] - The stored rows
+        """
+        with self._lock:
+            self._items[key] = (tables, versions, rows)
+            self._items.move_to_end(key)
+
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+        return rows
+
+    def bump(self, *tables: str) -> None:
+        """Marks tables as changed, so that every stored result that read them is queried again.
+
+        Args:
+            tables (str): The names of the tables that were written to
+        """
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+
+    def clear(self) -> None:
+        """Removes every stored result."""
+        with self._lock:
+            self._items.clear()
+
+    @property
+    def hit_ratio(self) -> float:
+        """The share of lookups that were answered from memory (0 if nothing was looked up yet)."""
+        total = self.hits + self.misses
+        return self.hits / total if total != 0 else 0.0
+
+    def stats(self) -> dict[str, float]:
+        """Returns the size of the cache and how well it's working.
+
+        Returns:
+            dict[str, float] - The amount of stored results, hits, misses and the hit ratio
+        """
+        with self._lock:
+            size = len(self._items)
+        return {"size": size, "hits": self.hits, "misses": self.misses, "hit_ratio": self.hit_ratio}
@@ -0,0 +1,198 @@
+import logging
+import re
+import time
+from contextvars import ContextVar
+from threading import Lock
+from typing import Any, Optional, Sequence
+
+from mysql.connector.cursor import MySQLCursor
+
+# The interaction (or loop) whose model methods are running in the current worker thread (see AsyncDatabase)
+current_request: ContextVar[Optional['RequestStats']] = ContextVar("current_request", default=None)
+# What the current task is handling (e.g. "/claim" or "CheckView:ping"), set where interactions
+# enter the bot (see bot/request_labels.py) and read by AsyncDatabase when the task first uses the database
+current_label: ContextVar[Optional[str]] = ContextVar("current_label", default=None)
+
+slow_query_log = logging.getLogger("slow_queries")
+
+
+class RequestStats:
+    __slots__ = ("label", "queries")
+
+    def __init__(self, label: str):
+        """Counts the queries issued while handling one interaction.
+
+        Args:
+            label (str): What's being handled (e.g. "/leaderboard" or the custom ID of a button)
+        """
+        self.label = label
+        self.queries = 0
+
+
+class QueryStats:
+    # Upper bounds (in seconds) of the latency histogram buckets, the last bucket has no upper bound
+    BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+    def __init__(self, slow_threshold: float = 0.5):
+        """Records how long every statement takes, how many rows it touches and how many
+        statements each interaction issues. Statements slower than slow_threshold seconds
+        are written to the slow_queries logger.
+
+        The stats are shared by every worker thread of the AsyncDatabase, so all access is locked.
+
+        Args:
+            slow_threshold (float): The amount of seconds after which a statement is logged as slow
+        """
+        self.slow_threshold = slow_threshold
+
+        # Per statement: [executions, total seconds, max seconds, rows, histogram]
+        self._statements: dict[str, list[Any]] = {}
+        # Per label: [interactions, total queries, max queries]
+        self._requests: dict[str, list[int]] = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def normalize(sql: str) -> str:
+        """Returns the shape of a statement, so that the same query with a different amount
+        of IN (...) placeholders or IDs formatted into it is counted together.
+
+        Args:
+            sql (str): The statement
+
+        Returns:
+            str - The normalized statement
+        """
+        sql = re.sub(r"%s(, %s)+", "%s, ...", sql)
+        return re.sub(r"\b\d{4,}\b", "?", sql)
+
+    def record(self, sql: str, params: Any, seconds: float, rows: int) -> None:
+        """Records one execution of a statement.
+
+        Args:
+            sql (str): The statement
+            params (Any): The parameters of the statement (only used in the slow query log)
+            seconds (float): How long the statement took
+            rows (int): The amount of rows returned or changed
+        """
+        key = QueryStats.normalize(sql)
+
+        bucket = len(QueryStats.BUCKETS)
+        for i, bound in enumerate(QueryStats.BUCKETS):
+            if seconds <= bound:
+                bucket = i
+                break
+
+        with self._lock:
+            stats = self._statements.get(key)
+            if stats is None:
+                stats = self._statements[key] = [0, 0.0, 0.0, 0, [0] * (len(QueryStats.BUCKETS) + 1)]
+
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] = max(stats[2], seconds)
+            stats[3] += rows
+            stats[4][bucket] += 1
+
+        request = current_request.get()
+        if request is not None:
+            request.queries += 1
+
+        if seconds >= self.slow_threshold:
+            label = request.label if request is not None else "-"
+            slow_query_log.warning(f"{seconds * 1000:.0f} ms, {rows} rows, {label}: {sql} {params}")
+
+    def record_request(self, request: RequestStats) -> None:
+        """Records how many statements an interaction issued once it's finished.
+
+        Args:
+            request (RequestStats): The finished interaction
+        """
+        with self._lock:
+            stats = self._requests.setdefault(request.label, [0, 0, 0])
+            stats[0] += 1
+            stats[1] += request.queries
+            stats[2] = max(stats[2], request.queries)
+
+    def statements(self, limit: Optional[int] = 10) -> list[tuple[str, int, float, float, float, int]]:
+        """Returns the statements that took the most time in total.
+
+        Args:
+            limit (Optional[int]): The maximum amount of statements (None for every statement)
+
+        Returns:
+            list[tuple[str, int, float, float, float, int]] - The statement, executions, total seconds,
+            95th percentile seconds (the upper bound of its histogram bucket), max seconds and rows
+        """
+        with self._lock:
+            items = [(key, stats[0], stats[1], QueryStats._percentile(stats[4], 0.95), stats[2], stats[3])
+                     for key, stats in self._statements.items()]
+
+        items.sort(key=lambda item: item[2], reverse=True)
+        return items[:limit]
+
+    def requests(self, limit: int = 10) -> list[tuple[str, int, float, int]]:
+        """Returns the interactions that issue the most statements on average.
+
+        Args:
+            limit (int): The maximum amount of interactions
+
+        Returns:
+            list[tuple[str, int, float, int]] - The label, amount of interactions, average and maximum statements
+        """
+        with self._lock:
+            items = [(label, stats[0], stats[1] / stats[0], stats[2]) for label, stats in self._requests.items()]
+
+        items.sort(key=lambda item: item[2], reverse=True)
+        return items[:limit]
+
+    def reset(self) -> None:
+        """Forgets everything that was recorded."""
+        with self._lock:
+            self._statements.clear()
+            self._requests.clear()
+
+    @staticmethod
+    def _percentile(histogram: Sequence[int], fraction: float) -> float:
+        target = sum(histogram) * fraction
+
+        count = 0
+        for i, bucket_count in enumerate(histogram):
+            count += bucket_count
+            if count >= target and i < len(QueryStats.BUCKETS):
+                return QueryStats.BUCKETS[i]
+
+        return float("inf")
+
+
+class InstrumentedCursor:
+    def __init__(self, cursor: MySQLCursor, stats: QueryStats):
+        """Wraps a cursor so that every statement it runs is recorded in a QueryStats.
+        Everything else is passed through to the wrapped cursor. The rows of a statement are taken
+        from rowcount right after it runs, so rows streamed by an unbuffered cursor aren't counted.
+
+        Args:
+            cursor (MySQLCursor): The cursor that runs the statements
+            stats (QueryStats): Where the statements are recorded
+        """
+        self._cursor = cursor
+        self._stats = stats
+
+    def execute(self, operation: str, params: Any = (), **kwargs) -> Any:
+        start = time.perf_counter()
+        try:
+            return self._cursor.execute(operation, params, **kwargs)
+        finally:
+            self._stats.record(operation, params, time.perf_counter() - start, max(self._cursor.rowcount, 0))
+
+    def executemany(self, operation: str, seq_params: Sequence[Any], **kwargs) -> Any:
+        start = time.perf_counter()
+        try:
+            return self._cursor.executemany(operation, seq_params, **kwargs)
+        finally:
+            self._stats.record(operation, f"({len(seq_params)} rows)", time.perf_counter() - start, max(self._cursor.rowcount, 0))
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self._cursor)
@@ -0,0 +1,126 @@
+from bisect import insort
+from collections import deque
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Iterable, Optional
+
+
+class RecentClaims:
+    def __init__(self, window: timedelta = timedelta(minutes=15)):
+        """Keeps the claims (completed or checked) that were claimed within the last window of time,
+        so that /claim can warn about a case that someone else just worked on without querying
+        the database. The claims are kept in claim time order in a deque, where old ones are
+        dropped lazily whenever the window is read, and indexed by case number.
+
+        It's filled with load() when the bot starts and CompletedClaim.add_to_database adds every
+        newly completed claim (checked claims keep the claim time of their completed claim).
+        Until load() is called nothing is known, so callers fall back to the database.
+        The window is shared by every worker thread, so all access is locked.
+
+        Args:
+            window (timedelta): How long a claim is kept after it was claimed
+        """
+        self.window = window
+        self.loaded = False
+
+        # (claim time, checker message ID, case number, tech ID) of every claim, oldest first
+        self._claims: deque[tuple[datetime, int, str, int]] = deque()
+        # Claim time and tech ID of every claim in the window by case number and checker message ID
+        self._by_case_num: dict[str, dict[int, tuple[datetime, int]]] = {}
+        self._lock = Lock()
+
+    def load(self, claims: Iterable[tuple[int, str, int, datetime]]) -> None:
+        """Replaces everything in the window with the claims in the database.
+
+        Args:
+            claims (Iterable[tuple[int, str, int, datetime]]): The checker message ID, case number,
+                tech ID and claim time of every claim claimed within the window
+        """
+        with self._lock:
+            self._claims.clear()
+            self._by_case_num.clear()
+
+            for checker_message_id, case_num, tech_id, claim_time in sorted(claims, key=lambda claim: (claim[3], claim[0])):
+                self._claims.append((claim_time, checker_message_id, case_num, tech_id))
+                self._by_case_num.setdefault(case_num, {})[checker_message_id] = (claim_time, tech_id)
+
+            self.loaded = True
+
+    def add(self, checker_message_id: int, case_num: str, tech_id: int, claim_time: datetime) -> None:
+        """Adds a claim that was just completed (if it was claimed within the window).
+
+        Args:
+            checker_message_id (int): The id of the checker message when the case was claimed
+            case_num (str): The case number in Salesforce (e.g. "00960979")
+            tech_id (int): The discord ID of the tech that claimed the case
+            claim_time (datetime): The time that the case was claimed
+        """
+        with self._lock:
+            if claim_time < datetime.now() - self.window:
+                return
+
+            # Claims are completed in a different order than they were claimed in, but the window is short
+            insort(self._claims, (claim_time, checker_message_id, case_num, tech_id))
+            self._by_case_num.setdefault(case_num, {})[checker_message_id] = (claim_time, tech_id)
+
+    def remove(self, checker_message_id: int, case_num: str) -> None:
+        """Removes a claim that was deleted (it's dropped from the deque once it expires).
+
+        Args:
+            checker_message_id (int): The id of the checker message when the case was claimed
+            case_num (str): The case number in Salesforce (e.g. "00960979")
+        """
+        with self._lock:
+            claims = self._by_case_num.get(case_num)
+            if claims is not None:
+                claims.pop(checker_message_id, None)
+                if len(claims) == 0:
+                    del self._by_case_num[case_num]
+
+    def covers(self, window: timedelta) -> bool:
+        """Returns whether or not every claim claimed within a window of time (up to now) is kept.
+
+        Args:
+            window (timedelta): How far back the claims are needed
+
+        Returns:
+            bool - Whether or not latest_other can be used for that window
+        """
+        return self.loaded and window <= self.window
+
+    def latest_other(self, case_num: str, tech_id: int, since: datetime) -> Optional[int]:
+        """Returns who else most recently claimed a case since a certain time (see covers).
+
+        Args:
+            case_num (str): The case number in Salesforce (e.g. "00960979")
+            tech_id (int): The discord ID of the tech whose own claims are skipped
+            since (datetime): The start of the window that claims are looked for in
+
+        Returns:
+            Optional[int] - The discord ID of the other tech (None if nobody else claimed the case)
+        """
+        with self._lock:
+            self._expire()
+
+            latest = None
+            for claim_time, claim_tech_id in self._by_case_num.get(case_num, {}).values():
+                if claim_tech_id != tech_id and claim_time >= since and (latest is None or claim_time > latest[0]):
+                    latest = (claim_time, claim_tech_id)
+
+            return latest[1] if latest is not None else None
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._expire()
+            return sum(len(claims) for claims in self._by_case_num.values())
+
+    def _expire(self) -> None:
+        cutoff = datetime.now() - self.window
+        while len(self._claims) != 0 and self._claims[0][0] < cutoff:
+            claim_time, checker_message_id, case_num, tech_id = self._claims.popleft()
+
+            claims = self._by_case_num.get(case_num)
+            if claims is not None:
+                claims.pop(checker_message_id, None)
+                if len(claims) == 0:
+                    del self._by_case_num[case_num]
@@ -0,0 +1,264 @@
+import functools
+import re
+import sqlite3
+from datetime import date, datetime
+from typing import Any, Iterable, Optional, Sequence
+
+from bot.models.storage_backend import StorageBackend
+from bot.models.migration_runner import MigrationRunner
+
+# Stored the way MySQL stores them (without a timezone or fractions of a second) so they compare as text
+sqlite3.register_adapter(datetime, lambda t: t.strftime("%Y-%m-%d %H:%M:%S"))
+sqlite3.register_adapter(date, lambda d: d.isoformat())
+
+# Values that are turned back into dates and datetimes when they're read (see SQLiteCursor._convert)
+TIMESTAMP_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}( \d{2}:\d{2}:\d{2}(\.\d{1,6})?)?")
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value is not None else None
+
+
+def _hour(value: Optional[str]) -> Optional[int]:
+    t = _parse_timestamp(value)
+    return t.hour if t is not None else None
+
+
+def _timestampdiff(unit: str, start: Optional[str], end: Optional[str]) -> Optional[int]:
+    if start is None or end is None:
+        return None
+
+    seconds = (_parse_timestamp(end) - _parse_timestamp(start)).total_seconds()
+    return int(seconds // {"SECOND": 1, "MINUTE": 60, "HOUR": 3600, "DAY": 86400}[unit.upper()])
+
+
+class SQLiteCursor:
+    def __init__(self, cursor: sqlite3.Cursor):
+        """Lets the models run their MySQL statements on SQLite (see SQLiteBackend.translate)
+        and returns dates and datetimes like mysql.connector does.
+
+        Args:
+            cursor (sqlite3.Cursor): The SQLite cursor
+        """
+        self._cursor = cursor
+
+        # Whether or not each column of the current result holds dates (None until a value has been seen)
+        self._dates: list[Optional[bool]] = []
+
+    def execute(self, operation: str, params: Sequence[Any] = ()) -> None:
+        match = re.fullmatch(r"CREATE TABLE `?(\w+)`? LIKE `?(\w+)`?", operation.strip())
+        if match is not None:
+            self._create_like(match.group(1), match.group(2))
+            return
+
+        self._cursor.execute(SQLiteBackend.translate(operation), tuple(params))
+        self._dates = [None] * len(self._cursor.description or ())
+
+    def executemany(self, operation: str, seq_params: Iterable[Sequence[Any]]) -> None:
+        self._cursor.executemany(SQLiteBackend.translate(operation), seq_params)
+
+    def fetchone(self) -> Optional[tuple]:
+        row = self._cursor.fetchone()
+        return self._convert(row) if row is not None else None
+
+    def fetchmany(self, size: int = 1) -> list[tuple]:
+        return [self._convert(row) for row in self._cursor.fetchmany(size)]
+
+    def fetchall(self) -> list[tuple]:
+        return [self._convert(row) for row in self._cursor.fetchall()]
+
+    def __iter__(self):
+        return (self._convert(row) for row in self._cursor)
+
+    @property
+    def rowcount(self) -> int:
+        return self._cursor.rowcount
+
+    @property
+    def lastrowid(self) -> Optional[int]:
+        return self._cursor.lastrowid
+
+    @property
+    def description(self) -> Any:
+        return self._cursor.description
+
+    def close(self) -> None:
+        self._cursor.close()
+
+    def _create_like(self, table: str, source: str) -> None:
+        # Same as MySQL's CREATE TABLE ... LIKE: the columns and indexes are copied, the foreign keys aren't
+        self._cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (source,))
+        sql = self._cursor.fetchone()[0]
+        sql = re.sub(r",\s*CONSTRAINT `?\w+`? FOREIGN KEY\([^)]*\) REFERENCES `?\w+`?\([^)]*\)", "", sql)
+        self._cursor.execute(re.sub(rf"`?{source}`?", f"`{table}`", sql, count=1))
+
+        self._cursor.execute("SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL", (source,))
+        for name, index_sql in self._cursor.fetchall():
+            # Index names are global in SQLite
+            index_sql = re.sub(rf"`?{name}`?", f"`{table.lower()}_{name}`", index_sql, count=1)
+            self._cursor.execute(re.sub(rf"ON `?{source}`?", f"ON `{table}`", index_sql, count=1))
+
+    def _convert(self, row: Sequence[Any]) -> tuple:
+        # The type of a column is decided by its first non-NULL value, so the pattern is only
+        # matched once per column of a result instead of for every value
+        values = list(row)
+        for i, is_date in enumerate(self._dates):
+            value = values[i]
+            if value is None or is_date is False:
+                continue
+
+            if is_date is None:
+                is_date = self._dates[i] = isinstance(value, str) and TIMESTAMP_PATTERN.fullmatch(value) is not None
+                if not is_date:
+                    continue
+
+            values[i] = datetime.fromisoformat(value) if len(value) > 10 else date.fromisoformat(value)
+
+        return tuple(values)
+
+
+class SQLiteBackend(StorageBackend):
+    ERRORS = (sqlite3.Error,)
+
+    def __init__(self, path: str, size: int = 5, timeout: float = 10.0, schema: str = "sql/createdb.sql"):
+        """Stores everything in an embedded SQLite database file instead of a MySQL server, e.g. for a
+        small desk or to run the benchmarks locally. The file is opened in WAL mode, so reads run
+        alongside a write, and is created from the MySQL schema (see convert_schema) if it's empty.
+        The migrations are applied with MigrationRunner like they are on MySQL.
+
+        The models' statements are translated from MySQL (see translate). Writes take the database's
+        write lock when their transaction starts, which stands in for the row locks (FOR UPDATE) on MySQL.
+
+        Args:
+            path (str): The path of the database file (":memory:" isn't supported since every connection would get its own database)
+            size (int): The maximum amount of connections that can be open at once
+            timeout (float): The amount of seconds to wait for a free connection or the write lock before giving up
+            schema (str): The MySQL schema that an empty database is created from
+        """
+        super().__init__(size, timeout)
+        self.path = path
+
+        with self.connection() as connection:
+            connection.execute("PRAGMA journal_mode = WAL")
+
+            if connection.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'table'").fetchone()[0] == 0:
+                with open(schema, "r") as f:
+                    statements = SQLiteBackend.convert_schema(MigrationRunner.split_statements(f.read()))
+
+                connection.execute("BEGIN")
+                for statement in statements:
+                    connection.execute(statement)
+                connection.commit()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Transactions are started explicitly in _open_cursor
+        connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False)
+        connection.execute("PRAGMA foreign_keys = ON")
+        connection.create_function("HOUR", 1, _hour, deterministic=True)
+        connection.create_function("TIMESTAMPDIFF", 3, _timestampdiff, deterministic=True)
+        return connection
+
+    def _open_cursor(self, connection: sqlite3.Connection, buffered: bool, writes: Sequence[str], **kwargs) -> SQLiteCursor:
+        # Writers take the write lock right away, so a transaction never fails halfway through because another one is writing
+        connection.execute("BEGIN IMMEDIATE" if len(writes) != 0 else "BEGIN")
+        return SQLiteCursor(connection.cursor())
+
+    def is_duplicate_key(self, err: Exception) -> bool:
+        return isinstance(err, sqlite3.IntegrityError) and err.sqlite_errorname in ("SQLITE_CONSTRAINT_PRIMARYKEY", "SQLITE_CONSTRAINT_UNIQUE")
+
+    def is_already_applied(self, err: Exception) -> bool:
+        message = str(err)
+        return isinstance(err, sqlite3.OperationalError) and ("already exists" in message or message.startswith(("duplicate column name", "no such index")))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def translate(sql: str) -> str:
+        """Rewrites the MySQL features that the models use into SQLite.
+
+        Args:
+            sql (str): The MySQL statement
+
+        Returns:
+            str - The SQLite statement
+        """
+        sql = sql.replace("%s", "?").replace("%%", "%")
+        sql = re.sub(r"\s+FOR UPDATE\b", "", sql)
+        sql = re.sub(r"\bIF\(", "IIF(", sql)
+        sql = re.sub(r"\bINSERT IGNORE\b", "INSERT OR IGNORE", sql)
+        sql = re.sub(r"\bTIMESTAMPDIFF\((\w+),", r"TIMESTAMPDIFF('\1',", sql)
+
+        if "ON DUPLICATE KEY UPDATE" in sql:
+            # The new row is referred to by its alias (VALUES (...) AS new) or with VALUES(column)
+            alias = re.search(r"\)\s+AS\s+(\w+)\s+ON DUPLICATE KEY UPDATE", sql)
+            if alias is not None:
+                sql = sql.replace(alias.group(0), ") ON DUPLICATE KEY UPDATE")
+                sql = re.sub(rf"\b{alias.group(1)}\.(\w+)", r"excluded.\1", sql)
+
+            sql = sql.replace("ON DUPLICATE KEY UPDATE", "ON CONFLICT DO UPDATE SET")
+            sql = re.sub(r"\bVALUES\((\w+)\)", r"excluded.\1", sql)
+
+        return re.sub(r"^SHOW TABLES LIKE ('\w+')$", r"SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE \1", sql)
+
+    @staticmethod
+    def convert_schema(statements: Iterable[str]) -> list[str]:
+        """Converts a MySQL schema (like sql/createdb.sql) into SQLite. SQLite can't add keys to an
+        existing table, so the primary keys and foreign keys of the ALTER TABLE statements are moved
+        into the CREATE TABLE statements and the unique keys become unique indexes.
+
+        Args:
+            statements (Iterable[str]): The MySQL statements
+
+        Returns:
+            list[str] - The SQLite statements
+        """
+        tables: dict[str, list[str]] = {}
+        others = []
+
+        for statement in statements:
+            statement = " ".join(statement.split())
+
+            match = re.fullmatch(r"CREATE TABLE `?(\w+)`?\s*\((.*)\)", statement)
+            if match is not None:
+                tables[match.group(1)] = [SQLiteBackend._convert_column(column) for column in SQLiteBackend._split_columns(match.group(2))]
+                continue
+
+            match = re.fullmatch(r"ALTER TABLE `?(\w+)`? ADD (.*)", statement)
+            if match is None:
+                others.append(SQLiteBackend.translate(statement))
+                continue
+
+            table, definition = match.groups()
+            unique = re.fullmatch(r"UNIQUE `?(\w+)`?\s*\((.*)\)", definition)
+            if unique is not None:
+                others.append(f"CREATE UNIQUE INDEX `{unique.group(1)}` ON `{table}`({unique.group(2)})")
+            else:
+                tables[table].append(definition)
+
+        creates = [f"CREATE TABLE `{table}`(" + ", ".join(columns) + ")" for table, columns in tables.items()]
+        return creates + others
+
+    @staticmethod
+    def _split_columns(body: str) -> list[str]:
+        # Splits on the commas that aren't inside parentheses (like DECIMAL(10, 2))
+        columns = []
+        depth = 0
+        start = 0
+        for i, c in enumerate(body):
+            if c == "(":
+                depth += 1
+            elif c == ")":
+                depth -= 1
+            elif c == "," and depth == 0:
+                columns.append(body[start:i].strip())
+                start = i + 1
+
+        columns.append(body[start:].strip())
+        return columns
+
+    @staticmethod
+    def _convert_column(column: str) -> str:
+        # Only INTEGER PRIMARY KEY columns are filled in automatically by SQLite
+        if "AUTO_INCREMENT" in column:
+            return column.split()[0] + " INTEGER PRIMARY KEY AUTOINCREMENT"
+
+        return column
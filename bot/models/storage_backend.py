@@ -0,0 +1,238 @@
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from queue import Queue, Empty
+from threading import Lock
+from typing import Any, Iterator, Sequence
+
+from mysql.connector.errors import PoolError
+from mysql.connector.cursor import MySQLCursor
+
+from bot.models.query_cache import QueryCache
+from bot.models.query_stats import QueryStats, InstrumentedCursor
+
+
+class StorageBackend(ABC):
+    # Results of cached read queries, shared by every backend (see fetchall_cached)
+    results: QueryCache = QueryCache()
+    # Latency, rows and counts of every statement run through cursor(), shared by every backend
+    stats: QueryStats = QueryStats()
+
+    # The exceptions raised by the backend's driver
+    ERRORS: tuple[type[Exception], ...] = (Exception,)
+
+    def __init__(self, size: int = 5, timeout: float = 10.0, fill_cache: bool = True):
+        """The storage that the models read from and write to. Every model method takes a backend
+        as its first argument and only uses cursor() and fetchall_cached(), so the same models
+        run on MySQL (ConnectionPool) and on an embedded SQLite file (SQLiteBackend).
+
+        The backend keeps a pool of connections. Connections are only opened when they're needed
+        (up to size of them) and are checked whenever they are checked out.
+
+        Args:
+            size (int): The maximum amount of connections that can be open at once
+            timeout (float): The amount of seconds to wait for a free connection before giving up
+            fill_cache (bool): Whether or not the results of fetchall_cached are stored in StorageBackend.results
+                (False for a read replica, whose results can be older than the table versions)
+        """
+        self.size = size
+        self.timeout = timeout
+        self.fill_cache = fill_cache
+
+        self._idle: Queue[Any] = Queue(maxsize=size)
+        self._open_count = 0
+        self._lock = Lock()
+
+    @abstractmethod
+    def _connect(self) -> Any:
+        """Opens a new connection."""
+        pass
+
+    @abstractmethod
+    def _open_cursor(self, connection: Any, buffered: bool, writes: Sequence[str], **kwargs) -> Any:
+        """Opens a cursor on a connection and starts a transaction on it."""
+        pass
+
+    def _revive(self, connection: Any) -> None:
+        """Makes sure that a connection that's being checked out still works (raises one of ERRORS if it doesn't)."""
+        pass
+
+    def is_duplicate_key(self, err: Exception) -> bool:
+        """Returns whether or not an error was raised because a row broke a PRIMARY or UNIQUE key.
+
+        Args:
+            err (Exception): The error raised by the backend's driver
+
+        Returns:
+            bool - Whether or not it's a duplicate key error
+        """
+        return False
+
+    def is_already_applied(self, err: Exception) -> bool:
+        """Returns whether or not a schema change failed because it was already made (e.g. the index
+        or column already exists, or the key that's being dropped is already gone).
+
+        Args:
+            err (Exception): The error raised by the backend's driver
+
+        Returns:
+            bool - Whether or not the schema already has the change
+        """
+        return False
+
+    def acquire(self) -> Any:
+        """Checks out a connection from the pool. An idle connection is reused if there is one,
+        otherwise a new one is opened (if the pool isn't full) or the caller waits for one to be released.
+
+        Raises:
+            PoolError: If no connection is released within the timeout.
+
+        Returns:
+            Any - A live connection that must be given back with release()
+        """
+        try:
+            connection = self._idle.get_nowait()
+        except Empty:
+            connection = self._open_or_wait()
+
+        try:
+            self._revive(connection)
+        except self.ERRORS:
+            # The connection couldn't be revived, replace it with a new one
+            self._discard(connection)
+            connection = self._open_or_wait()
+
+        return connection
+
+    def release(self, connection: Any) -> None:
+        """Returns a connection to the pool so that it can be used by someone else.
+        Anything that wasn't committed is rolled back first.
+
+        Args:
+            connection (Any): The connection that was checked out with acquire()
+        """
+        try:
+            if connection.in_transaction:
+                connection.rollback()
+        except self.ERRORS:
+            # Connection is broken, it will be reopened the next time the pool needs one
+            self._discard(connection)
+            return
+
+        self._idle.put_nowait(connection)
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """Borrows a connection for the duration of a with block.
+
+        Returns:
+            Iterator[Any] - The borrowed connection
+        """
+        connection = self.acquire()
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    @contextmanager
+    def cursor(self, buffered: bool = True, writes: Sequence[str] = (), **kwargs) -> Iterator[MySQLCursor]:
+        """Borrows a connection and opens a cursor on it for the duration of a with block.
+        Everything executed with the cursor is committed when the block finishes and
+        rolled back if an exception is raised. Every statement is recorded in StorageBackend.stats.
+
+        Args:
+            buffered (bool): Whether or not the whole result is fetched from the server right away
+            writes (Sequence[str]): The tables that the block changes, their cached results
+                are invalidated once the changes are committed
+
+        Returns:
+            Iterator[MySQLCursor] - The cursor
+        """
+        with self.connection() as connection:
+            cursor = self._open_cursor(connection, buffered, writes, **kwargs)
+            try:
+                yield InstrumentedCursor(cursor, StorageBackend.stats)
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+            finally:
+                cursor.close()
+
+        if len(writes) != 0:
+            StorageBackend.results.bump(*writes)
+
+    def fetchall_cached(self, sql: str, params: tuple, tables: Sequence[str]) -> list[tuple]:
+        """Runs a read query, or returns its result from StorageBackend.results if none of the
+        tables it reads have been written to since it last ran. The rows are shared with other
+        callers, so they must not be changed.
+
+        Args:
+            sql (str): The SELECT statement
+            params (tuple): The parameters of the statement
+            tables (Sequence[str]): Every table that the statement reads
+
+        Returns:
+            list[tuple] - The rows returned by the query
+        """
+        key = (sql, params)
+        rows = StorageBackend.results.get(key)
+        if rows is not None:
+            return rows
+
+        tables = tuple(tables)
+        versions = StorageBackend.results.versions(tables)
+        with self.cursor() as cursor:
+            cursor.execute(sql, params)
+            rows = cursor.fetchall()
+
+        if not self.fill_cache:
+            # A replica can still be behind a write that already bumped the versions
+            return rows
+
+        return StorageBackend.results.put(key, tables, versions, rows)
+
+    def ping(self) -> None:
+        """Checks out (and checks) a connection to make sure that the database is reachable.
+
+        Raises:
+            Exception: One of ERRORS if the database can't be reached.
+        """
+        with self.connection():
+            pass
+
+    def close(self) -> None:
+        """Closes every idle connection in the pool."""
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except Empty:
+                break
+            self._discard(connection)
+
+    def _open_or_wait(self) -> Any:
+        with self._lock:
+            can_open = self._open_count < self.size
+            if can_open:
+                self._open_count += 1
+
+        if can_open:
+            try:
+                return self._connect()
+            except Exception:
+                with self._lock:
+                    self._open_count -= 1
+                raise
+
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except Empty:
+            raise PoolError(f"No connection was released within {self.timeout} seconds (pool size: {self.size})")
+
+    def _discard(self, connection: Any) -> None:
+        try:
+            connection.close()
+        except self.ERRORS:
+            pass
+
+        with self._lock:
+            self._open_count -= 1
@@ -1,55 +1,66 @@
-from mysql.connector import MySQLConnection
+from bot.models.storage_backend import StorageBackend
 from typing import Optional, Any
 
 from bot.models.database_item import DatabaseItem
+from bot.models.identity_map import IdentityMap
 
 
 class Team(DatabaseItem):
+    # Teams that were recently loaded, keyed by role ID
+    cache: IdentityMap['Team'] = IdentityMap(ttl=300)
+
     def __init__(self, role_id: int, color: str, image_url: str):
         self.role_id = role_id
         self.color = color
         self.image_url = image_url
 
     @staticmethod
-    def from_role_id(connection: MySQLConnection, role_id: int) -> Optional['Team']:
+    def from_role_id(pool: StorageBackend, role_id: int) -> Optional['Team']:
         """Returns a Team (if found) based on a provided role id.
+        Teams are served from Team.cache when possible.
 
         Args:
-            connection (MySQLConnection): The connection to the MySQL database
+            pool (StorageBackend): The pool of connections to the database
             role_id (int): The id of the role
 
         Returns:
             Optional[Team] - A representation of the team
         """
-        with connection.cursor() as cursor:
+        team = Team.cache.get(role_id)
+        if team is not None:
+            return team
+
+        with pool.cursor() as cursor:
             cursor.execute("SELECT * FROM Teams WHERE role_id = %s", (role_id,))
             result = cursor.fetchone()
 
-            if result is None:
-                return None
+        if result is None:
+            return None
 
-            return Team(result[0], result[1], result[2])
+        return Team.cache.put(role_id, Team(result[0], result[1], result[2]))
 
-    def add_to_database(self, connection: MySQLConnection) -> None:
-        with connection.cursor() as cursor:
+    def add_to_database(self, pool: StorageBackend) -> None:
+        with pool.cursor(writes=("Teams",)) as cursor:
             sql = "INSERT INTO Teams (role_id, color, image_url) VALUES (%s, %s, %s)"
             cursor.execute(sql, (self.role_id, self.color, self.image_url,))
-            connection.commit()
 
-    def remove_from_database(self, connection: MySQLConnection) -> None:
-        with connection.cursor() as cursor:
+        Team.cache.invalidate(self.role_id)
+
+    def remove_from_database(self, pool: StorageBackend) -> None:
+        with pool.cursor(writes=("Teams",)) as cursor:
             sql = "DELETE FROM Teams WHERE role_id = %s"
             cursor.execute(sql, (self.role_id,))
-            connection.commit()
+
+        Team.cache.invalidate(self.role_id)
 
     @staticmethod
-    def get_all(connection: MySQLConnection) -> list['Team']:
-        with connection.cursor() as cursor:
+    def get_all(pool: StorageBackend) -> list['Team']:
+        with pool.cursor() as cursor:
             cursor.execute("SELECT * FROM Teams")
             results = cursor.fetchall()
 
-            data = []
-            for result in results:
-                data.append(Team(result[0], result[1], result[2]))
+        data = []
+        for result in results:
+            data.append(Team.cache.put(result[0], Team(result[0], result[1], result[2])))
 
-            return data
+        return data
@@ -1,10 +1,12 @@
-from mysql.connector import MySQLConnection
+from bot.models.storage_backend import StorageBackend
 from datetime import datetime
 
-from bot.models.database_item import DatabaseItem
+from bot.models.database_item import BulkAddable
 
 
-class TeamPoint(DatabaseItem):
+class TeamPoint(BulkAddable):
+    __slots__ = ("role_id", "points", "description", "timestamp")
+
     def __init__(self, role_id: int, points: int, description: str, timestamp: datetime):
         """Creates a TeamPoint object to store data such as points and description.
 
@@ -19,23 +21,23 @@ class TeamPoint(DatabaseItem):
         self.description = description
         self.timestamp = timestamp
 
-    def add_to_database(self, connection: MySQLConnection) -> None:
-        with connection.cursor() as cursor:
-            sql = "INSERT INTO TeamPoints (role_id, points, description, timestamp) VALUES (%s, %s, %s, %s)"
-            cursor.execute(sql, (self.role_id, self.points, self.description, self.timestamp,))
-            connection.commit()
+    TABLE = "TeamPoints"
+    INSERT = "INSERT INTO TeamPoints (role_id, points, description, timestamp) VALUES (%s, %s, %s, %s)"
+
+    def to_row(self) -> tuple:
+        return (self.role_id, self.points, self.description, self.timestamp,)
 
-    def remove_from_database(self, connection: MySQLConnection) -> None:
+    def add_to_database(self, pool: StorageBackend) -> None:
+        with pool.cursor(writes=("TeamPoints",)) as cursor:
+            cursor.execute(TeamPoint.INSERT, self.to_row())
+
+    def remove_from_database(self, pool: StorageBackend) -> None:
         pass
 
     @staticmethod
-    def get_all(connection: MySQLConnection) -> list['TeamPoint']:
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT * FROM TeamPoints")
-            results = cursor.fetchall()
-
-            data = []
-            for result in results:
-                data.append(TeamPoint(result[1], result[2], result[3], result[4]))
+    def get_all(pool: StorageBackend) -> list['TeamPoint']:
+        data = []
+        for result in pool.fetchall_cached("SELECT * FROM TeamPoints", (), ("TeamPoints",)):
+            data.append(TeamPoint(result[1], result[2], result[3], result[4]))
 
-            return data
+        return data
@@ -1,13 +1,20 @@
-from typing import Optional
-from mysql.connector import MySQLConnection
+from typing import Callable, Iterable, Optional
+from bot.models.storage_backend import StorageBackend
 
 from bot.models.team import Team
 from bot.models.database_item import DatabaseItem
+from bot.models.identity_map import IdentityMap
 
 
 class User(DatabaseItem):
+    __slots__ = ("discord_id", "team_id", "_first_name", "_last_name", "_full_name", "_abb_name")
+
+    # Users that were recently loaded, keyed by discord ID
+    cache: IdentityMap['User'] = IdentityMap(ttl=300)
+
     def __init__(self, discord_id: int, first_name: str, last_name: str, team_id: Optional[int]):
-        """Creates a representation of a user
+        """Creates a representation of a user. The capitalized and combined names are only
+        built when they're first used.
 
         Args:
             discord_id (int): The discord ID of a user
@@ -18,98 +25,232 @@ class User(DatabaseItem):
         self.discord_id = discord_id
         self.team_id = team_id
 
+        self._first_name = first_name
+        self._last_name = last_name
+        self._full_name: Optional[str] = None
+        self._abb_name: Optional[str] = None
+
+    @property
+    def first_name(self) -> str:
+        """The first name of the user (capitalized)"""
         # Ensure first name is capitalized
-        if first_name[0].isupper():
-            self.first_name = first_name
-        else:
-            self.first_name = first_name.capitalize()
+        if self._first_name[0].isupper():
+            return self._first_name
+        return self._first_name.capitalize()
 
+    @property
+    def last_name(self) -> str:
+        """The last name of the user (capitalized)"""
         # Ensure last name is capitalized
-        if last_name[0].isupper():
-            self.last_name = last_name
-        else:
-            self.last_name = last_name.capitalize()
+        if self._last_name[0].isupper():
+            return self._last_name
+        return self._last_name.capitalize()
+
+    @property
+    def full_name(self) -> str:
+        """The first and last name of the user (e.g. "John Smith")"""
+        if self._full_name is None:
+            self._full_name = self._first_name + " " + self._last_name
+        return self._full_name
 
-        self.full_name = first_name + " " + last_name
-        self.abb_name = first_name + " " + last_name[0].upper() + "."
+    @property
+    def abb_name(self) -> str:
+        """The first name and last initial of the user (e.g. "John S.")"""
+        if self._abb_name is None:
+            self._abb_name = self._first_name + " " + self._last_name[0].upper() + "."
+        return self._abb_name
 
     @staticmethod
-    def from_id(connection: MySQLConnection, discord_id: int) -> Optional['User']:
-        """Returns a User (if found) based on a provided discord ID
+    def from_id(pool: StorageBackend, discord_id: int) -> Optional['User']:
+        """Returns a User (if found) based on a provided discord ID.
+        Users are served from User.cache when possible.
 
         Args:
-            connection (MySQLConnection): The connection to the MySQL database
+            pool (StorageBackend): The pool of connections to the database
             discord_id (int): The discord ID of a user
 
         Returns:
             Optional[User] - A representation of a user
         """
-        with connection.cursor() as cursor:
+        user = User.cache.get(discord_id)
+        if user is not None:
+            return user
+
+        with pool.cursor() as cursor:
             cursor.execute("SELECT * FROM Users WHERE discord_id = %s", (discord_id, ))
             result = cursor.fetchone()
 
-            if result is None:
+        if result is None:
+            return None
+
+        return User.cache.put(discord_id, User(result[0], result[1], result[2], result[3]))
+
+    @staticmethod
+    def from_ids(pool: StorageBackend, discord_ids: Iterable[int], chunk_size: int = 500) -> dict[int, 'User']:
+        """Returns every User (that can be found) from a collection of discord IDs.
+        Users in User.cache are reused, the rest are loaded with one IN (...) query
+        per chunk_size IDs instead of one query per user.
+
+        Args:
+            pool (StorageBackend): The pool of connections to the database
+            discord_ids (Iterable[int]): The discord IDs of the users
+            chunk_size (int): The maximum amount of IDs sent in a single query
+
+        Returns:
+            dict[int, User] - The users keyed by their discord ID (IDs that weren't found are left out)
+        """
+        users = {}
+        missing = []
+        for discord_id in set(discord_ids):
+            user = User.cache.get(discord_id)
+            if user is not None:
+                users[discord_id] = user
+            else:
+                missing.append(discord_id)
+
+        if len(missing) == 0:
+            return users
+
+        results = []
+        with pool.cursor() as cursor:
+            for i in range(0, len(missing), chunk_size):
+                chunk = missing[i:i + chunk_size]
+                placeholders = ", ".join(["%s"] * len(chunk))
+                cursor.execute(f"SELECT * FROM Users WHERE discord_id IN ({placeholders})", tuple(chunk))
+                results.extend(cursor.fetchall())
+
+        for result in results:
+            users[result[0]] = User.cache.put(result[0], User(result[0], result[1], result[2], result[3]))
+
+        return users
+
+    @staticmethod
+    def columns(alias: str) -> str:
+        """Returns the Users columns (in table order) prefixed by a table alias, so that a user
+        can be joined into another query and rebuilt with User.from_row.
+
+        Args:
+            alias (str): The alias of the Users table in the query (e.g. "t" for tech)
+
+        Returns:
+            str - The comma separated list of columns
+        """
+        return f"{alias}.discord_id, {alias}.first_name, {alias}.last_name, {alias}.team"
+
+    @staticmethod
+    def from_row(row: tuple, start: int, users: Optional[dict[int, 'User']] = None) -> Optional['User']:
+        """Creates a User from the columns of a joined row (selected with User.columns).
+
+        Args:
+            row (tuple): The row returned by the database
+            start (int): The index of the user's discord_id column in the row
+            users (Optional[dict[int, User]]): Users that were already created while reading
+                the same result, these are reused instead of creating duplicates
+
+        Returns:
+            Optional[User] - A representation of a user (None if the join found no user)
+        """
+        discord_id = row[start]
+        if discord_id is None:
+            return None
+
+        if users is not None and discord_id in users:
+            return users[discord_id]
+
+        user = User(discord_id, row[start + 1], row[start + 2], row[start + 3])
+        if users is not None:
+            users[discord_id] = user
+
+        return user
+
+    @staticmethod
+    def decoder(users: Optional[dict[int, 'User']] = None) -> Callable[[Optional[int], str, str, Optional[int]], Optional['User']]:
+        """Returns a function that creates Users from the columns of joined rows (selected with
+        User.columns), used by the decoders of the models that join in their users.
+
+        Args:
+            users (Optional[dict[int, User]]): Users that were already created while reading
+                the same result, these are reused instead of creating duplicates
+
+        Returns:
+            Callable[[Optional[int], str, str, Optional[int]], Optional[User]] - Creates a User from
+            its discord_id, first_name, last_name and team (None if the join found no user)
+        """
+        if users is None:
+            users = {}
+
+        def decode(discord_id: Optional[int], first_name: str, last_name: str, team_id: Optional[int]) -> Optional[User]:
+            if discord_id is None:
                 return None
 
-            return User(result[0], result[1], result[2], result[3])
+            found = users.get(discord_id)
+            if found is None:
+                found = users[discord_id] = User(discord_id, first_name, last_name, team_id)
+            return found
 
-    def add_team(self, connection: MySQLConnection, team: Team):
+        return decode
+
+    def add_team(self, pool: StorageBackend, team: Team):
         """Adds a team to a user's row in the Users table.
 
         Args:
-            connection (MySQLConnection): The connection to the MySQL database
+            pool (StorageBackend): The pool of connections to the database
             team (Team): The new team to add to the user
         """
-        with connection.cursor() as cursor:
+        with pool.cursor(writes=("Users",)) as cursor:
             sql = "UPDATE Users SET team=%s WHERE discord_id = %s"
 
             cursor.execute(sql, (team.role_id, self.discord_id,))
-            connection.commit()
 
-    def edit_name(self, connection: MySQLConnection, new_first: str, new_last: str):
+        User.cache.invalidate(self.discord_id)
+
+    def edit_name(self, pool: StorageBackend, new_first: str, new_last: str):
         """Edit a user's first and last name in the User's table. This is used
         if a user types the /join command after they've already joined.
 
         Args:
-            connection (MySQLConnection): The connection to the MySQL database
+            pool (StorageBackend): The pool of connections to the database
             new_first (str): The user's new first name
             new_last (str): The user's new last name
         """
-        with connection.cursor() as cursor:
+        with pool.cursor(writes=("Users",)) as cursor:
             sql = "UPDATE Users SET first_name=%s, last_name=%s WHERE discord_id = %s"
 
             cursor.execute(sql, (new_first, new_last, self.discord_id,))
-            connection.commit()
 
-    def add_to_database(self, connection: MySQLConnection) -> None:
-        with connection.cursor() as cursor:
+        User.cache.invalidate(self.discord_id)
+
+    def add_to_database(self, pool: StorageBackend) -> None:
+        with pool.cursor(writes=("Users",)) as cursor:
             sql = "INSERT INTO Users (discord_id, first_name, last_name, team) VALUES (%s, %s, %s, %s)"
 
             cursor.execute(sql, (self.discord_id, self.first_name, self.last_name, self.team_id))
-            connection.commit()
 
-    def remove_from_database(self, connection: MySQLConnection) -> None:
-        with connection.cursor() as cursor:
+        User.cache.invalidate(self.discord_id)
+
+    def remove_from_database(self, pool: StorageBackend) -> None:
+        with pool.cursor(writes=("Users",)) as cursor:
             sql = "DELETE FROM Users WHERE discord_id = %s"
             cursor.execute(sql, (self.discord_id,))
-            connection.commit()
+
+        User.cache.invalidate(self.discord_id)
 
     @staticmethod
-    def get_all(connection: MySQLConnection) -> list['User']:
-        """Gets all the users in the database
+    def get_all(pool: StorageBackend) -> list['User']:
+        """Gets all the users in the database (and refreshes User.cache with them)
 
         Args:
-            connection (MySQLConnection): The connection to the MySQL database
+            pool (StorageBackend): The pool of connections to the database
 
         Returns:
             list[User] - A list of users
         """
-        with connection.cursor() as cursor:
-            users = []
+        with pool.cursor() as cursor:
             cursor.execute("SELECT * FROM Users")
             results = cursor.fetchall()
 
-            for result in results:
-                users.append(User(result[0], result[1], result[2], result[3]))
+        users = []
+        for result in results:
+            users.append(User.cache.put(result[0], User(result[0], result[1], result[2], result[3])))
 
-            return users
+        return users
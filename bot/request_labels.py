@@ -0,0 +1,49 @@
+import discord
+import discord.ui as ui
+from discord import app_commands
+
+from bot.models.query_stats import current_label
+
+
+class LabeledCommandTree(app_commands.CommandTree):
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """Labels the queries of a slash command with its name (e.g. "/claim") in /dbstats.
+
+        Args:
+            interaction (discord.Interaction): The slash command interaction
+
+        Returns:
+            bool - Always True (every command is run)
+        """
+        command = interaction.command
+        current_label.set("/" + (command.qualified_name if command is not None else str(interaction.data.get("name"))))
+        return True
+
+
+class LabeledView(ui.View):
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """Labels the queries of a button or select with the view and its custom ID (e.g. "CheckView:ping") in /dbstats.
+
+        Args:
+            interaction (discord.Interaction): The component interaction
+
+        Returns:
+            bool - Always True (every interaction is handled)
+        """
+        custom_id = interaction.data.get("custom_id") if interaction.data is not None else None
+        current_label.set(f"{type(self).__name__}:{custom_id}")
+        return True
+
+
+class LabeledModal(ui.Modal):
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        """Labels the queries of a submitted form with its name (e.g. "PingForm") in /dbstats.
+
+        Args:
+            interaction (discord.Interaction): The modal submit interaction
+
+        Returns:
+            bool - Always True (every submission is handled)
+        """
+        current_label.set(type(self).__name__)
+        return True
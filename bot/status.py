@@ -1,4 +1,5 @@
 from enum import StrEnum
+from typing import Optional
 
 
 class Status(StrEnum):
@@ -9,15 +10,13 @@ class Status(StrEnum):
     DONE = "Done",
 
     @staticmethod
-    def from_str(s: str) -> 'Status':
-        match (s.lower()):
-            case "checked":
-                return Status.CHECKED
-            case "pinged":
-                return Status.PINGED
-            case "resolved":
-                return Status.RESOLVED
-            case "kudos":
-                return Status.KUDOS
-            case "done":
-                return Status.DONE
+    def from_str(s: str) -> Optional['Status']:
+        # Runs for every claim that's read, so the stored spelling is looked up directly
+        status = _STATUSES.get(s)
+        if status is None:
+            status = _STATUSES.get(s.lower())
+        return status
+
+
+# Every status by its stored value and its lower case spelling (see Status.from_str)
+_STATUSES: dict[str, Status] = {spelling: status for status in Status for spelling in (status.value, status.value.lower())}
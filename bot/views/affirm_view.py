@@ -3,6 +3,7 @@ import discord.ui as ui
 
 from bot.models.checked_claim import CheckedClaim
 from bot.forms.affirm_form import AffirmForm
+from bot.request_labels import LabeledView
 
 # Use TYPE_CHECKING to avoid circular import from bot
 from typing import TYPE_CHECKING
@@ -11,7 +12,7 @@ if TYPE_CHECKING:
     from ..bot import Bot
 
 
-class AffirmView(ui.View):
+class AffirmView(LabeledView):
     def __init__(self, bot: "Bot"):
         """Creates a view for when a case is pinged and a
         message is sent to a private thread
@@ -31,7 +32,7 @@ class AffirmView(ui.View):
             interaction (discord.Interaction): The interaction this button press originated from.
             button (discord.ui.Button): Unused argument that's required to be passed in.
         """
-        case = CheckedClaim.from_ping_thread_id(self.bot.connection, interaction.channel_id)
+        case = await self.bot.db.run(CheckedClaim.from_ping_thread_id, interaction.channel_id)
         if case is None:
             await interaction.response.send_message(content="Error!", ephemeral=True, delete_after=180)
             return
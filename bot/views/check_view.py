@@ -4,14 +4,13 @@ import discord.ui as ui
 from bot.views.check_view_red import CheckViewRed
 
 from bot.status import Status
-from datetime import datetime
 
 from bot.models.completed_claim import CompletedClaim
-from bot.models.checked_claim import CheckedClaim
 from bot.models.user import User
 
 from bot.forms.ping_form import PingForm
 from bot.forms.kudos_form import KudosForm
+from bot.request_labels import LabeledView
 
 # Use TYPE_CHECKING to avoid circular import from bot
 from typing import TYPE_CHECKING
@@ -20,7 +19,7 @@ if TYPE_CHECKING:
     from ..bot import Bot
 
 
-class CheckView(ui.View):
+class CheckView(LabeledView):
     def __init__(self, bot: "Bot"):
         """Creates a lead view in the lead case claim channel for submitting
         feedback on a completed case submitted by a tech.
@@ -40,13 +39,17 @@ class CheckView(ui.View):
             button (discord.ui.Button): Unused argument that's required to be passed in.
         """
         # Check to see if user is in the list
-        u = User.from_id(self.bot.connection, interaction.user.id)
+        u = await self.bot.db.run(User.from_id, interaction.user.id)
         if u is None:
             msg = f"Please use the **/join** command before using this command."
             await interaction.response.send_message(content=msg, ephemeral=True, delete_after=300)
             return
 
-        case = CompletedClaim.from_id(self.bot.connection, interaction.message.id)
+        case = await self.bot.db.run(CompletedClaim.from_id, interaction.message.id)
+        if case is None:
+            msg = f"This case has already been checked."
+            await interaction.response.send_message(content=msg, ephemeral=True, delete_after=300)
+            return
 
         # Prompt with Modal, record the response, create a private thread, then delete
         form = KudosForm(self.bot, case)
@@ -67,14 +70,18 @@ class CheckView(ui.View):
             button (discord.ui.Button): Unused argument that's required to be passed in.
         """
         # Check to see if user is in the list
-        u = User.from_id(self.bot.connection, interaction.user.id)
+        u = await self.bot.db.run(User.from_id, interaction.user.id)
         if u is None:
             msg = f"Please use the **/join** command before using this command."
             await interaction.response.send_message(content=msg, ephemeral=True, delete_after=300)
             return
 
-        case = CompletedClaim.from_id(self.bot.connection, interaction.message.id)
-        
+        case = await self.bot.db.run(CompletedClaim.from_id, interaction.message.id)
+        if case is None:
+            msg = f"This case has already been checked."
+            await interaction.response.send_message(content=msg, ephemeral=True, delete_after=300)
+            return
+
         form = CommentForm(self.bot, case)
         await interaction.response.send_modal(form)
 
@@ -87,19 +94,18 @@ class CheckView(ui.View):
             button (discord.ui.Button): Unused argument that's required to be passed in.
         """
         # Check to see if user is in the list
-        u = User.from_id(self.bot.connection, interaction.user.id)
+        u = await self.bot.db.run(User.from_id, interaction.user.id)
         if u is None:
             msg = f"Please use the **/join** command before using this command."
             await interaction.response.send_message(content=msg, ephemeral=True, delete_after=300)
             return
 
-        case = CompletedClaim.from_id(self.bot.connection, interaction.message.id)
-        case.remove_from_database(self.bot.connection)
-
-        new_case = CheckedClaim(case.checker_message_id, case.case_num, case.tech,
-                                User.from_id(self.bot.connection, interaction.user.id), case.claim_time,
-                                case.complete_time, datetime.now(), Status.DONE, None)
-        new_case.add_to_database(self.bot.connection)
+        case = await self.bot.db.run(CompletedClaim.from_id, interaction.message.id)
+        # Another lead might have checked the case first
+        if case is None or await self.bot.db.run(case.promote, u, Status.DONE) is None:
+            msg = f"This case has already been checked."
+            await interaction.response.send_message(content=msg, ephemeral=True, delete_after=300)
+            return
 
         await interaction.message.delete()
 
@@ -113,13 +119,17 @@ class CheckView(ui.View):
             button (discord.ui.Button): Unused argument that's required to be passed in.
         """
         # Check to see if user is in the list
-        u = User.from_id(self.bot.connection, interaction.user.id)
+        u = await self.bot.db.run(User.from_id, interaction.user.id)
         if u is None:
             msg = f"Please use the **/join** command before using this command."
             await interaction.response.send_message(content=msg, ephemeral=True, delete_after=300)
             return
 
-        case = CompletedClaim.from_id(self.bot.connection, interaction.message.id)
+        case = await self.bot.db.run(CompletedClaim.from_id, interaction.message.id)
+        if case is None:
+            msg = f"This case has already been checked."
+            await interaction.response.send_message(content=msg, ephemeral=True, delete_after=300)
+            return
 
         # Prompt with Modal, record the response, create a private thread, then delete
         form = PingForm(self.bot, case)
@@ -2,14 +2,13 @@ import discord
 import discord.ui as ui
 
 from bot.status import Status
-from datetime import datetime
 
 from bot.models.completed_claim import CompletedClaim
-from bot.models.checked_claim import CheckedClaim
 from bot.models.user import User
 
 from bot.forms.ping_form import PingForm
 from bot.forms.kudos_form import KudosForm
+from bot.request_labels import LabeledView
 
 # Use TYPE_CHECKING to avoid circular import from bot
 from typing import TYPE_CHECKING
@@ -18,7 +17,7 @@ if TYPE_CHECKING:
     from ..bot import Bot
 
 
-class CheckViewRed(ui.View):
+class CheckViewRed(LabeledView):
     def __init__(self, bot: "Bot"):
         """Creates a lead view in the lead case claim channel for submitting
         feedback on a completed case submitted by a tech.
@@ -38,13 +37,17 @@ class CheckViewRed(ui.View):
            button (discord.ui.Button): Unused argument that's required to be passed in.
        """
         # Check to see if user is in the list
-        u = User.from_id(self.bot.connection, interaction.user.id)
+        u = await self.bot.db.run(User.from_id, interaction.user.id)
         if u is None:
             msg = f"Please use the **/join** command before using this command."
             await interaction.response.send_message(content=msg, ephemeral=True, delete_after=300)
             return
 
-        case = CompletedClaim.from_id(self.bot.connection, interaction.message.id)
+        case = await self.bot.db.run(CompletedClaim.from_id, interaction.message.id)
+        if case is None:
+            msg = f"This case has already been checked."
+            await interaction.response.send_message(content=msg, ephemeral=True, delete_after=300)
+            return
 
         # Prompt with Modal, record the response, create a private thread, then delete
         form = KudosForm(self.bot, case)
@@ -59,19 +62,18 @@ class CheckViewRed(ui.View):
             button (discord.ui.Button): Unused argument that's required to be passed in.
         """
         # Check to see if user is in the list
-        u = User.from_id(self.bot.connection, interaction.user.id)
+        u = await self.bot.db.run(User.from_id, interaction.user.id)
         if u is None:
             msg = f"Please use the **/join** command before using this command."
             await interaction.response.send_message(content=msg, ephemeral=True, delete_after=300)
             return
 
-        case = CompletedClaim.from_id(self.bot.connection, interaction.message.id)
-        case.remove_from_database(self.bot.connection)
-
-        new_case = CheckedClaim(case.checker_message_id, case.case_num, case.tech,
-                                User.from_id(self.bot.connection, interaction.user.id), case.claim_time,
-                                case.complete_time, datetime.now(), Status.CHECKED, None)
-        new_case.add_to_database(self.bot.connection)
+        case = await self.bot.db.run(CompletedClaim.from_id, interaction.message.id)
+        # Another lead might have checked the case first
+        if case is None or await self.bot.db.run(case.promote, u, Status.CHECKED) is None:
+            msg = f"This case has already been checked."
+            await interaction.response.send_message(content=msg, ephemeral=True, delete_after=300)
+            return
 
         await interaction.message.delete()
 
@@ -84,19 +86,18 @@ class CheckViewRed(ui.View):
             button (discord.ui.Button): Unused argument that's required to be passed in.
         """
         # Check to see if user is in the list
-        u = User.from_id(self.bot.connection, interaction.user.id)
+        u = await self.bot.db.run(User.from_id, interaction.user.id)
         if u is None:
             msg = f"Please use the **/join** command before using this command."
             await interaction.response.send_message(content=msg, ephemeral=True, delete_after=300)
             return
 
-        case = CompletedClaim.from_id(self.bot.connection, interaction.message.id)
-        case.remove_from_database(self.bot.connection)
-
-        new_case = CheckedClaim(case.checker_message_id, case.case_num, case.tech,
-                                User.from_id(self.bot.connection, interaction.user.id), case.claim_time,
-                                case.complete_time, datetime.now(), Status.DONE, None)
-        new_case.add_to_database(self.bot.connection)
+        case = await self.bot.db.run(CompletedClaim.from_id, interaction.message.id)
+        # Another lead might have checked the case first
+        if case is None or await self.bot.db.run(case.promote, u, Status.DONE) is None:
+            msg = f"This case has already been checked."
+            await interaction.response.send_message(content=msg, ephemeral=True, delete_after=300)
+            return
 
         await interaction.message.delete()
 
@@ -110,13 +111,17 @@ class CheckViewRed(ui.View):
             button (discord.ui.Button): Unused argument that's required to be passed in.
         """
         # Check to see if user is in the list
-        u = User.from_id(self.bot.connection, interaction.user.id)
+        u = await self.bot.db.run(User.from_id, interaction.user.id)
         if u is None:
             msg = f"Please use the **/join** command before using this command."
             await interaction.response.send_message(content=msg, ephemeral=True, delete_after=300)
             return
 
-        case = CompletedClaim.from_id(self.bot.connection, interaction.message.id)
+        case = await self.bot.db.run(CompletedClaim.from_id, interaction.message.id)
+        if case is None:
+            msg = f"This case has already been checked."
+            await interaction.response.send_message(content=msg, ephemeral=True, delete_after=300)
+            return
 
         # Prompt with Modal, record the response, create a private thread, then delete
         form = PingForm(self.bot, case)
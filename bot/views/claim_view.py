@@ -8,6 +8,7 @@ from bot.views.force_unclaim_view import ForceUnclaimView
 
 from bot.models.active_claim import ActiveClaim
 from bot.models.completed_claim import CompletedClaim
+from bot.request_labels import LabeledView
 
 # Use TYPE_CHECKING to avoid circular import from bot
 from typing import TYPE_CHECKING
@@ -16,7 +17,7 @@ if TYPE_CHECKING:
     from ..bot import Bot
 
 
-class ClaimView(ui.View):
+class ClaimView(LabeledView):
     def __init__(self, bot: "Bot"):
         """Creates the case claim embed with the Complete and Unclaim buttons. Also sends a
         embed to the lead claims channel with a LeadView embed.
@@ -35,7 +36,7 @@ class ClaimView(ui.View):
             interaction (discord.Interaction): The interaction this button press originated from.
             button (discord.ui.Button): Unused argument that's required to be passed in.
         """
-        case = ActiveClaim.from_id(self.bot.connection, interaction.message.id)
+        case = await self.bot.db.run(ActiveClaim.from_id, interaction.message.id)
 
         if case is None:
             await interaction.response.send_message("Error claiming this case, please try again.", ephemeral=True, delete_after=10)
@@ -43,7 +44,7 @@ class ClaimView(ui.View):
 
         if case.tech.discord_id == interaction.user.id:
             # Case completed by the tech
-            case.remove_from_database(self.bot.connection)
+            await self.bot.db.run(case.remove_from_database)
             await interaction.message.delete()
 
             completed_embed = discord.Embed(description=f"This case has been marked as complete! To view the cases you have worked on, use the **/mycases** command.",
@@ -64,7 +65,7 @@ class ClaimView(ui.View):
 
             # Add case to CompletedClaims
             completed_claim = CompletedClaim(msg.id, case.case_num, case.tech, case.claim_time, datetime.now())
-            completed_claim.add_to_database(self.bot.connection)
+            await self.bot.db.run(completed_claim.add_to_database)
         elif self.bot.check_if_lead(interaction.user):
             # Lead force completes a case
             await interaction.response.send_message(content=f"**{case.case_num}** Are you sure you'd like to force complete this case?", view=ForceCompleteView(self.bot), ephemeral=True, delete_after=10)
@@ -81,10 +82,10 @@ class ClaimView(ui.View):
             interaction (discord.Interaction): The interaction this button press originated from.
             button (discord.ui.Button): Unused argument that's required to be passed in.
         """
-        case = ActiveClaim.from_id(self.bot.connection, interaction.message.id)
+        case = await self.bot.db.run(ActiveClaim.from_id, interaction.message.id)
 
         if case.tech.discord_id == interaction.user.id:
-            case.remove_from_database(self.bot.connection)
+            await self.bot.db.run(case.remove_from_database)
             await interaction.message.delete()
         elif self.bot.check_if_lead(interaction.user):
             # Lead force completes a case
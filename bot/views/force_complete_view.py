@@ -6,6 +6,7 @@ from bot.views.check_view import CheckView
 
 from bot.models.active_claim import ActiveClaim
 from bot.models.completed_claim import CompletedClaim
+from bot.request_labels import LabeledView
 
 # Use TYPE_CHECKING to avoid circular import from bot
 from typing import TYPE_CHECKING
@@ -14,7 +15,7 @@ if TYPE_CHECKING:
     from ..bot import Bot
 
 
-class ForceCompleteView(ui.View):
+class ForceCompleteView(LabeledView):
     def __init__(self, bot: "Bot"):
         """Allows a lead to confirm if they would like to force complete a case.
 
@@ -35,7 +36,7 @@ class ForceCompleteView(ui.View):
             button (discord.ui.Button): Unused argument that's required to be passed in.
         """
         case_num = interaction.message.content.split(" ")[0].replace("*", "")
-        case = ActiveClaim.from_case_num(self.bot.connection, case_num)
+        case = await self.bot.db.run(ActiveClaim.from_case_num, case_num)
 
         if case is None:
             # Case not found
@@ -54,7 +55,7 @@ class ForceCompleteView(ui.View):
             user = await channel.guild.fetch_member(case.tech.discord_id)
 
             # Complete the claim as normal
-            case.remove_from_database(self.bot.connection)
+            await self.bot.db.run(case.remove_from_database)
 
             # Send a message in the claims channel and add the lead view to it.
             channel = interaction.user.guild.get_channel(self.bot.claims_channel)  # claims channel
@@ -67,7 +68,7 @@ class ForceCompleteView(ui.View):
 
             # Add case to CompletedClaims
             completed_claim = CompletedClaim(msg.id, case.case_num, case.tech, case.claim_time, datetime.now())
-            completed_claim.add_to_database(self.bot.connection)
+            await self.bot.db.run(completed_claim.add_to_database)
 
             # Delete ephemeral message
             await interaction.delete_original_response()
@@ -2,6 +2,7 @@ import discord
 import discord.ui as ui
 
 from bot.models.active_claim import ActiveClaim
+from bot.request_labels import LabeledView
 
 # Use TYPE_CHECKING to avoid circular import from bot
 from typing import TYPE_CHECKING
@@ -10,7 +11,7 @@ if TYPE_CHECKING:
     from ..bot import Bot
 
 
-class ForceUnclaimView(ui.View):
+class ForceUnclaimView(LabeledView):
     def __init__(self, bot: "Bot"):
         """Allows a lead to force unclaim a case.
 
@@ -30,7 +31,7 @@ class ForceUnclaimView(ui.View):
             button (discord.ui.Button): Unused argument that's required to be passed in.
         """
         case_num = interaction.message.content.split(" ")[0].replace("*", "")
-        case = ActiveClaim.from_case_num(self.bot.connection, case_num)
+        case = await self.bot.db.run(ActiveClaim.from_case_num, case_num)
 
         if case is None:
             # Case can't be found
@@ -47,7 +48,7 @@ class ForceUnclaimView(ui.View):
             await msg.delete()
 
             # Delete the case from database
-            case.remove_from_database(self.bot.connection)
+            await self.bot.db.run(case.remove_from_database)
 
             # Delete ephemeral message
             await interaction.delete_original_response()
@@ -1,5 +1,6 @@
 import discord
 import discord.ui as ui
+from bot.request_labels import LabeledView
 
 # Use TYPE_CHECKING to avoid circular import from bot
 from typing import TYPE_CHECKING
@@ -8,7 +9,7 @@ if TYPE_CHECKING:
     from ..bot import Bot
 
 
-class KudosView(ui.View):
+class KudosView(LabeledView):
     def __init__(self, bot: "Bot"):
         """Creates a view with a "Thanks!" button for a tech to press
         to acknowledge a Kudos message and delete the thread.
@@ -3,9 +3,9 @@ import discord.ui as ui
 from bot.helpers.leaderboard_helpers import LeaderboardResults
 from bot.helpers.other import *
 
-from bot.models.checked_claim import CheckedClaim
 from bot.models.user import User
 from bot.models.team_point import TeamPoint
+from bot.request_labels import LabeledView
 
 # Use TYPE_CHECKING to avoid circular import from bot
 from typing import TYPE_CHECKING
@@ -16,7 +16,7 @@ if TYPE_CHECKING:
     from ..bot import Bot
 
 
-class LeaderboardView(ui.View):
+class LeaderboardView(LabeledView):
     def __init__(self, bot: "Bot"):
         """Creates a leaderboard view for the /leaderboard command
         to allow users to refresh it.
@@ -38,10 +38,10 @@ class LeaderboardView(ui.View):
         await interaction.response.defer(thinking=False)  # Acknowledge button press
 
         result = LeaderboardResults(
-            CheckedClaim.get_all_leaderboard(self.bot.connection, interaction.created_at.year),
-            TeamPoint.get_all(self.bot.connection),
+            await self.bot.db.run_analytics(LeaderboardResults.count, interaction.created_at),
+            await self.bot.db.run(TeamPoint.get_all),
             interaction.created_at,
-            User.from_id(self.bot.connection, interaction.user.id)
+            await self.bot.db.run(User.from_id, interaction.user.id)
         )
         new_embed = result.create_embed(self.bot, interaction)
 
@@ -71,15 +71,23 @@ class LeaderboardView(ui.View):
         embed.set_footer(text="Last Updated")
         embed.timestamp = interaction.created_at
 
-        user = User.from_id(self.bot.connection, interaction.user.id)
+        user = await self.bot.db.run(User.from_id, interaction.user.id)
 
         result = LeaderboardResults(
-            CheckedClaim.get_all_leaderboard(self.bot.connection, interaction.created_at.year),
-            TeamPoint.get_all(self.bot.connection),
+            await self.bot.db.run_analytics(LeaderboardResults.count, interaction.created_at),
+            await self.bot.db.run(TeamPoint.get_all),
             interaction.created_at,
             user
         )
 
+        # Load the users one rank above in the month and semester at once
+        next_rank_ids = []
+        for ordered in (result.ordered_month, result.ordered_semester):
+            ranked_ids = list(ordered.keys())
+            if interaction.user.id in ranked_ids and ranked_ids.index(interaction.user.id) > 0:
+                next_rank_ids.append(ranked_ids[ranked_ids.index(interaction.user.id) - 1])
+        next_rank_users = await self.bot.db.run(User.from_ids, next_rank_ids)
+
         # Organize month data
         try:
             month_count = int(result.month_counts[user.discord_id])
@@ -94,7 +102,7 @@ class LeaderboardView(ui.View):
                 month_next_rank_case_gap = "N/A"
             else:
                 month_next_rank_id = list(result.ordered_month.keys())[month_rank-2]
-                month_next_rank_user = User.from_id(self.bot.connection, month_next_rank_id)
+                month_next_rank_user = next_rank_users[month_next_rank_id]
                 month_next_rank_name = month_next_rank_user.full_name
                 month_next_rank_cases = int(result.month_counts[month_next_rank_user.discord_id])
                 month_next_rank_case_gap = month_next_rank_cases-month_count
@@ -117,7 +125,7 @@ class LeaderboardView(ui.View):
                 semester_next_rank_case_gap = "N/A"
             else:
                 semester_next_rank_id = list(result.ordered_semester.keys())[semester_rank-2]
-                semester_next_rank_user = User.from_id(self.bot.connection, semester_next_rank_id)
+                semester_next_rank_user = next_rank_users[semester_next_rank_id]
                 semester_next_rank_name = semester_next_rank_user.full_name
                 semester_next_rank_cases = int(result.semester_counts[semester_next_rank_user.discord_id])
                 semester_next_rank_case_gap = semester_next_rank_cases - semester_count
@@ -2,7 +2,7 @@ import discord
 import discord.ui as ui
 
 from bot.helpers.leaderboard_helpers import LeadstatsResults
-from bot.models.checked_claim import CheckedClaim
+from bot.request_labels import LabeledView
 
 # Use TYPE_CHECKING to avoid circular import from bot
 from typing import TYPE_CHECKING
@@ -13,7 +13,7 @@ if TYPE_CHECKING:
     from ..bot import Bot
 
 
-class LeadStatsView(ui.View):
+class LeadStatsView(LabeledView):
     def __init__(self, bot: "Bot"):
         """Creates a leaderboard view for the /leadstats command
         to allow users to refresh it.
@@ -34,8 +34,8 @@ class LeadStatsView(ui.View):
         """
         await interaction.response.defer(thinking=False)  # Acknowledge button press
 
-        result = LeadstatsResults(CheckedClaim.search(self.bot.connection), interaction.created_at)
-        new_embed, file = result.create_embed(self.bot, interaction, True)
+        result = await self.bot.db.run_analytics(LeadstatsResults.load, interaction.created_at)
+        new_embed, file = await result.create_embed(self.bot, interaction, True)
 
         message = interaction.message
         if message is not None:
@@ -51,8 +51,8 @@ class LeadStatsView(ui.View):
         """
         await interaction.response.defer(thinking=False)  # Acknowledge button press
 
-        result = LeadstatsResults(CheckedClaim.search(self.bot.connection), interaction.created_at)
-        new_embed, file = result.create_embed(self.bot, interaction, month=False)
+        result = await self.bot.db.run_analytics(LeadstatsResults.load, interaction.created_at)
+        new_embed, file = await result.create_embed(self.bot, interaction, month=False)
 
         message = interaction.message
         if message is not None:
@@ -3,6 +3,7 @@ import discord.ui as ui
 
 from bot.forms.edit_outage_form import EditOutageForm
 from bot.models.outage import Outage
+from bot.request_labels import LabeledView
 
 # Use TYPE_CHECKING to avoid circular import from bot
 from typing import TYPE_CHECKING
@@ -11,7 +12,7 @@ if TYPE_CHECKING:
     from ..bot import Bot
 
 
-class OutageView(ui.View):
+class OutageView(LabeledView):
     def __init__(self, bot: "Bot"):
         super().__init__(timeout=None)
         self.bot = bot
@@ -26,7 +27,7 @@ class OutageView(ui.View):
             button (discord.ui.Button): Unused argument that's required to be passed in.
         """
         if self.bot.check_if_lead(interaction.user):
-            outage = Outage.from_message_id(self.bot.connection, interaction.message.id)
+            outage = await self.bot.db.run(Outage.from_message_id, interaction.message.id)
 
             edit_modal = EditOutageForm(self.bot, outage)
             await interaction.response.send_modal(edit_modal)
@@ -40,8 +41,8 @@ class OutageView(ui.View):
             button (discord.ui.Button): Unused argument that's required to be passed in.
         """
         if self.bot.check_if_lead(interaction.user):
-            outage = Outage.from_message_id(self.bot.connection, interaction.message.id)
-            outage.deactivate(self.bot.connection)
+            outage = await self.bot.db.run(Outage.from_message_id, interaction.message.id)
+            await self.bot.db.run(outage.deactivate)
 
             announcement_message: discord.Message = await interaction.channel.fetch_message(outage.message_id)
             announcement_embed = announcement_message.embeds[0]
@@ -5,6 +5,7 @@ from bot.models.checked_claim import CheckedClaim
 from bot.models.feedback import Feedback
 
 from bot.status import Status
+from bot.request_labels import LabeledView
 
 # Use TYPE_CHECKING to avoid circular import from bot
 from typing import TYPE_CHECKING
@@ -13,7 +14,7 @@ if TYPE_CHECKING:
     from ..bot import Bot
 
 
-class ResolvePingView(ui.View):
+class ResolvePingView(LabeledView):
     def __init__(self, bot: "Bot"):
         """Creates a leaderboard view for the /leaderboard command
         to allow users to refresh it.
@@ -34,7 +35,7 @@ class ResolvePingView(ui.View):
             interaction (discord.Interaction): The interaction this button press originated from.
             button (discord.ui.Button): Unused argument that's required to be passed in.
         """
-        case = CheckedClaim.from_ping_thread_id(self.bot.connection, interaction.channel_id)
+        case = await self.bot.db.run(CheckedClaim.from_ping_thread_id, interaction.channel_id)
 
         if case.lead.discord_id != interaction.user.id:
             await interaction.response.send_message(content="You cannot press this button.", ephemeral=True, delete_after=10)
@@ -48,7 +49,7 @@ class ResolvePingView(ui.View):
         except:
             pass
 
-        case.change_status(self.bot.connection, Status.RESOLVED)
+        await self.bot.db.run(case.change_status, Status.RESOLVED)
 
         await interaction.response.defer(thinking=False)  # Acknowledge button press
 
@@ -62,8 +63,8 @@ class ResolvePingView(ui.View):
             interaction (discord.Interaction): The interaction this button press originated from.
             button (discord.ui.Button): Unused argument that's required to be passed in.
         """
-        case = CheckedClaim.from_ping_thread_id(self.bot.connection, interaction.channel_id)
-        ping = Feedback.from_thread_id(self.bot.connection, interaction.channel_id)
+        case = await self.bot.db.run(CheckedClaim.from_ping_thread_id, interaction.channel_id)
+        ping = await self.bot.db.run(Feedback.from_thread_id, interaction.channel_id)
 
         if case is None:
             await interaction.response.send_message(content="Error!", ephemeral=True, delete_after=180)
@@ -82,8 +83,8 @@ class ResolvePingView(ui.View):
             pass
 
         # Change Log file
-        case.change_status(self.bot.connection, Status.CHECKED)
-        ping.remove_from_database(self.bot.connection)
+        await self.bot.db.run(case.change_status, Status.CHECKED)
+        await self.bot.db.run(ping.remove_from_database)
 
         await interaction.response.defer(thinking=False)  # Acknowledge button press
 
@@ -96,7 +97,7 @@ class ResolvePingView(ui.View):
             interaction (discord.Interaction): The interaction this button press originated from.
             button (discord.ui.Button): Unused argument that's required to be passed in.
         """
-        case = CheckedClaim.from_ping_thread_id(self.bot.connection, interaction.channel_id)
+        case = await self.bot.db.run(CheckedClaim.from_ping_thread_id, interaction.channel_id)
         if case.lead.discord_id != interaction.user.id:
             await interaction.response.send_message(content="You cannot press this button.", ephemeral=True, delete_after=180)
             return
@@ -1,9 +1,13 @@
 import json
 import logging
-import mysql.connector
+import sqlite3
 from mysql.connector import Error
 
 from bot.bot import Bot
+from bot.models.connection_pool import ConnectionPool
+from bot.models.daily_claim_stats import DailyClaimStats
+from bot.models.migration_runner import MigrationRunner
+from bot.models.sqlite_backend import SQLiteBackend
 
 
 def main():
@@ -60,26 +64,67 @@ def main():
     except Exception:
         raise ValueError("Please add the required config information into config.json")
 
-    db_config = {
-        'user': config_data["db_user"],
-        'password': config_data["db_password"],
-        'host': config_data["db_host"],
-        'database': config_data["db_name"],
-        'raise_on_warnings': True
-    }
+    # Small desks can keep everything in a SQLite file instead of running a MySQL server
+    use_sqlite = config_data.get("db_backend", "mysql") == "sqlite"
+    if use_sqlite:
+        pool = SQLiteBackend(config_data.get("db_path", "caseclaim.db"), size=int(config_data.get("db_pool_size", 5)))
+    else:
+        db_config = {
+            'user': config_data["db_user"],
+            'password': config_data["db_password"],
+            'host': config_data["db_host"],
+            'database': config_data["db_name"],
+            'raise_on_warnings': True
+        }
+
+        # Connections are opened lazily, check one out to make sure the database is reachable
+        pool = ConnectionPool(db_config, size=int(config_data.get("db_pool_size", 5)))
 
-    connection = None
     try:
-        connection = mysql.connector.connect(**db_config)
-        print("MySQL Database connection successful")
-    except Error as err:
+        pool.ping()
+        print(f"{'SQLite' if use_sqlite else 'MySQL'} Database connection successful")
+
+        # Bring the schema of an existing database up to date
+        migrations = MigrationRunner(pool).apply()
+        for migration in migrations:
+            print(f"Applied migration {migration}")
+
+        # Backfill the rollup with the claims that were checked before it existed
+        if "0002_daily_claim_stats" in migrations:
+            print(f"Rebuilt DailyClaimStats ({DailyClaimStats.rebuild(pool)} rows)")
+    except (Error, sqlite3.Error) as err:
         print(f"Error: '{err}'")
 
+    # Analytics queries are sent to a read replica if there is one (and to the primary otherwise)
+    replica = None
+    if not use_sqlite and config_data.get("db_replica_host"):
+        replica_config = dict(db_config)
+        replica_config.update({
+            'user': config_data.get("db_replica_user", db_config["user"]),
+            'password': config_data.get("db_replica_password", db_config["password"]),
+            'host': config_data["db_replica_host"],
+            'database': config_data.get("db_replica_name", db_config["database"])
+        })
+
+        # Replica reads may lag behind the primary, so they don't fill the shared query cache
+        replica = ConnectionPool(replica_config, size=int(config_data.get("db_replica_pool_size", 3)), fill_cache=False)
+        try:
+            replica.ping()
+            print("MySQL replica connection successful")
+        except Error as err:
+            print(f"Error: '{err}', analytics will use the primary database")
+            replica = None
+
     # Create bot and run
-    bot = Bot(config_data, connection)
+    bot = Bot(config_data, pool, replica)
 
     logging.basicConfig(filename='discord.log', filemode='w', level=logging.INFO, format='%(asctime)s:%(levelname)s:%(message)s')
 
+    # Statements slower than slow_query_ms are also kept in their own file (see QueryStats)
+    slow_query_handler = logging.FileHandler('slow_queries.log')
+    slow_query_handler.setFormatter(logging.Formatter('%(asctime)s:%(message)s'))
+    logging.getLogger('slow_queries').addHandler(slow_query_handler)
+
     bot.run(token)
 
 
@@ -0,0 +1,19 @@
+-- Secondary indexes for the columns that /claim, /caseinfo, /mycases, /report,
+-- the leaderboards and the ping views filter on. The foreign keys on tech_id,
+-- lead_id and ping_thread_id already have single column indexes.
+
+-- /caseinfo, /claim (previous claims of a case) and CheckedClaim.find_latest_case
+CREATE INDEX `checkedclaims_case_num_tech_id_status_index`
+    ON `CheckedClaims`(`case_num`, `tech_id`, `status`);
+
+-- /mycases and /report filtered by user and month
+CREATE INDEX `checkedclaims_tech_id_claim_time_index`
+    ON `CheckedClaims`(`tech_id`, `claim_time`);
+
+-- Month/semester/year ranges for the leaderboards, /report, /leadstats and /casedist
+CREATE INDEX `checkedclaims_claim_time_status_index`
+    ON `CheckedClaims`(`claim_time`, `status`);
+
+-- /caseinfo and /claim (previous claims of a case)
+CREATE INDEX `completedclaims_case_num_tech_id_index`
+    ON `CompletedClaims`(`case_num`, `tech_id`);
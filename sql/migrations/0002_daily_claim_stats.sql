@@ -0,0 +1,18 @@
+-- Rollup of CheckedClaims used by the leaderboards, /leadstats, /evaldata and /heatmap
+-- (see bot/models/daily_claim_stats.py). It's kept up to date in the same transaction
+-- as every change to CheckedClaims and filled in by DailyClaimStats.rebuild.
+--
+-- `day` is midnight of the claim date, except on the day a semester starts in the
+-- middle of (Aug 25 3:00 PM) where later claims start a second bucket, so that
+-- month and semester ranges never split a bucket.
+CREATE TABLE `DailyClaimStats`(
+    `day` DATETIME NOT NULL,
+    `tech_id` BIGINT UNSIGNED NOT NULL,
+    `lead_id` BIGINT UNSIGNED NOT NULL,
+    `status` VARCHAR(255) NOT NULL,
+    `claims` INT NOT NULL DEFAULT 0,
+    `completion_seconds` BIGINT NOT NULL DEFAULT 0,
+    `check_seconds` BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY(`day`, `tech_id`, `lead_id`, `status`)
+);
+
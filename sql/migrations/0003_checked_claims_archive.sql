@@ -0,0 +1,10 @@
+-- Claims from closed semesters are moved out of CheckedClaims into CheckedClaimsArchive
+-- (see CheckedClaim.archive) so that the interactive queries only search the current
+-- semester. LIKE copies the columns and indexes, but not the foreign keys.
+CREATE TABLE `CheckedClaimsArchive` LIKE `CheckedClaims`;
+
+-- Historical reports read the current and archived claims together
+CREATE VIEW `AllCheckedClaims` AS
+    SELECT * FROM `CheckedClaims`
+    UNION ALL
+    SELECT * FROM `CheckedClaimsArchive`;
@@ -0,0 +1,5 @@
+-- Loads the claims of the last 15 minutes for the re-claim warning of /claim when the bot
+-- starts (see CompletedClaim.get_claimed_since). CheckedClaims is already covered by
+-- checkedclaims_claim_time_status_index.
+CREATE INDEX `completedclaims_claim_time_index`
+    ON `CompletedClaims`(`claim_time`);
@@ -0,0 +1,4 @@
+-- /claim inserts its ActiveClaim before the claim message is sent (see ActiveClaim.reserve),
+-- with the interaction ID as a placeholder claim_message_id. Reserved rows are marked so
+-- that the ones whose message was never attached can be removed when the bot starts.
+ALTER TABLE `ActiveClaims` ADD COLUMN `reserved` BOOLEAN NOT NULL DEFAULT 0;